@@ -2,23 +2,108 @@
 JuniorLeague - Fantasy Baseball Auction & Roster Calculator
 Main Flask application
 """
-from flask import Flask, render_template, request, jsonify, redirect, url_for
-from models import db, Team, Player, Contract, HistoricalAuction, ProjectedStats, AuctionBid
+from flask import Flask, render_template, request, jsonify, redirect, url_for, Response
+from models import db, Team, Player, Contract, HistoricalAuction, ProjectedStats, CurrentBid
 from calculators.auction_calculator import AuctionCalculator
 from calculators.roster_calculator import RosterCalculator
+from calculators.valuation_calculator import ValuationCalculator, projections_frame
+from calculators.keeper_calculator import KeeperCalculator, KeeperCandidate
+from calculators.cap_projection import CapProjection
+from calculators.rotation_draft import pick_order, round_salary
+from services.bid_cache import RecommendationCache
+from services.inflation import InflationTracker
+from services.price_model_store import PriceModelStore
+from services.lineups import LineupRegistry
+from services.auction_state import AuctionState
+from services.player_search import PlayerSearch
+from services.live_feed import LiveFeed
+from services.response_cache import ResponseCache, TableVersions
+from services.metrics import Metrics
+from sqlalchemy import func, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import datetime
 import os
+import threading
+import db_profile
+from bulk_writes import bulk_write, parse_rows
 
-app = Flask(__name__)
+# JUNIORLEAGUE_INSTANCE moves the database and its side files (tests use a temp dir)
+app = Flask(__name__, instance_path=os.environ.get('JUNIORLEAGUE_INSTANCE') or None)
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///juniorleague.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = 'your-secret-key-here-change-in-production'
+app.config['BID_CACHE_SIZE'] = 2048  # Players kept in the recommendation cache
+app.config['SEASON'] = datetime.now().year  # Season being auctioned
+app.config['PRICE_MODEL_PATH'] = os.path.join(app.instance_path, 'price_model.npz')
+app.config['PRICE_MODEL_HALF_LIFE'] = None  # Seasons; set to weight recent prices more
+app.config['SQLITE_PROFILE'] = 'production'  # See db_profile.PROFILES
+app.config['TABLE_VERSIONS_DIR'] = os.path.join(app.instance_path, 'table_versions')  # Shared with the importers
+app.config['RESPONSE_CACHE_SIZE'] = 64  # Serialized GET bodies kept for ETag hits
+app.config['METRICS_ENABLED'] = True  # Route latency/SQL instrumentation and /metrics
+app.config['SLOW_QUERY_MS'] = 100  # Statements at least this slow are logged
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = db_profile.engine_options(app.config['SQLITE_PROFILE'])
 
 # Initialize database
 db.init_app(app)
+with app.app_context():
+    db_profile.install(db.engine, app.config['SQLITE_PROFILE'])
+
+# Per-route latency and SQL statement counts, exported at /metrics
+metrics = Metrics(app.config['SLOW_QUERY_MS'])
+if app.config['METRICS_ENABLED']:
+    with app.app_context():
+        metrics.install(app, db.engine)
 
 # Initialize calculators
 auction_calc = AuctionCalculator()
 roster_calc = RosterCalculator()
+valuation_calc = ValuationCalculator()
+keeper_calc = KeeperCalculator()
+
+# Per-table versions bumped on commit (here and in the importers) and the
+# ETag cache of whole-table GET responses built on them
+table_versions = TableVersions(app.config['TABLE_VERSIONS_DIR'])
+table_versions.watch(db.session)
+response_cache = ResponseCache(table_versions, app.config['RESPONSE_CACHE_SIZE'])
+
+# Recommendation cache, invalidated when a player's auction/projection rows
+# change here, and cleared when an importer changes those tables
+bid_cache = RecommendationCache(app.config['BID_CACHE_SIZE'], versions=table_versions)
+bid_cache.watch(db.session)
+
+# League-wide dollars vs. projected value, updated on every bid
+inflation_tracker = InflationTracker(app.config['SEASON'])
+
+# Per-team dollars and slots, used to validate bids without the database
+auction_state = AuctionState(app.config['SEASON'])
+
+# Each team's slot assignment, re-solved incrementally on every bid
+lineups = LineupRegistry(app.config['SEASON'])
+
+# Price distributions by position/tier, rebuilt when imported data changes
+price_models = PriceModelStore(
+    app.config['PRICE_MODEL_PATH'],
+    half_life=app.config['PRICE_MODEL_HALF_LIFE'],
+    on_rebuild=bid_cache.clear
+)
+
+# Typeahead name index, updated when players are added
+player_search = PlayerSearch()
+
+# Server-sent auction deltas, published once per committed bid/contract
+live_feed = LiveFeed()
+
+# Serializes bid validation, the conditional upsert and the in-memory updates that follow
+bid_lock = threading.Lock()
+
+
+def player_info(player_id):
+    """Name and position from the search index, falling back to the database"""
+    info = player_search.get(player_id)
+    if info is None:
+        player = db.session.get(Player, player_id)
+        info = {'id': player_id, 'name': player.name, 'position': player.position, 'team': player.mlb_team}
+    return info
 
 
 @app.route('/')
@@ -31,21 +116,14 @@ def index():
 def init_db():
     """Initialize database and create sample data"""
     with app.app_context():
-        db.create_all()
-        return "Database initialized!"
+        changes = db_profile.migrate(db)
+        return "Database initialized!" + (f" ({len(changes)} schema changes applied)" if changes else "")
 
 
 @app.route('/auction')
 def auction():
-    """Auction calculator interface"""
-    # Get all players
-    players = Player.query.all()
-    
-    # Get projected stats
-    projected = ProjectedStats.query.all()
-    projected_dict = {p.player_id: p for p in projected}
-    
-    return render_template('auction.html', players=players, projected=projected_dict)
+    """Auction calculator interface (players are found via /api/players/search)"""
+    return render_template('auction.html')
 
 
 @app.route('/roster')
@@ -64,30 +142,297 @@ def calculate_bid():
     player_id = data.get('player_id')
     player_name = data.get('player_name')
     
+    inflation = inflation_tracker.inflation
+    cached = bid_cache.get(player_id)
+    if cached is not None:
+        return jsonify(auction_calc.apply_inflation(dict(cached, player_name=player_name), inflation))
+    
     # Get historical data
     historical = HistoricalAuction.query.filter_by(player_id=player_id).all()
     
     # Get projected stats
     projected = ProjectedStats.query.filter_by(player_id=player_id).first()
     
+    # Fallback position for the price model when no sheet recorded one
+    player = db.session.get(Player, player_id)
+    
     # Calculate recommendation
-    recommendation = auction_calc.calculate_bid(player_name, historical, projected)
+    recommendation = auction_calc.calculate_bid(
+        player_name, historical, projected, price_model=price_models.get(), position=player.position if player else None
+    )
+    bid_cache.put(player_id, recommendation)
+    
+    return jsonify(auction_calc.apply_inflation(recommendation, inflation))
+
+
+@app.route('/api/bid_cache', methods=['GET', 'DELETE'])
+def bid_cache_stats():
+    """Recommendation cache hit/miss counters; DELETE clears the cache"""
+    if request.method == 'DELETE':
+        bid_cache.clear()
+    return jsonify(bid_cache.stats())
+
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Prometheus text-format metrics"""
+    if not app.config['METRICS_ENABLED']:
+        return jsonify({'error': 'Metrics are disabled'}), 404
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+
+@app.route('/api/response_cache')
+def response_cache_stats():
+    """ETag cache hit/miss/304 counters"""
+    return jsonify(response_cache.stats())
+
+
+@app.route('/api/calculate_bids', methods=['GET', 'POST'])
+def calculate_bids():
+    """Calculate recommended bids for the whole board (or a list of player_ids)"""
+    data = request.get_json(silent=True) or {}
+    player_ids = data.get('player_ids')
+    
+    historical = db.session.query(
+        HistoricalAuction.player_id, Player.name, HistoricalAuction.salary
+    ).join(Player, Player.id == HistoricalAuction.player_id)
+    projected = db.session.query(
+        ProjectedStats.player_id, Player.name, ProjectedStats.projected_value
+    ).join(Player, Player.id == ProjectedStats.player_id).order_by(ProjectedStats.id)
+    
+    if player_ids:
+        historical = historical.filter(HistoricalAuction.player_id.in_(player_ids))
+        projected = projected.filter(ProjectedStats.player_id.in_(player_ids))
+    
+    # Latest sheet position per player, else the player's own position
+    positions = dict(db.session.query(Player.id, Player.position).filter(Player.position.isnot(None)))
+    positions.update(
+        db.session.query(HistoricalAuction.player_id, HistoricalAuction.position)
+        .filter(HistoricalAuction.position.isnot(None))
+        .order_by(HistoricalAuction.year, HistoricalAuction.id)
+    )
+    
+    recommendations = auction_calc.calculate_bids(
+        historical.all(), projected.all(), price_model=price_models.get(), positions=positions
+    )
+    inflation = inflation_tracker.inflation
+    return jsonify([auction_calc.apply_inflation(recommendation, inflation) for recommendation in recommendations])
+
+
+@app.route('/api/price_distribution')
+def price_distribution():
+    """
+    Historical price distribution for a position and salary tier
+    
+    Query args: position, tier (0 = most expensive quarter; omit for all
+    tiers), p (percentile to price) and price (price to rank).
+    """
+    model = price_models.get()
+    position = request.args.get('position')
+    tier = request.args.get('tier', -1, type=int)
+    
+    distribution = model.distribution(position, tier)
+    if distribution is None:
+        return jsonify({'error': 'No price data'}), 404
+    
+    p = request.args.get('p', type=float)
+    if p is not None:
+        distribution['percentile_price'] = model.percentile(position, p, tier)
+    price = request.args.get('price', type=float)
+    if price is not None:
+        distribution['price_percentile'] = model.percentile_of(position, price, tier)
+    return jsonify(distribution)
+
+
+@app.route('/api/inflation')
+def inflation():
+    """Current league-wide auction inflation"""
+    return jsonify(inflation_tracker.snapshot())
+
+
+@app.route('/api/valuations', methods=['GET', 'POST'])
+def valuations():
+    """
+    Dollar values for the projected player pool
+    
+    GET returns the valuation; POST also stores each player's value in
+    ProjectedStats.projected_value.
+    """
+    year = request.args.get('year', type=int)
+    query = db.session.query(ProjectedStats, Player.position).join(
+        Player, Player.id == ProjectedStats.player_id
+    )
+    if year:
+        query = query.filter(ProjectedStats.year == year)
+    rows = query.all()
+    if not rows:
+        return jsonify([])
+    
+    frame = projections_frame(rows)
+    values = valuation_calc.value_players(frame)
+    frame = frame.join(values[['total', 'par', 'slot', 'value']])
+    
+    if request.method == 'POST':
+        db.session.execute(update(ProjectedStats), [
+            {'id': projection.id, 'projected_value': round(float(value), 1)}
+            for (projection, _), value in zip(rows, frame['value'])
+        ])
+        db.session.commit()
+        for (projection, _), value in zip(rows, frame['value']):
+            if projection.year == inflation_tracker.season:
+                inflation_tracker.set_value(projection.player_id, round(float(value), 1))
     
-    return jsonify(recommendation)
+    frame = frame.sort_values('value', ascending=False)
+    return jsonify([
+        {
+            'player_id': int(row.player_id),
+            'position': row.position,
+            'slot': row.slot,
+            'z_total': round(float(row.total), 2),
+            'par': round(float(row.par), 2),
+            'value': round(float(row.value), 1),
+        }
+        for row in frame.itertuples()
+    ])
+
+
+@app.route('/api/league_summary')
+def league_summary():
+    """Every team's salary, budget and contracts, from a single joined query"""
+    year = request.args.get('year', app.config['SEASON'], type=int)
+    rows = db.session.query(
+        Team.id.label('team_id'),
+        Team.name.label('team_name'),
+        Team.owner,
+        Player.name.label('player_name'),
+        Player.position,
+        Contract.salary,
+        Contract.contract_type,
+        Contract.years_remaining
+    ).outerjoin(
+        Contract, (Contract.team_id == Team.id) & (Contract.year == year)
+    ).outerjoin(
+        Player, Player.id == Contract.player_id
+    ).order_by(Team.name, Contract.salary.desc(), Contract.id)
+    
+    return jsonify({'year': year, 'teams': roster_calc.summarize_league(rows)})
+
+
+@app.route('/api/lineups')
+def team_lineups():
+    """Open slots and buyable positions for every team (or ?team_id=)"""
+    team_id = request.args.get('team_id', type=int)
+    if team_id is None:
+        return jsonify(lineups.summaries())
+    
+    solver = lineups.solver(team_id)
+    if solver is None:
+        return jsonify({'error': 'Unknown team'}), 404
+    return jsonify(dict(solver.summary(), team_id=team_id, lineup=solver.lineup()))
+
+
+@app.route('/api/freeze', methods=['GET', 'POST'])
+def freeze():
+    """
+    Freeze-day check for every team: validate the season's keeper
+    contracts and suggest the keeper set with the most surplus value
+    
+    POST {"year": ..., "teams": {team_id: [{player_id, salary, reserve,
+    value?}]}} replaces those teams' lists for what-if runs.
+    """
+    data = request.get_json(silent=True) or {}
+    year = data.get('year') or request.args.get('year', app.config['SEASON'], type=int)
+    
+    # Best projected value per player for the season
+    values = db.session.query(
+        ProjectedStats.player_id, func.max(ProjectedStats.projected_value).label('value')
+    ).filter(ProjectedStats.year == year).group_by(ProjectedStats.player_id).subquery()
+    
+    rows = db.session.query(
+        Team.id.label('team_id'),
+        Team.name.label('team_name'),
+        Contract.player_id,
+        Player.name.label('player_name'),
+        Contract.salary,
+        Contract.reserve,
+        values.c.value
+    ).outerjoin(
+        Contract, (Contract.team_id == Team.id) & (Contract.year == year)
+    ).outerjoin(
+        Player, Player.id == Contract.player_id
+    ).outerjoin(
+        values, values.c.player_id == Contract.player_id
+    ).order_by(Team.name, Contract.id).all()
+    
+    # What-if lists; names and values default to what the season has on file
+    overrides = {}
+    known = {row.player_id: row for row in rows if row.player_id is not None}
+    for team_id, keepers in (data.get('teams') or {}).items():
+        candidates = []
+        for keeper in keepers:
+            on_file = known.get(keeper['player_id'])
+            candidates.append(KeeperCandidate(
+                keeper['player_id'],
+                keeper.get('player_name', on_file.player_name if on_file else None),
+                keeper['salary'],
+                float(keeper.get('value', on_file.value if on_file else 0) or 0),
+                bool(keeper.get('reserve', False))
+            ))
+        overrides[int(team_id)] = candidates
+    
+    return jsonify({'year': year, 'teams': keeper_calc.freeze_report(rows, overrides)})
+
+
+@app.route('/api/cap_projection')
+def cap_projection():
+    """Committed salary and open slots per team for the next few seasons"""
+    year = request.args.get('year', app.config['SEASON'], type=int)
+    horizon = request.args.get('horizon', 3, type=int)
+    
+    rows = db.session.query(
+        Team.id.label('team_id'),
+        Team.name.label('team_name'),
+        Contract.salary,
+        Contract.contract_type,
+        Contract.years_remaining,
+        Contract.reserve
+    ).outerjoin(
+        Contract, (Contract.team_id == Team.id) & (Contract.year == year)
+    ).order_by(Team.name)
+    
+    return jsonify({'year': year, 'teams': CapProjection(horizon=horizon).project(rows, year)})
+
+
+@app.route('/api/rotation_draft/order', methods=['POST'])
+def rotation_draft_order():
+    """
+    Rotation draft picks with round salaries
+    
+    POST {"standings": [team_id, ...]} in last season's finishing order,
+    champion first.
+    """
+    data = request.get_json(silent=True) or {}
+    try:
+        picks = pick_order(data.get('standings') or [])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify([pick._asdict() for pick in picks])
 
 
 @app.route('/api/teams', methods=['GET', 'POST'])
 def teams():
     """Get or create teams"""
     if request.method == 'GET':
-        teams = Team.query.all()
-        return jsonify([{'id': t.id, 'name': t.name, 'owner': t.owner} for t in teams])
+        return response_cache.respond('teams', ['teams'], lambda: app.json.dumps(
+            [{'id': t.id, 'name': t.name, 'owner': t.owner} for t in Team.query.all()]
+        ).encode())
     
     elif request.method == 'POST':
         data = request.json
         team = Team(name=data['name'], owner=data['owner'])
         db.session.add(team)
         db.session.commit()
+        auction_state.add_team(team.id)
         return jsonify({'id': team.id, 'name': team.name})
 
 
@@ -95,32 +440,108 @@ def teams():
 def players():
     """Get or create players"""
     if request.method == 'GET':
-        players = Player.query.all()
-        return jsonify([{'id': p.id, 'name': p.name, 'position': p.position} for p in players])
+        return response_cache.respond('players', ['players'], lambda: app.json.dumps(
+            [{'id': p.id, 'name': p.name, 'position': p.position} for p in Player.query.all()]
+        ).encode())
     
     elif request.method == 'POST':
         data = request.json
         player = Player(name=data['name'], position=data.get('position'), mlb_team=data.get('team'))
         db.session.add(player)
         db.session.commit()
+        player_search.add(player.id, player.name, player.position, player.mlb_team)
         return jsonify({'id': player.id, 'name': player.name})
 
 
+@app.route('/api/<any(players, teams, contracts, historical_auctions):kind>/bulk', methods=['POST'])
+def bulk_create(kind):
+    """
+    Create many rows in one transaction
+    
+    Body: JSON array or NDJSON (one object per line), fields as for the
+    single-row endpoints. Every row is validated first; ?atomic=1 writes
+    nothing unless all rows are valid.
+    """
+    atomic = request.args.get('atomic', '').lower() in ('1', 'true', 'yes')
+    result = bulk_write(kind, parse_rows(request.get_data(), request.content_type), atomic, roster_calc, round_salary)
+    written = result.pop('written')
+    
+    # Keep the in-memory services in step, as the single-row endpoints do
+    if kind == 'players':
+        for row in written:
+            player_search.add(row['id'], row['name'], row['position'], row['mlb_team'])
+    elif kind == 'teams':
+        for row in written:
+            auction_state.add_team(row['id'])
+    elif kind == 'contracts':
+        for row in written:
+            inflation_tracker.record_contract(row['player_id'], row['salary'], row['year'], row['reserve'])
+            auction_state.record_contract(row['player_id'], row['team_id'], row['salary'], row['reserve'], row['year'])
+            info = player_info(row['player_id'])
+            lineups.record_contract(row['player_id'], row['team_id'], info['position'], row['year'], row['reserve'])
+            if row['year'] == app.config['SEASON']:
+                live_feed.publish(
+                    'contract', row['player_id'], info['name'], row['team_id'], row['salary'],
+                    auction_state.team_summary(row['team_id'])
+                )
+    elif kind == 'historical_auctions' and written:
+        price_models.invalidate()
+    
+    return jsonify(result), 400 if atomic and result['failed'] else 200
+
+
+@app.route('/api/players/search')
+def search_players():
+    """
+    Typeahead player search
+    
+    Query params: q (any word order, accents optional), position,
+    page, per_page
+    """
+    return jsonify(player_search.search(
+        request.args.get('q', ''),
+        position=request.args.get('position') or None,
+        page=request.args.get('page', 1, type=int),
+        per_page=request.args.get('per_page', 20, type=int)
+    ))
+
+
 @app.route('/api/contracts', methods=['POST'])
 def create_contract():
     """Create a new contract"""
     data = request.json
+    salary = data.get('salary')
+    if salary is None and data['contract_type'] == 'rotation' and data.get('rotation_round'):
+        # Rotation picks are paid by round
+        salary = round_salary(data['rotation_round'])
+    if salary is None:
+        return jsonify({'error': 'salary is required'}), 400
+    
     contract = Contract(
         player_id=data['player_id'],
         team_id=data['team_id'],
-        salary=data['salary'],
+        salary=salary,
         contract_type=data['contract_type'],
         year=data['year'],
         years_remaining=data.get('years_remaining', 0),
-        rotation_round=data.get('rotation_round')
+        rotation_round=data.get('rotation_round'),
+        reserve=data.get('reserve', False)
     )
     db.session.add(contract)
     db.session.commit()
+    inflation_tracker.record_contract(contract.player_id, contract.salary, contract.year, contract.reserve)
+    auction_state.record_contract(
+        contract.player_id, contract.team_id, contract.salary, contract.reserve, contract.year
+    )
+    info = player_info(contract.player_id)
+    lineups.record_contract(
+        contract.player_id, contract.team_id, info['position'], contract.year, contract.reserve
+    )
+    if contract.year == app.config['SEASON']:
+        live_feed.publish(
+            'contract', contract.player_id, info['name'], contract.team_id, contract.salary,
+            auction_state.team_summary(contract.team_id)
+        )
     return jsonify({'id': contract.id})
 
 
@@ -128,19 +549,92 @@ def create_contract():
 def live_bid():
     """Record a live auction bid"""
     data = request.json
+    player_id, team_id, amount = data['player_id'], data['team_id'], data['bid_amount']
     
-    # Mark all other bids for this player as not winning
-    AuctionBid.query.filter_by(player_id=data['player_id']).update({'is_winning': False})
+    # One conditional upsert on the player's CurrentBid row: accepted only if
+    # it still beats the standing bid (and matches the version the client saw,
+    # if given). The outbid row is copied to AuctionBid by trigger.
+    stmt = sqlite_insert(CurrentBid).values(
+        player_id=player_id, team_id=team_id, bid_amount=amount, version=1, timestamp=datetime.utcnow()
+    )
+    accept = CurrentBid.bid_amount + auction_state.min_increment <= stmt.excluded.bid_amount
+    if data.get('version') is not None:
+        accept &= CurrentBid.version == data['version']
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CurrentBid.player_id],
+        set_={
+            'team_id': stmt.excluded.team_id,
+            'bid_amount': stmt.excluded.bid_amount,
+            'version': CurrentBid.version + 1,
+            'timestamp': stmt.excluded.timestamp,
+        },
+        where=accept
+    ).returning(CurrentBid.version)
     
-    bid = AuctionBid(
-        player_id=data['player_id'],
-        team_id=data['team_id'],
-        bid_amount=data['bid_amount'],
-        is_winning=True
+    with bid_lock:
+        # Budget, slot and high-bid checks come from memory; checking under the
+        # lock means concurrent bids from one team see each other's dollars
+        validation = auction_state.validate_bid(player_id, team_id, amount)
+        if not validation['valid']:
+            return jsonify(validation), 400
+        
+        version = db.session.execute(stmt).scalar()
+        if version is None:
+            db.session.rollback()
+            current = db.session.get(CurrentBid, player_id)
+            return jsonify({
+                'valid': False,
+                'reasons': [f"Outbid: current bid is ${current.bid_amount} (version {current.version})"],
+                'current': {'team_id': current.team_id, 'bid_amount': current.bid_amount, 'version': current.version},
+            }), 409
+        db.session.commit()
+        inflation_tracker.record_bid(player_id, amount)
+        auction_state.record_bid(player_id, team_id, amount)
+        info = player_info(player_id)
+        lineups.record(player_id, team_id, info['position'])
+        live_feed.publish(
+            'bid', player_id, info['name'], team_id, amount, auction_state.team_summary(team_id), version
+        )
+    return jsonify({'player_id': player_id, 'team_id': team_id, 'bid_amount': amount, 'version': version})
+
+
+
+@app.route('/api/live_feed')
+def live_feed_stream():
+    """
+    Server-sent events: one `bid` or `contract` delta per change
+    
+    Clients load /api/live_feed/snapshot, then connect with ?since=<seq>;
+    browsers resume with Last-Event-ID on reconnect.
+    """
+    last_seq = request.headers.get('Last-Event-ID', request.args.get('since'))
+    last_seq = int(last_seq) if last_seq and last_seq.isdigit() else None
+    return Response(
+        live_feed.stream(last_seq),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
     )
-    db.session.add(bid)
-    db.session.commit()
-    return jsonify({'id': bid.id})
+
+
+@app.route('/api/live_feed/snapshot')
+def live_feed_snapshot():
+    """Current high bids and team budgets from memory, for late joiners"""
+    snapshot = live_feed.snapshot()
+    snapshot['teams'] = auction_state.summaries()
+    return jsonify(snapshot)
+
+
+@app.route('/api/validate_bid', methods=['POST'])
+def validate_bid():
+    """Check a bid without recording it"""
+    data = request.json
+    return jsonify(auction_state.validate_bid(data['player_id'], data['team_id'], data['bid_amount']))
+
+
+@app.route('/api/auction_state')
+def auction_state_summary():
+    """Committed dollars, open slots and max bid for every team"""
+    return jsonify(auction_state.summaries())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,299 @@
+"""
+Batch writes for the /api/*/bulk endpoints
+
+A batch is a JSON array or an NDJSON stream of row objects. Every row is
+validated before anything is written: field types, references to
+existing players and teams, unique team names, and for contracts the
+RosterCalculator budget/roster rules, checked against per-team totals
+from one aggregate query. Valid rows are inserted in one transaction
+with multi-row INSERT ... RETURNING.
+"""
+import json
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import func, insert
+from models import db, Contract, HistoricalAuction, Player, Team
+
+# Rows per INSERT statement
+BULK_BATCH_SIZE = 500
+
+_INTEGER = re.compile(r'^-?\d+$')
+
+# field -> (type, required, default)
+FIELDS = {
+    'players': (Player, {
+        'name': (str, True, None),
+        'position': (str, False, None),
+        'mlb_team': (str, False, None),
+        'fangraphs_id': (int, False, None),
+    }),
+    'teams': (Team, {
+        'name': (str, True, None),
+        'owner': (str, True, None),
+    }),
+    'contracts': (Contract, {
+        'player_id': (int, True, None),
+        'team_id': (int, True, None),
+        'salary': (int, False, None),
+        'contract_type': (str, True, None),
+        'year': (int, True, None),
+        'years_remaining': (int, False, 0),
+        'rotation_round': (int, False, None),
+        'reserve': (bool, False, False),
+        'notes': (str, False, None),
+    }),
+    'historical_auctions': (HistoricalAuction, {
+        'player_id': (int, True, None),
+        'team_id': (int, True, None),
+        'year': (int, True, None),
+        'salary': (int, True, None),
+        'contract_type': (str, True, None),
+        'position': (str, False, None),
+        'batting_avg': (float, False, None),
+        'home_runs': (int, False, None),
+        'rbis': (int, False, None),
+        'stolen_bases': (int, False, None),
+        'wins': (int, False, None),
+        'era': (float, False, None),
+        'strikeouts': (int, False, None),
+        'saves': (int, False, None),
+    }),
+}
+
+# Alternate field names accepted from spreadsheets and the single-row endpoints
+ALIASES = {
+    'players': {'team': 'mlb_team'},
+}
+
+
+def parse_rows(body: bytes, content_type: Optional[str]) -> List[Tuple[Optional[Dict], Optional[str]]]:
+    """
+    Split a request body into rows
+    
+    Returns:
+        (row, error) per row; a JSON array is one body, anything else is
+        read as NDJSON with one row per non-blank line
+    """
+    text = body.decode('utf-8-sig')
+    if 'ndjson' not in (content_type or '') and text.lstrip().startswith('['):
+        try:
+            items = json.loads(text)
+        except ValueError as e:
+            return [(None, f"Invalid JSON: {e}")]
+        return [(item, None) if isinstance(item, dict) else (None, "Row is not an object") for item in items]
+    
+    rows = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as e:
+            rows.append((None, f"Invalid JSON: {e}"))
+            continue
+        rows.append((item, None) if isinstance(item, dict) else (None, "Row is not an object"))
+    return rows
+
+
+def _coerce(value, kind):
+    """Value as `kind`, accepting the numeric strings spreadsheets export; raises ValueError"""
+    if kind is str:
+        if not isinstance(value, str):
+            raise ValueError("must be a string")
+        return value.strip()
+    if kind is bool:
+        if isinstance(value, bool):
+            return value
+        if value in (0, 1) or str(value).lower() in ('0', '1', 'true', 'false'):
+            return str(value).lower() in ('1', 'true')
+        raise ValueError("must be a boolean")
+    if isinstance(value, bool):
+        raise ValueError(f"must be {'an integer' if kind is int else 'a number'}")
+    if kind is int:
+        if isinstance(value, int):
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, str) and _INTEGER.match(value.strip()):
+            return int(value)
+        raise ValueError("must be an integer")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError("must be a number")
+
+
+def validate_fields(kind: str, row: Dict) -> Tuple[Dict, List[str]]:
+    """Column values for one row (every field, so batches share one INSERT shape) and the problems found"""
+    _, fields = FIELDS[kind]
+    aliases = ALIASES.get(kind, {})
+    row = {aliases.get(key, key): value for key, value in row.items()}
+    values, errors = {}, []
+    for field, (field_type, required, default) in fields.items():
+        value = row.get(field)
+        values[field] = default
+        if value is None or value == '':
+            if required:
+                errors.append(f"{field} is required")
+            continue
+        try:
+            values[field] = _coerce(value, field_type)
+        except ValueError as e:
+            errors.append(f"{field} {e}")
+            continue
+        if field_type is str and required and not values[field]:
+            errors.append(f"{field} is required")
+    unknown = sorted(set(row) - set(fields))
+    if unknown:
+        errors.append(f"Unknown fields: {', '.join(unknown)}")
+    return values, errors
+
+
+def _existing_ids(model, ids) -> set:
+    ids = sorted(set(ids))
+    found = set()
+    for start in range(0, len(ids), BULK_BATCH_SIZE):
+        found.update(db.session.scalars(db.select(model.id).where(model.id.in_(ids[start:start + BULK_BATCH_SIZE]))))
+    return found
+
+
+def _check_references(values: List[Optional[Dict]], errors: List[List[str]]):
+    """player_id and team_id must exist, with one query per table"""
+    player_ids = _existing_ids(Player, (v['player_id'] for v in values if v and v['player_id'] is not None))
+    team_ids = _existing_ids(Team, (v['team_id'] for v in values if v and v['team_id'] is not None))
+    for row_values, row_errors in zip(values, errors):
+        if not row_values:
+            continue
+        if row_values['player_id'] is not None and row_values['player_id'] not in player_ids:
+            row_errors.append(f"Unknown player_id: {row_values['player_id']}")
+        if row_values['team_id'] is not None and row_values['team_id'] not in team_ids:
+            row_errors.append(f"Unknown team_id: {row_values['team_id']}")
+
+
+def _check_teams(values: List[Optional[Dict]], errors: List[List[str]]):
+    """Team names are unique, in the table and within the batch"""
+    names = {v['name'] for v in values if v and v['name']}
+    taken = set(db.session.scalars(db.select(Team.name).where(Team.name.in_(names)))) if names else set()
+    for row_values, row_errors in zip(values, errors):
+        if row_values and not row_errors:
+            if row_values['name'] in taken:
+                row_errors.append(f"Team name already exists: {row_values['name']}")
+            else:
+                taken.add(row_values['name'])
+
+
+def _check_players(values: List[Optional[Dict]], errors: List[List[str]]):
+    """Fangraphs ids are unique, in the table and within the batch"""
+    fangraphs_ids = {v['fangraphs_id'] for v in values if v and v['fangraphs_id'] is not None}
+    taken = set(db.session.scalars(
+        db.select(Player.fangraphs_id).where(Player.fangraphs_id.in_(fangraphs_ids))
+    )) if fangraphs_ids else set()
+    for row_values, row_errors in zip(values, errors):
+        if row_values and not row_errors and row_values['fangraphs_id'] is not None:
+            if row_values['fangraphs_id'] in taken:
+                row_errors.append(f"fangraphs_id already exists: {row_values['fangraphs_id']}")
+            else:
+                taken.add(row_values['fangraphs_id'])
+
+
+def _check_contracts(values: List[Optional[Dict]], errors: List[List[str]], roster_calc, round_salary: Callable):
+    """Rotation salaries by round, then the budget/roster rules over the valid rows"""
+    for row_values, row_errors in zip(values, errors):
+        if not row_values or row_values['salary'] is not None:
+            continue
+        if row_values.get('contract_type') == 'rotation' and row_values.get('rotation_round'):
+            salary = round_salary(row_values['rotation_round'])
+            if salary is not None:
+                row_values['salary'] = salary
+                continue
+        row_errors.append("salary is required")
+    
+    candidates = [i for i, row_errors in enumerate(errors) if not row_errors]
+    if not candidates:
+        return
+    keys = {(values[i]['team_id'], values[i]['year']) for i in candidates}
+    committed = {
+        (team_id, year): total
+        for team_id, year, total in db.session.query(
+            Contract.team_id, Contract.year, func.sum(Contract.salary)
+        ).filter(Contract.year.in_({year for _, year in keys})).group_by(Contract.team_id, Contract.year)
+    }
+    player_ids = {values[i]['player_id'] for i in candidates}
+    roster_teams = dict(db.session.query(Player.id, Player.roster_team_id).filter(Player.id.in_(player_ids)))
+    team_names = dict(db.session.query(Team.id, Team.name))
+    
+    adds = [(values[i]['player_id'], values[i]['team_id'], values[i]['year'], values[i]['salary']) for i in candidates]
+    for i, validation in zip(candidates, roster_calc.validate_roster_adds(adds, committed, roster_teams, team_names)):
+        errors[i].extend(validation['reasons'])
+
+
+def bulk_write(kind: str, rows: List[Tuple[Optional[Dict], Optional[str]]], atomic: bool,
+               roster_calc, round_salary: Callable) -> Dict:
+    """
+    Validate and insert a batch (needs an app context)
+    
+    Args:
+        kind: 'players', 'teams', 'contracts' or 'historical_auctions'
+        rows: Output of `parse_rows`
+        atomic: Write nothing if any row is invalid
+        roster_calc: RosterCalculator for the contract budget rules
+        round_salary: Rotation round -> salary, for contracts without one
+    
+    Returns:
+        Dictionary with per-row `results` (id or errors), counts, and the
+        inserted rows' values under `written` for in-memory updates
+    """
+    model, _ = FIELDS[kind]
+    values, errors = [], []
+    for row, parse_error in rows:
+        if parse_error:
+            values.append(None)
+            errors.append([parse_error])
+            continue
+        row_values, row_errors = validate_fields(kind, row)
+        values.append(row_values)
+        errors.append(row_errors)
+    
+    if kind in ('contracts', 'historical_auctions'):
+        _check_references(values, errors)
+    if kind == 'players':
+        _check_players(values, errors)
+    if kind == 'teams':
+        _check_teams(values, errors)
+    if kind == 'contracts':
+        _check_contracts(values, errors, roster_calc, round_salary)
+    
+    valid = [i for i, row_errors in enumerate(errors) if not row_errors]
+    failed = len(rows) - len(valid)
+    ids = {}
+    if valid and not (atomic and failed):
+        try:
+            for start in range(0, len(valid), BULK_BATCH_SIZE):
+                batch = valid[start:start + BULK_BATCH_SIZE]
+                inserted = db.session.scalars(
+                    insert(model).returning(model.id, sort_by_parameter_order=True),
+                    [values[i] for i in batch]
+                ).all()
+                ids.update(zip(batch, inserted))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+    
+    results = []
+    for i, row_errors in enumerate(errors):
+        if row_errors:
+            results.append({'row': i, 'errors': row_errors})
+        elif i in ids:
+            results.append({'row': i, 'id': ids[i]})
+        else:
+            results.append({'row': i, 'skipped': True})  # Valid, but the atomic batch was rejected
+    
+    return {
+        'atomic': atomic,
+        'rows': len(rows),
+        'inserted': len(ids),
+        'failed': failed,
+        'results': results,
+        'written': [dict(values[i], id=ids[i]) for i in valid if i in ids],
+    }
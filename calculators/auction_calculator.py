@@ -3,7 +3,19 @@ Auction Calculator for JuniorLeague
 Provides bidding recommendations based on historical data and projections
 """
 import statistics
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+from calculators.price_model import ALL_POSITIONS, ALL_TIERS, PriceModel
+
+# Below this many past prices, a player's own history is blended with
+# their position/tier price distribution
+MIN_PLAYER_HISTORY = 3
+
+
+def _as_number(value: float):
+    """int for whole numbers, like the statistics module returns for int data"""
+    return int(value) if float(value).is_integer() else float(value)
 
 
 class AuctionCalculator:
@@ -13,7 +25,9 @@ class AuctionCalculator:
         self, 
         player_name: str, 
         historical_data: List, 
-        projected_stats: Optional[object]
+        projected_stats: Optional[object],
+        price_model: Optional[PriceModel] = None,
+        position: Optional[str] = None
     ) -> Dict:
         """
         Calculate recommended bid range for a player
@@ -22,6 +36,10 @@ class AuctionCalculator:
             player_name: Name of the player
             historical_data: List of HistoricalAuction objects
             projected_stats: ProjectedStats object (optional)
+            price_model: League price distributions, used when the player
+                has little history of their own (optional)
+            position: Player position, used when no HistoricalAuction
+                row records one
         
         Returns:
             Dictionary with recommended bid info
@@ -61,10 +79,28 @@ class AuctionCalculator:
         else:
             recommendation['reasoning'].append("No historical auction data available")
         
+        # Non-positive values are players the valuation leaves undrafted
+        projected_value = projected_stats.projected_value if projected_stats else None
+        if projected_value is not None and projected_value <= 0:
+            projected_value = None
+        
+        # Thin history: lean on the position/tier price distribution
+        positioned = [h for h in historical_data if h.position]
+        if positioned:
+            position = max(positioned, key=lambda h: (h.year, h.id)).position
+        historical_bids = [h.salary for h in historical_data]
+        tier_prices = self.tier_prices(
+            price_model,
+            position,
+            len(historical_bids),
+            statistics.median(historical_bids) if historical_bids else None,
+            projected_value
+        )
+        if tier_prices:
+            self._apply_tier_prices(recommendation, tier_prices, historical_bids)
+        
         # Adjust based on projected stats if available
-        if projected_stats and projected_stats.projected_value:
-            projected_value = projected_stats.projected_value
-            
+        if projected_value:
             # Weight the recommendation
             if historical_data:
                 # Blend historical and projected: 60% historical, 40% projected
@@ -86,6 +122,265 @@ class AuctionCalculator:
         
         return recommendation
     
+    def tier_prices(
+        self,
+        price_model: Optional[PriceModel],
+        position: Optional[str],
+        count: int,
+        median: Optional[float],
+        projected_value: Optional[float]
+    ) -> Optional[Dict]:
+        """
+        Price distribution of the player's likely tier, for thin histories
+        
+        The tier is the one whose median is closest to the player's own
+        median price, else their projected value; players with neither are
+        placed in the position's lowest tier.
+        
+        Returns:
+            Dictionary with position, tier, p25, median and p75, or None
+            when the player has enough history or there is no model
+        """
+        if price_model is None or count >= MIN_PLAYER_HISTORY:
+            return None
+        
+        if count:
+            tier = price_model.tier_for_price(position, median)
+        elif projected_value and projected_value > 0:
+            tier = price_model.tier_for_price(position, projected_value)
+        else:
+            tier = price_model.lowest_tier(position)
+        return self._tier_summary(price_model, position, tier)
+    
+    def _tier_summary(self, price_model: PriceModel, position: Optional[str], tier: int) -> Optional[Dict]:
+        tier_median = price_model.percentile(position, 50, tier)
+        if tier_median is None:
+            return None
+        return {
+            'position': price_model.group_position(position),
+            'tier': tier,
+            'p25': round(price_model.percentile(position, 25, tier), 1),
+            'median': round(tier_median, 1),
+            'p75': round(price_model.percentile(position, 75, tier), 1),
+        }
+    
+    def _tier_reason(self, tier_prices: Dict) -> str:
+        label = 'All positions' if tier_prices['position'] == ALL_POSITIONS else tier_prices['position']
+        tier = 'all tiers' if tier_prices['tier'] == ALL_TIERS else f"tier {tier_prices['tier'] + 1}"
+        return (
+            f"{label} {tier} prices: "
+            f"${tier_prices['p25']:.0f}-${tier_prices['p75']:.0f} (median: ${tier_prices['median']:.0f})"
+        )
+    
+    def _apply_tier_prices(self, recommendation: Dict, tier_prices: Dict, historical_bids: List[int]):
+        """Blend a thin history with its tier median (in place)"""
+        count = len(historical_bids)
+        if count:
+            # Each missing season counts as one tier-median price
+            own_median = statistics.median(historical_bids)
+            missing = MIN_PLAYER_HISTORY - count
+            shrunk = (count * own_median + missing * tier_prices['median']) / MIN_PLAYER_HISTORY
+            recommendation['recommended_bid'] = int(shrunk)
+        else:
+            recommendation['recommended_bid'] = int(tier_prices['median'])
+            if tier_prices['position'] != ALL_POSITIONS:
+                recommendation['confidence'] = 'medium'
+        
+        recommendation['tier_prices'] = tier_prices
+        recommendation['reasoning'].append(self._tier_reason(tier_prices))
+    
+    def apply_inflation(self, recommendation: Dict, inflation: float) -> Dict:
+        """
+        Scale a recommendation by the live auction inflation factor
+        
+        Returns a new dictionary; cached recommendations are left untouched.
+        """
+        if not inflation or inflation == 1.0:
+            return recommendation
+        
+        adjusted = dict(recommendation)
+        adjusted['recommended_bid'] = int(recommendation['recommended_bid'] * inflation)
+        adjusted['suggested_range'] = {
+            'low': int(adjusted['recommended_bid'] * 0.85),
+            'high': int(adjusted['recommended_bid'] * 1.15)
+        }
+        adjusted['reasoning'] = recommendation['reasoning'] + [
+            f"Auction inflation: x{inflation:.2f}"
+        ]
+        adjusted['inflation'] = round(inflation, 4)
+        return adjusted
+    
+    def _board_tier_prices(
+        self,
+        price_model: Optional[PriceModel],
+        board: pd.DataFrame,
+        has_value: np.ndarray,
+        positions: Dict[int, str]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        `tier_prices` for every board row, one array lookup per position group
+        
+        Returns:
+            (tier price dictionaries, tier medians, whether the group is a
+            single position), None/NaN/False where the row is not thin or
+            not priced; rows sharing a group and tier share one dictionary
+        """
+        summaries = np.full(len(board), None, dtype=object)
+        medians = np.full(len(board), np.nan)
+        positioned = np.zeros(len(board), dtype=bool)
+        counts = board['count'].to_numpy()
+        thin = counts < MIN_PLAYER_HISTORY
+        if price_model is None or not thin.any():
+            return summaries, medians, positioned
+        
+        raw = pd.Series(board.index, index=board.index).map(positions).fillna('')
+        group_of = {position: price_model.group_position(position) for position in raw.unique()}
+        groups = raw.map(group_of).to_numpy()
+        # Own median price, else projected value; NaN places the player in the lowest tier
+        prices = np.where(
+            counts > 0, board['median'].to_numpy(dtype=float),
+            np.where(has_value, board['projected_value'].to_numpy(dtype=float), np.nan)
+        )
+        
+        for group in np.unique(groups[thin]):
+            rows = np.flatnonzero(thin & (groups == group))
+            priced = ~np.isnan(prices[rows])
+            tiers = np.full(len(rows), price_model.lowest_tier(group), dtype=np.int64)
+            tiers[priced] = price_model.tiers_for_prices(group, prices[rows[priced]])
+            for tier in np.unique(tiers):
+                summary = self._tier_summary(price_model, group, int(tier))
+                if summary is None:
+                    continue
+                members = rows[tiers == tier]
+                summaries[members] = summary
+                medians[members] = summary['median']
+                positioned[members] = summary['position'] != ALL_POSITIONS
+        return summaries, medians, positioned
+    
+    def calculate_bids(
+        self,
+        historical_rows: Iterable[Tuple[int, str, int]],
+        projected_rows: Iterable[Tuple[int, str, Optional[float]]],
+        price_model: Optional[PriceModel] = None,
+        positions: Optional[Dict[int, str]] = None
+    ) -> List[Dict]:
+        """
+        Calculate recommendations for every player at once
+        
+        Produces the same numbers as `calculate_bid`, but aggregates with
+        pandas group-bys and computes the bids, tier prices, confidence and
+        ranges as whole columns; the dictionaries are assembled at the end.
+        
+        Args:
+            historical_rows: (player_id, player_name, salary) for every
+                HistoricalAuction row
+            projected_rows: (player_id, player_name, projected_value), in
+                the order `calculate_bid` would see them; the first row per
+                player is used
+            price_model: League price distributions for thin histories
+            positions: player_id -> position, for the tier lookup
+        
+        Returns:
+            List of recommendation dictionaries, each with a player_id
+        """
+        historical = pd.DataFrame(list(historical_rows), columns=['player_id', 'player_name', 'salary'])
+        projected = pd.DataFrame(list(projected_rows), columns=['player_id', 'player_name', 'projected_value'])
+        projected = projected.drop_duplicates('player_id', keep='first')
+        
+        stats = historical.groupby('player_id').agg(
+            player_name=('player_name', 'first'),
+            min=('salary', 'min'),
+            max=('salary', 'max'),
+            avg=('salary', 'mean'),
+            median=('salary', 'median'),
+            count=('salary', 'size'),
+        )
+        board = stats.join(
+            projected.set_index('player_id').rename(columns={'player_name': 'projected_name'}),
+            how='outer'
+        )
+        board['player_name'] = board['player_name'].fillna(board['projected_name'])
+        board['count'] = board['count'].fillna(0).astype(int)
+        
+        counts = board['count'].to_numpy()
+        has_history = counts > 0
+        median = board['median'].to_numpy(dtype=float)
+        value = board['projected_value'].to_numpy(dtype=float)
+        has_value = np.nan_to_num(value) > 0  # Non-positive values are undrafted players
+        
+        # Median baseline
+        recommended = np.where(has_history, np.trunc(np.nan_to_num(median)), 0.0)
+        confidence = np.select([counts >= 3, counts >= 1], ['high', 'medium'], default='low').astype(object)
+        
+        # Thin histories: each missing season counts as one tier-median price
+        tier_prices, tier_median, tier_positioned = self._board_tier_prices(
+            price_model, board, has_value, positions or {}
+        )
+        has_tier = ~np.isnan(tier_median)
+        shrunk = (counts * np.nan_to_num(median) + (MIN_PLAYER_HISTORY - counts) * tier_median) / MIN_PLAYER_HISTORY
+        recommended = np.where(has_tier, np.trunc(np.where(has_history, shrunk, tier_median)), recommended)
+        confidence[has_tier & ~has_history & tier_positioned] = 'medium'
+        
+        # 60/40 historical/projected blend
+        recommended = np.where(
+            has_value,
+            np.trunc(np.where(has_history, 0.6 * recommended + 0.4 * np.nan_to_num(value), value)),
+            recommended
+        )
+        confidence[has_value & ~has_history] = 'medium'
+        low = np.trunc(recommended * 0.85)
+        high = np.trunc(recommended * 1.15)
+        
+        # Reasoning lines as string columns
+        avg = board['avg'].to_numpy(dtype=float)
+        history_reason = np.where(
+            has_history,
+            'Based on ' + board['count'].astype(str) + ' historical auction(s): $'
+            + board['min'].fillna(0).astype(int).astype(str) + '-$' + board['max'].fillna(0).astype(int).astype(str)
+            + ' (avg: $' + board['avg'].map('{:.0f}'.format) + ')',
+            'No historical auction data available'
+        )
+        value_reason = 'Projected value: $' + board['projected_value'].map('{:.0f}'.format)
+        tier_reasons = {id(summary): self._tier_reason(summary) for summary in tier_prices[has_tier]}
+        
+        bid_ranges = [
+            {
+                'min': int(low_price),
+                'max': int(high_price),
+                'avg': _as_number(mean),
+                # statistics.median averages (to a float) for even counts
+                'median': float(mid) if count % 2 == 0 else int(mid),
+            } if count else {'min': 0, 'max': 0, 'avg': 0}
+            for low_price, high_price, mean, mid, count in zip(
+                board['min'].fillna(0).tolist(), board['max'].fillna(0).tolist(),
+                np.nan_to_num(avg).tolist(), np.nan_to_num(median).tolist(), counts.tolist()
+            )
+        ]
+        
+        results = []
+        for (player_id, name, bid, conf, bid_range, low_bid, high_bid, history, tier, priced, projected_reason) in zip(
+            board.index.tolist(), board['player_name'].tolist(), recommended.tolist(), confidence.tolist(),
+            bid_ranges, low.tolist(), high.tolist(), history_reason.tolist(), tier_prices.tolist(),
+            has_value.tolist(), value_reason.tolist()
+        ):
+            recommendation = {
+                'player_id': int(player_id),
+                'player_name': name,
+                'recommended_bid': int(bid),
+                'bid_range': bid_range,
+                'confidence': conf,
+                'reasoning': [history],
+                'suggested_range': {'low': int(low_bid), 'high': int(high_bid)},
+            }
+            if tier:
+                recommendation['tier_prices'] = tier
+                recommendation['reasoning'].append(tier_reasons[id(tier)])
+            if priced:
+                recommendation['reasoning'].append(projected_reason)
+            results.append(recommendation)
+        
+        return results
+    
     def calculate_stat_value(
         self, 
         projected_homeruns: int, 
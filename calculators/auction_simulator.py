@@ -0,0 +1,274 @@
+"""
+Monte Carlo Auction Simulator for JuniorLeague
+Runs many full 10-team auctions to stress-test a bidding strategy
+"""
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from config.league_settings import AUCTION_RULES, BUDGET, NUM_TEAMS, POSITIONS
+
+# Runs per worker task; fixed so results don't depend on the worker count
+CHUNK_RUNS = 250
+
+# Spread (log scale) assumed for players with fewer than two past prices
+DEFAULT_SIGMA = 0.35
+
+# Slot types for PlayerPool.slot_type
+HITTER, PITCHER, ANY = 0, 1, 2
+
+# Nomination orders for AuctionSimulator.run
+NOMINATION_ORDERS = ('value', 'weighted', 'random')
+
+
+class PlayerPool:
+    """
+    Precomputed per-player arrays used by the simulation loop
+    
+    Prices are modelled as log-normal: `mu`/`sigma` come from a player's
+    HistoricalAuction salaries, centred on the AuctionCalculator
+    recommendation when there is one.
+    """
+    
+    def __init__(self, player_ids, mu, sigma, recommended, slot_type):
+        self.player_ids = np.asarray(player_ids, dtype=np.int64)
+        self.mu = np.asarray(mu, dtype=float)
+        self.sigma = np.asarray(sigma, dtype=float)
+        self.recommended = np.asarray(recommended, dtype=float)
+        self.slot_type = np.asarray(slot_type, dtype=np.int8)
+    
+    def __len__(self):
+        return len(self.player_ids)
+    
+    @classmethod
+    def build(
+        cls,
+        historical_rows: Iterable[Tuple[int, int]],
+        recommendations: Dict[int, float],
+        slot_types: Dict[int, int],
+        size: Optional[int] = None
+    ) -> 'PlayerPool':
+        """
+        Args:
+            historical_rows: (player_id, salary) for every HistoricalAuction row
+            recommendations: player_id -> recommended bid
+            slot_types: player_id -> HITTER, PITCHER or ANY (unknown position)
+            size: Keep only the top `size` players by recommendation
+        """
+        prices: Dict[int, List[float]] = {}
+        for player_id, salary in historical_rows:
+            prices.setdefault(player_id, []).append(math.log(max(salary, 1)))
+        
+        ranked = sorted(
+            (pid for pid, bid in recommendations.items() if bid and bid > 0),
+            key=lambda pid: -recommendations[pid]
+        )
+        if size:
+            ranked = ranked[:size]
+        
+        mu, sigma = [], []
+        for player_id in ranked:
+            logs = prices.get(player_id, [])
+            centre = math.log(max(recommendations[player_id], 1))
+            mu.append(centre)
+            sigma.append(float(np.std(logs)) if len(logs) >= 2 and np.std(logs) > 0 else DEFAULT_SIGMA)
+        
+        return cls(
+            ranked,
+            mu,
+            sigma,
+            [recommendations[pid] for pid in ranked],
+            [slot_types.get(pid, ANY) for pid in ranked],
+        )
+
+
+def _simulate_chunk(args) -> Dict[str, np.ndarray]:
+    """Run a chunk of auctions with its own seed (worker entry point)"""
+    pool, runs, seed, aggression, nomination, num_teams, budget, hitter_slots, pitcher_slots, min_bid = args
+    rng = np.random.default_rng(seed)
+    n = len(pool)
+    
+    price_sum = np.zeros(n)
+    sold_count = np.zeros(n, dtype=np.int64)
+    strategy_wins = np.zeros(n, dtype=np.int64)
+    money_left = np.zeros((runs, num_teams))
+    
+    # Buffers reused by every run
+    budget_left = np.empty(num_teams)
+    open_h = np.empty(num_teams, dtype=np.int64)
+    open_p = np.empty(num_teams, dtype=np.int64)
+    bids = np.empty(num_teams)
+    values = np.empty((n, num_teams))
+    tiebreak = np.empty((n, num_teams))
+    order = np.argsort(-pool.recommended, kind='stable')
+    mu = pool.mu[:, None]
+    sigma = pool.sigma[:, None]
+    strategy_value = pool.recommended * aggression
+    
+    for run in range(runs):
+        budget_left.fill(budget)
+        open_h.fill(hitter_slots)
+        open_p.fill(pitcher_slots)
+        if nomination == 'random':
+            rng.shuffle(order)
+        elif nomination == 'weighted':
+            # Sampling without replacement, weight = recommended bid
+            order = np.argsort(rng.exponential(size=n) / pool.recommended)
+        
+        # Every team's private valuation of every player, drawn up front
+        rng.standard_normal(out=values)
+        values *= sigma
+        values += mu
+        np.exp(values, out=values)
+        values[:, 0] = strategy_value  # Team 0 bids the strategy
+        rng.random(out=tiebreak)
+        tiebreak *= 1e-6
+        
+        for idx in order:
+            slot_type = pool.slot_type[idx]
+            if slot_type == HITTER:
+                has_slot = open_h > 0
+            elif slot_type == PITCHER:
+                has_slot = open_p > 0
+            else:
+                has_slot = (open_h + open_p) > 0
+            open_total = open_h + open_p
+            if not open_total.any():
+                break
+            
+            # Max legal bid keeps $min_bid for every other open slot
+            max_bid = budget_left - min_bid * (open_total - 1)
+            np.minimum(values[idx], max_bid, out=bids)
+            bids[~has_slot | (bids < min_bid)] = -1.0
+            bids += tiebreak[idx]
+            
+            winner = int(bids.argmax())
+            if bids[winner] < min_bid:
+                continue  # No legal bid at the minimum: unsold
+            top = bids[winner]
+            bids[winner] = -1.0
+            runner_up = bids.max()
+            price = float(math.floor(min(top, max(runner_up + 1, min_bid))))
+            
+            budget_left[winner] -= price
+            if slot_type == HITTER or (slot_type == ANY and open_h[winner] > 0):
+                open_h[winner] -= 1
+            else:
+                open_p[winner] -= 1
+            
+            price_sum[idx] += price
+            sold_count[idx] += 1
+            if winner == 0:
+                strategy_wins[idx] += 1
+        
+        money_left[run] = budget_left
+    
+    return {
+        'price_sum': price_sum,
+        'sold_count': sold_count,
+        'strategy_wins': strategy_wins,
+        'money_left': money_left,
+    }
+
+
+class AuctionSimulator:
+    """
+    Simulates full auctions under league budgets, slots and minimum bids
+    
+    Team 0 follows the strategy being tested: it values each player at
+    the AuctionCalculator recommendation times `aggression`. The other
+    teams draw private valuations from each player's historical price
+    distribution. Each auction is an English auction: the highest legal
+    bidder wins at the runner-up's bid plus $1.
+    
+    Nomination order matters: players nominated late are sold once
+    budgets and slots have run down, so they go cheaper. Random order
+    sends stars to that tail as often as scrubs and biases expected
+    prices low; by default players are nominated by descending
+    recommended bid, as in most real auctions.
+    """
+    
+    def __init__(
+        self,
+        num_teams: int = NUM_TEAMS,
+        budget: int = BUDGET,
+        positions: Dict[str, int] = None,
+        min_bid: int = AUCTION_RULES['minimum_bid']
+    ):
+        positions = positions or POSITIONS
+        self.num_teams = num_teams
+        self.budget = budget
+        self.pitcher_slots = positions.get('P', 0)
+        self.hitter_slots = sum(n for pos, n in positions.items() if pos != 'P')
+        self.min_bid = min_bid
+    
+    def run(
+        self,
+        pool: PlayerPool,
+        runs: int = 10000,
+        aggression: float = 1.0,
+        seed: int = 0,
+        workers: Optional[int] = None,
+        nomination: str = 'value'
+    ) -> Dict:
+        """
+        Run `runs` auctions across a process pool
+        
+        Results are reproducible for a given seed and run count, whatever
+        the number of workers.
+        
+        Args:
+            nomination: 'value' (descending recommended bid), 'weighted'
+                (random, weighted by recommended bid) or 'random'
+        
+        Returns:
+            Dictionary with per-player expected price, sale probability and
+            strategy win probability, plus money left per team
+        """
+        if nomination not in NOMINATION_ORDERS:
+            raise ValueError(f"Unknown nomination order: {nomination}")
+        chunks = [CHUNK_RUNS] * (runs // CHUNK_RUNS)
+        if runs % CHUNK_RUNS:
+            chunks.append(runs % CHUNK_RUNS)
+        seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+        tasks = [
+            (pool, chunk, chunk_seed, aggression, nomination, self.num_teams, self.budget,
+             self.hitter_slots, self.pitcher_slots, self.min_bid)
+            for chunk, chunk_seed in zip(chunks, seeds)
+        ]
+        
+        if workers == 1:
+            results = list(map(_simulate_chunk, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_simulate_chunk, tasks))
+        
+        price_sum = sum(r['price_sum'] for r in results)
+        sold_count = sum(r['sold_count'] for r in results)
+        strategy_wins = sum(r['strategy_wins'] for r in results)
+        money_left = np.vstack([r['money_left'] for r in results])
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            expected_price = np.where(sold_count > 0, price_sum / np.maximum(sold_count, 1), np.nan)
+        
+        return {
+            'runs': runs,
+            'aggression': aggression,
+            'nomination': nomination,
+            'players': [
+                {
+                    'player_id': int(pool.player_ids[i]),
+                    'recommended_bid': float(pool.recommended[i]),
+                    'expected_price': None if np.isnan(expected_price[i]) else round(float(expected_price[i]), 2),
+                    'sale_probability': float(sold_count[i] / runs),
+                    'win_probability': float(strategy_wins[i] / runs),
+                }
+                for i in range(len(pool))
+            ],
+            'money_left': {
+                'mean_by_team': [round(float(x), 2) for x in money_left.mean(axis=0)],
+                'strategy_quantiles': {
+                    str(q): float(np.quantile(money_left[:, 0], q)) for q in (0.1, 0.5, 0.9)
+                },
+            },
+        }
@@ -0,0 +1,142 @@
+"""
+Cap Projection Calculator for JuniorLeague
+Projects every team's committed salary and open roster slots for future seasons
+"""
+from typing import Dict, Iterable, List
+import numpy as np
+from config.league_settings import BUDGET, ROSTER_SIZE
+
+# Contract types the projection understands; anything else (auction,
+# rotation, in_season, ...) is a standard C contract
+CONTRACT_CODES = ['A', 'B', 'C', 'F', 'LONG_TERM']
+A, B, C, F, LONG_TERM = range(len(CONTRACT_CODES))
+
+# LONG_TERM salary: current salary + $5 per additional year
+LONG_TERM_RAISE = 5
+
+
+class CapProjection:
+    """
+    Applies the CONTRACT_TYPES rules to all contracts at once
+    
+    Season offsets are relative to the base season (0):
+    - A and B contracts expire at the end of the base season
+    - C contracts carry over one season as B at the same salary
+    - F contracts stay F for `f_years` seasons, then become C, then B
+    - LONG_TERM contracts run `years_remaining` more seasons at
+      salary + $5 x years_remaining
+    """
+    
+    def __init__(self, horizon: int = 3, budget: int = BUDGET, roster_size: int = ROSTER_SIZE, f_years: int = 1):
+        """
+        Args:
+            horizon: Future seasons to project after the base season
+            f_years: Seasons an F contract keeps rookie status
+        """
+        self.horizon = horizon
+        self.budget = budget
+        self.roster_size = roster_size
+        self.f_years = f_years
+    
+    def contract_states(self, types: np.ndarray, salary: np.ndarray, years_remaining: np.ndarray, offset: int):
+        """
+        Type code and salary of every contract `offset` seasons ahead
+        
+        Returns:
+            (types, salaries) arrays; expired contracts have type -1
+        """
+        if offset == 0:
+            return types, salary
+        
+        next_types = np.full(types.shape, -1)
+        next_salary = salary.copy()
+        
+        # C -> B for one more season
+        if offset == 1:
+            next_types[types == C] = B
+        
+        # F -> ... F until conversion, then C, then B
+        is_f = types == F
+        if offset < self.f_years:
+            next_types[is_f] = F
+        elif offset == self.f_years:
+            next_types[is_f] = C
+        elif offset == self.f_years + 1:
+            next_types[is_f] = B
+        
+        # LONG_TERM: flat raised salary through years_remaining
+        is_long = types == LONG_TERM
+        next_types[is_long & (years_remaining >= offset)] = LONG_TERM
+        next_salary = np.where(is_long, salary + LONG_TERM_RAISE * years_remaining, next_salary)
+        
+        return next_types, next_salary
+    
+    def project(self, rows: Iterable, base_year: int) -> List[Dict]:
+        """
+        Args:
+            rows: Team LEFT JOIN Contract rows with team_id, team_name,
+                salary, contract_type, years_remaining and reserve for the
+                base season (contract columns None for teams without any)
+            base_year: Season the contracts belong to
+        
+        Returns:
+            One dictionary per team with a `seasons` list from the base
+            season through `horizon` seasons ahead
+        """
+        team_ids, team_names = [], []
+        team_index = {}
+        contract_team, types, salary, years_remaining, reserve = [], [], [], [], []
+        codes = {code: i for i, code in enumerate(CONTRACT_CODES)}
+        for row in rows:
+            if row.team_id not in team_index:
+                team_index[row.team_id] = len(team_ids)
+                team_ids.append(row.team_id)
+                team_names.append(row.team_name)
+            if row.salary is None:
+                continue
+            contract_team.append(team_index[row.team_id])
+            types.append(codes.get((row.contract_type or '').upper(), C))
+            salary.append(row.salary)
+            years_remaining.append(row.years_remaining or 0)
+            reserve.append(bool(row.reserve))
+        
+        num_teams = len(team_ids)
+        contract_team = np.array(contract_team, dtype=np.int64)
+        types = np.array(types, dtype=np.int64)
+        salary = np.array(salary, dtype=np.int64)
+        years_remaining = np.array(years_remaining, dtype=np.int64)
+        active_roster = ~np.array(reserve, dtype=bool)
+        
+        seasons = []
+        for offset in range(self.horizon + 1):
+            season_types, season_salary = self.contract_states(types, salary, years_remaining, offset)
+            live = season_types >= 0
+            committed = np.bincount(contract_team[live], weights=season_salary[live], minlength=num_teams)
+            counts = np.bincount(contract_team[live], minlength=num_teams)
+            rostered = np.bincount(contract_team[live & active_roster], minlength=num_teams)
+            by_type = np.bincount(
+                contract_team[live] * len(CONTRACT_CODES) + season_types[live],
+                minlength=num_teams * len(CONTRACT_CODES)
+            ).reshape(num_teams, len(CONTRACT_CODES))
+            seasons.append((base_year + offset, committed, counts, rostered, by_type))
+        
+        return [
+            {
+                'team_id': team_id,
+                'team_name': team_names[t],
+                'seasons': [
+                    {
+                        'year': year,
+                        'committed_salary': int(committed[t]),
+                        'remaining_budget': self.budget - int(committed[t]),
+                        'contracts': int(counts[t]),
+                        'open_slots': max(self.roster_size - int(rostered[t]), 0),
+                        'by_type': {
+                            code: int(by_type[t, i]) for i, code in enumerate(CONTRACT_CODES) if by_type[t, i]
+                        },
+                    }
+                    for year, committed, counts, rostered, by_type in seasons
+                ],
+            }
+            for t, team_id in enumerate(team_ids)
+        ]
@@ -0,0 +1,157 @@
+"""
+Keeper Calculator for JuniorLeague
+Validates freeze-day keeper lists and finds each team's best keeper set
+"""
+from typing import Dict, Iterable, List, NamedTuple, Optional
+import numpy as np
+from config.league_settings import BUDGET, KEEPER_RULES
+
+
+class KeeperCandidate(NamedTuple):
+    """A contract that can be frozen"""
+    player_id: int
+    player_name: str
+    salary: int
+    value: float  # Projected auction value
+    reserve: bool  # Frozen on the reserve roster rather than active
+    
+    @property
+    def surplus(self) -> float:
+        return self.value - self.salary
+
+
+class KeeperCalculator:
+    """
+    Freeze-day rules: KEEPER_RULES caps plus frozen salaries against the budget
+    
+    The optimizer is a 0/1 knapsack with three capacities (active count,
+    reserve count, salary) solved by dynamic programming; the total-keeper
+    cap is applied to the final table, since counts only grow.
+    """
+    
+    def __init__(self, rules: Dict = None, budget: int = BUDGET):
+        rules = rules or KEEPER_RULES
+        self.max_active = rules['max_active_keepers']
+        self.max_reserve = rules['max_reserve_keepers']
+        self.max_total = rules['max_total_keepers']
+        self.min_keepers = rules.get('min_keepers', 0)
+        self.salaries_count = rules.get('frozen_salaries_count_against_budget', True)
+        self.budget = budget
+    
+    def validate(self, keepers: List[KeeperCandidate]) -> Dict:
+        """
+        Check a keeper list against the freeze rules
+        
+        Returns:
+            Dictionary with valid, reasons and the counts/salary checked
+        """
+        active = sum(1 for k in keepers if not k.reserve)
+        reserve = len(keepers) - active
+        salary = sum(k.salary for k in keepers)
+        
+        validation = {
+            'valid': True,
+            'reasons': [],
+            'active': active,
+            'reserve': reserve,
+            'total': len(keepers),
+            'salary': salary,
+            'remaining_budget': self.budget - salary if self.salaries_count else self.budget,
+            'surplus': round(sum(k.surplus for k in keepers), 1),
+        }
+        checks = [
+            (active > self.max_active, f"Too many active keepers: {active} > {self.max_active}"),
+            (reserve > self.max_reserve, f"Too many reserve keepers: {reserve} > {self.max_reserve}"),
+            (len(keepers) > self.max_total, f"Too many keepers: {len(keepers)} > {self.max_total}"),
+            (len(keepers) < self.min_keepers, f"Too few keepers: {len(keepers)} < {self.min_keepers}"),
+            (self.salaries_count and salary > self.budget,
+             f"Frozen salaries exceed budget: ${salary} > ${self.budget}"),
+        ]
+        for failed, reason in checks:
+            if failed:
+                validation['valid'] = False
+                validation['reasons'].append(reason)
+        return validation
+    
+    def optimize(self, candidates: List[KeeperCandidate]) -> Dict:
+        """
+        Keeper set with the largest total surplus (value - salary)
+        
+        Players with no surplus are never kept; there is no minimum
+        keeper count to fill.
+        
+        Returns:
+            Dictionary with the chosen keepers and their totals
+        """
+        items = [c for c in candidates if c.surplus > 0 and c.salary <= self.budget]
+        budget = self.budget if self.salaries_count else sum(c.salary for c in items)
+        
+        # best[a, r, s]: max surplus with a active, r reserve keepers, $s salary
+        best = np.full((self.max_active + 1, self.max_reserve + 1, budget + 1), -np.inf)
+        best[0, 0, 0] = 0.0
+        taken = np.zeros((len(items),) + best.shape, dtype=bool)
+        
+        for i, item in enumerate(items):
+            da, dr = (0, 1) if item.reserve else (1, 0)
+            source = best[:best.shape[0] - da, :best.shape[1] - dr, :budget + 1 - item.salary]
+            target = best[da:, dr:, item.salary:]
+            gain = source + item.surplus
+            improved = gain > target
+            taken[i, da:, dr:, item.salary:] = improved
+            # gain was computed from the table before this item, so it is used once
+            np.copyto(target, np.maximum(target, gain))
+        
+        # Total-keeper cap on the final table
+        active_counts = np.arange(self.max_active + 1)[:, None, None]
+        reserve_counts = np.arange(self.max_reserve + 1)[None, :, None]
+        final = np.where(active_counts + reserve_counts <= self.max_total, best, -np.inf)
+        a, r, s = np.unravel_index(int(np.argmax(final)), final.shape)
+        
+        chosen = []
+        for i in range(len(items) - 1, -1, -1):
+            if taken[i, a, r, s]:
+                item = items[i]
+                chosen.append(item)
+                a, r, s = (a, r - 1, s - item.salary) if item.reserve else (a - 1, r, s - item.salary)
+        chosen.reverse()
+        
+        return {
+            'keepers': [k._asdict() for k in chosen],
+            'active': sum(1 for k in chosen if not k.reserve),
+            'reserve': sum(1 for k in chosen if k.reserve),
+            'salary': sum(k.salary for k in chosen),
+            'surplus': round(sum(k.surplus for k in chosen), 1),
+        }
+    
+    def freeze_report(self, rows: Iterable, overrides: Optional[Dict[int, List[KeeperCandidate]]] = None) -> List[Dict]:
+        """
+        Validate and optimize every team from one pass over its contracts
+        
+        Args:
+            rows: Query rows with team_id, team_name, player_id, player_name,
+                salary, value and reserve (contract columns None for teams
+                without contracts)
+            overrides: team_id -> keeper list to use instead (what-ifs)
+        
+        Returns:
+            One dictionary per team with `validation` and `optimal`
+        """
+        overrides = overrides or {}
+        teams = {}
+        for row in rows:
+            name, keepers = teams.setdefault(row.team_id, (row.team_name, []))
+            if row.player_id is not None:
+                keepers.append(KeeperCandidate(
+                    row.player_id, row.player_name, row.salary, float(row.value or 0), bool(row.reserve)
+                ))
+        
+        report = []
+        for team_id, (team_name, keepers) in teams.items():
+            keepers = overrides.get(team_id, keepers)
+            report.append({
+                'team_id': team_id,
+                'team_name': team_name,
+                'validation': self.validate(keepers),
+                'optimal': self.optimize(keepers),
+            })
+        return report
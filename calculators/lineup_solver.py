@@ -0,0 +1,179 @@
+"""
+Lineup Slot Solver for JuniorLeague
+Assigns rostered players to POSITIONS slots, including the flex slots
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from config.league_settings import POSITIONS
+from calculators.valuation_calculator import FLEX_SLOTS, PITCHER_POSITIONS
+
+# Sheet and roster labels that map onto POSITIONS codes
+POSITION_ALIASES = {
+    'LF': 'OF', 'CF': 'OF', 'RF': 'OF',
+    'SP': 'P', 'RP': 'P',
+    'MI': 'MIF', 'CI': 'CO',
+    'U': 'DH', 'UT': 'DH', 'UTIL': 'DH',
+}
+
+# Positions a player can be bought for, as reported by buyable_positions
+BUYABLE_POSITIONS = ('C', '1B', '2B', 'SS', '3B', 'OF', 'DH', 'P')
+
+
+def eligible_slots(position: Optional[str], positions: Dict[str, int] = None) -> Tuple[str, ...]:
+    """
+    Slots a player can fill, most specific first
+    
+    "2B/SS" -> ('2B', 'SS', 'MIF', 'DH'). Pitchers only fill P. Hitters
+    with no listed position are treated as DH-only.
+    """
+    positions = positions or POSITIONS
+    codes = re.findall(r'[A-Z0-9]+', (position or '').upper())
+    codes = [POSITION_ALIASES.get(code, code) for code in codes]
+    
+    if codes and all(code in PITCHER_POSITIONS for code in codes):
+        return ('P',) if 'P' in positions else ()
+    
+    slots = []
+    for code in codes:
+        if code in positions and code not in slots and code not in PITCHER_POSITIONS:
+            slots.append(code)
+    for flex, allowed in FLEX_SLOTS.items():
+        if flex in positions and flex not in slots and (allowed is None or allowed & set(codes)):
+            slots.append(flex)
+    # DH is listed last so it stays open for anyone
+    if 'DH' in slots:
+        slots.remove('DH')
+        slots.append('DH')
+    return tuple(slots)
+
+
+class LineupSolver:
+    """
+    Incremental bipartite matching of one team's players to slots
+    
+    Slots of the same type are pooled with a capacity, so each add is a
+    single augmenting-path search over at most a dozen slot types. Players
+    who cannot be placed sit on the bench until a removal frees a slot.
+    """
+    
+    def __init__(self, positions: Dict[str, int] = None):
+        self.capacity = dict(positions or POSITIONS)
+        self.members: Dict[str, Set[int]] = {slot: set() for slot in self.capacity}
+        self.assigned: Dict[int, str] = {}
+        self.eligibility: Dict[int, Tuple[str, ...]] = {}
+        self.bench: List[int] = []
+    
+    def __len__(self):
+        return len(self.eligibility)
+    
+    def add(self, player_id: int, position: Optional[str]) -> Optional[str]:
+        """
+        Add a player and re-solve
+        
+        Returns:
+            The slot the player landed in, or None if they are benched
+        """
+        if player_id in self.eligibility:
+            self.remove(player_id)
+        self.eligibility[player_id] = eligible_slots(position, self.capacity)
+        if self._place(player_id):
+            return self.assigned[player_id]
+        self.bench.append(player_id)
+        return None
+    
+    def remove(self, player_id: int):
+        """Remove a player; a freed slot is offered to the bench"""
+        if player_id not in self.eligibility:
+            return
+        del self.eligibility[player_id]
+        if player_id in self.bench:
+            self.bench.remove(player_id)
+            return
+        
+        self.members[self.assigned.pop(player_id)].discard(player_id)
+        for benched in self.bench:
+            if self._place(benched):
+                self.bench.remove(benched)
+                break
+    
+    def _place(self, player_id: int) -> bool:
+        slot = self._augment(self.eligibility[player_id], set())
+        if slot is None:
+            return False
+        self.members[slot].add(player_id)
+        self.assigned[player_id] = slot
+        return True
+    
+    def _augment(self, slots: Iterable[str], visited: Set[str]) -> Optional[str]:
+        """
+        Find a slot for a player eligible for `slots`, moving others if needed
+        
+        Returns the slot freed for the caller; players moved along the
+        augmenting path are reassigned here.
+        """
+        for slot in slots:
+            if len(self.members[slot]) < self.capacity[slot]:
+                return slot
+        for slot in slots:
+            if slot in visited:
+                continue
+            visited.add(slot)
+            for other in list(self.members[slot]):
+                target = self._augment(self.eligibility[other], visited)
+                if target is not None:
+                    self.members[slot].discard(other)
+                    self.members[target].add(other)
+                    self.assigned[other] = target
+                    return slot
+        return None
+    
+    def open_slots(self) -> Dict[str, int]:
+        """Unfilled slots by type"""
+        return {
+            slot: self.capacity[slot] - len(players)
+            for slot, players in self.members.items()
+            if len(players) < self.capacity[slot]
+        }
+    
+    def _reachable_slots(self) -> Set[str]:
+        """
+        Slot types a new player could take, directly or by shifting others
+        
+        A slot is reachable if it has room, or if someone in it is also
+        eligible for a reachable slot.
+        """
+        reachable = set(self.open_slots())
+        changed = True
+        while changed:
+            changed = False
+            for slot, players in self.members.items():
+                if slot in reachable:
+                    continue
+                if any(reachable.intersection(self.eligibility[p]) for p in players):
+                    reachable.add(slot)
+                    changed = True
+        return reachable
+    
+    def can_add(self, position: Optional[str]) -> bool:
+        """Whether a player at `position` would get a slot"""
+        return bool(self._reachable_slots().intersection(eligible_slots(position, self.capacity)))
+    
+    def buyable_positions(self) -> List[str]:
+        """Positions the team can still legally buy"""
+        reachable = self._reachable_slots()
+        return [
+            position for position in BUYABLE_POSITIONS
+            if reachable.intersection(eligible_slots(position, self.capacity))
+        ]
+    
+    def lineup(self) -> Dict[str, List[int]]:
+        """Player ids by slot type"""
+        return {slot: sorted(players) for slot, players in self.members.items()}
+    
+    def summary(self) -> Dict:
+        return {
+            'filled': len(self.assigned),
+            'open_slots': self.open_slots(),
+            'bench': list(self.bench),
+            'buyable_positions': self.buyable_positions(),
+        }
@@ -0,0 +1,238 @@
+"""
+Price Distribution Model for JuniorLeague
+Empirical auction price distributions by position and salary tier
+"""
+import math
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+
+# Tiers per position and season, by salary rank: 0 is the top quarter
+NUM_TIERS = 4
+
+# Group keys: ALL_TIERS pools a position's tiers, ALL_POSITIONS pools positions
+ALL_TIERS = -1
+ALL_POSITIONS = '*'
+
+# Percentiles stored per group (0, 1, ..., 100)
+PERCENTILES = np.arange(101)
+
+# Smallest KDE bandwidth, in dollars
+MIN_BANDWIDTH = 1.0
+
+
+def normalize_position(position: Optional[str]) -> str:
+    """Sheet positions are short codes like "C", "MI", "OF", "P"; blank pools with all"""
+    position = (position or '').strip().upper()
+    return position or ALL_POSITIONS
+
+
+def salary_tiers(years, positions, salaries, num_tiers: int = NUM_TIERS) -> np.ndarray:
+    """
+    Rank tier of each row within its (season, position)
+    
+    Rows are ranked by salary, highest first, and split into `num_tiers`
+    equal-sized bands.
+    """
+    years = np.asarray(years)
+    positions = np.asarray(positions)
+    salaries = np.asarray(salaries, dtype=float)
+    tiers = np.zeros(len(salaries), dtype=np.int64)
+    
+    order = np.lexsort((-salaries, positions, years))
+    keys = list(zip(years[order], positions[order]))
+    start = 0
+    for end in range(1, len(order) + 1):
+        if end == len(order) or keys[end] != keys[start]:
+            size = end - start
+            ranks = np.arange(size)
+            tiers[order[start:end]] = np.minimum(ranks * num_tiers // size, num_tiers - 1)
+            start = end
+    return tiers
+
+
+def _weighted_quantiles(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    order = np.argsort(values, kind='stable')
+    values = values[order]
+    weights = weights[order]
+    cumulative = np.cumsum(weights)
+    # Midpoint plotting positions, so equal weights match np.percentile's spread
+    positions = (cumulative - 0.5 * weights) / cumulative[-1] * 100
+    return np.interp(PERCENTILES, positions, values)
+
+
+def _weighted_kde(values: np.ndarray, weights: np.ndarray, grid: np.ndarray) -> np.ndarray:
+    total = weights.sum()
+    mean = (values * weights).sum() / total
+    std = math.sqrt(((values - mean) ** 2 * weights).sum() / total)
+    effective_n = total ** 2 / (weights ** 2).sum()
+    bandwidth = max(1.06 * std * effective_n ** -0.2, MIN_BANDWIDTH)
+    
+    z = (grid[:, None] - values[None, :]) / bandwidth
+    density = (np.exp(-0.5 * z * z) * weights).sum(axis=1)
+    return density / (total * bandwidth * math.sqrt(2 * math.pi))
+
+
+class PriceModel:
+    """
+    Quantiles and a smoothed density of past auction prices per group
+    
+    Groups are (position, tier), plus each position across all tiers and
+    each tier across all positions. Lookups are dictionary hits followed
+    by an interpolation in a 101-point quantile table.
+    """
+    
+    def __init__(self, keys, quantiles, density, grid, counts, fingerprint: str = '',
+                 half_life: Optional[float] = None):
+        self.keys = [tuple(key) for key in keys]
+        self.quantiles = np.asarray(quantiles, dtype=float)
+        self.density = np.asarray(density, dtype=float)
+        self.grid = np.asarray(grid, dtype=float)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.fingerprint = fingerprint
+        self.half_life = half_life
+        self._index = {key: i for i, key in enumerate(self.keys)}
+        # Per-group median, used to place a price in a tier
+        self._medians: Dict[str, Dict[int, float]] = {}
+        for (position, tier), row in self._index.items():
+            if tier != ALL_TIERS:
+                self._medians.setdefault(position, {})[tier] = float(self.quantiles[row, 50])
+    
+    @classmethod
+    def build(
+        cls,
+        rows: Iterable[Tuple[int, Optional[str], int]],
+        half_life: Optional[float] = None,
+        num_tiers: int = NUM_TIERS,
+        fingerprint: str = ''
+    ) -> 'PriceModel':
+        """
+        Args:
+            rows: (year, position, salary) for every HistoricalAuction row
+            half_life: Seasons for a price's weight to halve; None weights
+                every season equally
+            num_tiers: Salary tiers per position and season
+        """
+        rows = list(rows)
+        years = np.array([row[0] for row in rows], dtype=np.int64)
+        positions = np.array([normalize_position(row[1]) for row in rows], dtype=object)
+        salaries = np.array([row[2] for row in rows], dtype=float)
+        
+        if len(rows):
+            tiers = salary_tiers(years, positions, salaries, num_tiers)
+            weights = np.ones(len(rows)) if not half_life else 0.5 ** ((years.max() - years) / half_life)
+            grid = np.arange(0, salaries.max() + 1)
+        else:
+            tiers = weights = np.zeros(0)
+            grid = np.zeros(1)
+        
+        groups = {}
+        for i, (position, tier) in enumerate(zip(positions, tiers)):
+            for key in ((position, int(tier)), (position, ALL_TIERS),
+                        (ALL_POSITIONS, int(tier)), (ALL_POSITIONS, ALL_TIERS)):
+                groups.setdefault(key, []).append(i)
+        
+        keys = sorted(groups, key=lambda key: (key[0] != ALL_POSITIONS, key))
+        quantiles = np.zeros((len(keys), len(PERCENTILES)))
+        density = np.zeros((len(keys), len(grid)))
+        counts = np.zeros(len(keys), dtype=np.int64)
+        for row, key in enumerate(keys):
+            members = np.array(groups[key])
+            quantiles[row] = _weighted_quantiles(salaries[members], weights[members])
+            density[row] = _weighted_kde(salaries[members], weights[members], grid)
+            counts[row] = len(members)
+        
+        return cls(keys, quantiles, density, grid, counts, fingerprint, half_life)
+    
+    def save(self, path: str):
+        """Write the model as a compressed .npz artifact"""
+        np.savez_compressed(
+            path,
+            positions=np.array([key[0] for key in self.keys], dtype=str),
+            tiers=np.array([key[1] for key in self.keys], dtype=np.int64),
+            quantiles=self.quantiles.astype(np.float32),
+            density=self.density.astype(np.float32),
+            grid=self.grid,
+            counts=self.counts,
+            fingerprint=np.array(self.fingerprint),
+            half_life=np.array(np.nan if self.half_life is None else self.half_life),
+        )
+    
+    @classmethod
+    def load(cls, path: str) -> 'PriceModel':
+        with np.load(path, allow_pickle=False) as data:
+            half_life = float(data['half_life'])
+            return cls(
+                zip(data['positions'].tolist(), data['tiers'].tolist()),
+                data['quantiles'],
+                data['density'],
+                data['grid'],
+                data['counts'],
+                str(data['fingerprint']),
+                None if math.isnan(half_life) else half_life,
+            )
+    
+    def group_position(self, position: Optional[str]) -> str:
+        """Position group used for lookups: the position itself, or ALL_POSITIONS if unseen"""
+        position = normalize_position(position)
+        return position if position in self._medians else ALL_POSITIONS
+    
+    def _row(self, position: Optional[str], tier: int = ALL_TIERS) -> Optional[int]:
+        return self._index.get((self.group_position(position), tier))
+    
+    def percentile(self, position: Optional[str], p: float, tier: int = ALL_TIERS) -> Optional[float]:
+        """Price at percentile `p` (0-100); unknown positions use the league-wide group"""
+        row = self._row(position, tier)
+        if row is None:
+            return None
+        p = min(max(p, 0.0), 100.0)
+        low = min(int(p), 99)
+        table = self.quantiles[row]
+        return float(table[low] + (table[low + 1] - table[low]) * (p - low))
+    
+    def percentile_of(self, position: Optional[str], price: float, tier: int = ALL_TIERS) -> Optional[float]:
+        """Percentile (0-100) of a price within a group"""
+        row = self._row(position, tier)
+        if row is None:
+            return None
+        return float(np.interp(price, self.quantiles[row], PERCENTILES))
+    
+    def tier_for_price(self, position: Optional[str], price: float) -> int:
+        """Tier whose median price is closest to `price`"""
+        medians = self._medians.get(self.group_position(position))
+        if not medians:
+            return ALL_TIERS
+        return min(medians, key=lambda tier: abs(medians[tier] - price))
+    
+    def tiers_for_prices(self, position: Optional[str], prices) -> np.ndarray:
+        """`tier_for_price` for an array of prices in one position group"""
+        prices = np.asarray(prices, dtype=float)
+        medians = self._medians.get(self.group_position(position))
+        if not medians:
+            return np.full(len(prices), ALL_TIERS, dtype=np.int64)
+        tiers = np.fromiter(medians, dtype=np.int64)
+        centers = np.fromiter(medians.values(), dtype=float)
+        # argmin keeps the first of equally close tiers, as min() does
+        return tiers[np.abs(centers[None, :] - prices[:, None]).argmin(axis=1)]
+    
+    def lowest_tier(self, position: Optional[str]) -> int:
+        """Cheapest tier of a position"""
+        medians = self._medians.get(self.group_position(position))
+        return max(medians) if medians else ALL_TIERS
+    
+    def distribution(self, position: Optional[str], tier: int = ALL_TIERS) -> Optional[Dict]:
+        """Summary of one group: count, key quantiles and the smoothed density"""
+        row = self._row(position, tier)
+        if row is None:
+            return None
+        position, tier = self.keys[row]
+        table = self.quantiles[row]
+        return {
+            'position': position,
+            'tier': tier,
+            'count': int(self.counts[row]),
+            'quantiles': {str(p): round(float(table[p]), 2) for p in (5, 10, 25, 50, 75, 90, 95)},
+            'density': {
+                'grid': self.grid.tolist(),
+                'values': [round(float(v), 5) for v in self.density[row]],
+            },
+        }
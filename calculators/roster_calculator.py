@@ -2,7 +2,8 @@
 Roster Calculator for JuniorLeague
 Manages team rosters, salary caps, and contract tracking
 """
-from typing import List, Dict
+from collections import Counter
+from typing import Iterable, List, Dict, Optional, Tuple
 from datetime import datetime
 
 
@@ -23,40 +24,76 @@ class RosterCalculator:
         Returns:
             Dictionary with team roster info
         """
-        total_salary = sum(c.salary for c in contracts)
-        remaining_budget = self.LEAGUE_BUDGET - total_salary
+        # Pair each contract with its own player, not by list position
+        players_by_id = {p.id: p for p in players}
+        entries = []
+        for contract in contracts:
+            player = players_by_id.get(contract.player_id) or contract.player
+            entries.append((player.name, player.position, contract.salary,
+                            contract.contract_type, contract.years_remaining))
+        
+        roster_info = self._roster_summary(team.name, team.owner, entries)
+        roster_info['roster_size'] = len(players)
+        return roster_info
+    
+    def summarize_league(self, rows: Iterable) -> List[Dict]:
+        """
+        Roster info for every team from one joined query
+        
+        Args:
+            rows: Team LEFT JOIN Contract LEFT JOIN Player rows with team_id,
+                team_name, owner, player_name, position, salary,
+                contract_type and years_remaining (contract columns are
+                None for teams without contracts)
         
-        # Count contract types
-        keeper_count = sum(1 for c in contracts if c.contract_type == 'auction_keeper')
-        in_season_count = sum(1 for c in contracts if c.contract_type == 'in_season')
-        rotation_count = sum(1 for c in contracts if c.contract_type == 'rotation')
+        Returns:
+            List of dictionaries shaped like `calculate_team_info`, one per team
+        """
+        teams = {}
+        for row in rows:
+            team = teams.setdefault(row.team_id, (row.team_name, row.owner, []))
+            if row.salary is not None:
+                team[2].append((row.player_name, row.position, row.salary,
+                                row.contract_type, row.years_remaining))
+        
+        summaries = []
+        for team_id, (team_name, owner, entries) in teams.items():
+            roster_info = self._roster_summary(team_name, owner, entries)
+            roster_info['team_id'] = team_id
+            roster_info['roster_size'] = len(entries)
+            summaries.append(roster_info)
+        return summaries
+    
+    def _roster_summary(self, team_name: str, owner: str, entries: List[Tuple]) -> Dict:
+        """Totals, contract breakdown and player list from (name, position, salary, type, years) entries"""
+        total_salary = sum(entry[2] for entry in entries)
+        remaining_budget = self.LEAGUE_BUDGET - total_salary
+        by_type = Counter(entry[3] for entry in entries)
         
-        roster_info = {
-            'team_name': team.name,
-            'owner': team.owner,
+        return {
+            'team_name': team_name,
+            'owner': owner,
             'total_salary': total_salary,
             'remaining_budget': remaining_budget,
             'budget_percentage_used': (total_salary / self.LEAGUE_BUDGET) * 100,
-            'roster_size': len(players),
+            'roster_size': len(entries),
             'contract_breakdown': {
-                'keepers': keeper_count,
-                'in_season': in_season_count,
-                'rotation': rotation_count
+                'keepers': by_type['auction_keeper'],
+                'in_season': by_type['in_season'],
+                'rotation': by_type['rotation'],
+                'by_type': dict(by_type)
             },
-            'players': []
+            'players': [
+                {
+                    'name': name,
+                    'position': position,
+                    'salary': salary,
+                    'contract_type': contract_type,
+                    'years_remaining': years_remaining
+                }
+                for name, position, salary, contract_type, years_remaining in entries
+            ]
         }
-        
-        # Add player details
-        for player, contract in zip(players, contracts):
-            roster_info['players'].append({
-                'name': player.name,
-                'position': player.position,
-                'salary': contract.salary,
-                'contract_type': contract.contract_type,
-                'years_remaining': contract.years_remaining
-            })
-        
-        return roster_info
     
     def calculate_remaining_auction_budget(self, team, contracts: List) -> Dict:
         """
@@ -99,8 +136,12 @@ class RosterCalculator:
             Dictionary with validation results
         """
         total_current = sum(c.salary for c in existing_contracts)
-        total_with_new = total_current + proposed_salary
-        
+        roster_team = player.roster_team.name if player.roster_team else None
+        return self._add_checks(team.id, total_current + proposed_salary, player.roster_team_id, roster_team)
+    
+    def _add_checks(self, team_id: int, total_with_new: int, roster_team_id: Optional[int],
+                    roster_team_name: Optional[str]) -> Dict:
+        """Budget and roster rules shared by single and batch validation"""
         validation = {
             'valid': True,
             'reasons': []
@@ -114,14 +155,47 @@ class RosterCalculator:
             )
         
         # Check if player already on roster
-        if player.roster_team_id and player.roster_team_id != team.id:
+        if roster_team_id and roster_team_id != team_id:
             validation['valid'] = False
             validation['reasons'].append(
-                f"Player is on {player.team.name}'s roster"
+                f"Player is on {roster_team_name}'s roster"
             )
         
         return validation
     
+    def validate_roster_adds(
+        self,
+        adds: Iterable[Tuple[int, int, int, int]],
+        committed: Dict[Tuple[int, int], int],
+        roster_teams: Dict[int, Optional[int]],
+        team_names: Dict[int, str]
+    ) -> List[Dict]:
+        """
+        `validate_roster_add` for a batch of contracts, in order
+        
+        Each accepted contract counts against its team's budget for the
+        rows after it; rejected ones do not.
+        
+        Args:
+            adds: (player_id, team_id, year, salary) per contract
+            committed: (team_id, year) -> salary already under contract
+            roster_teams: player_id -> roster_team_id
+            team_names: team_id -> name
+        
+        Returns:
+            One validation dictionary per contract
+        """
+        totals = dict(committed)
+        validations = []
+        for player_id, team_id, year, salary in adds:
+            roster_team_id = roster_teams.get(player_id)
+            total_with_new = totals.get((team_id, year), 0) + salary
+            validation = self._add_checks(team_id, total_with_new, roster_team_id, team_names.get(roster_team_id))
+            if validation['valid']:
+                totals[(team_id, year)] = total_with_new
+            validations.append(validation)
+        return validations
+    
     def get_contract_timeline(self, contracts: List) -> List[Dict]:
         """
         Get contract timeline showing when contracts expire
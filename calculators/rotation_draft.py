@@ -0,0 +1,172 @@
+"""
+Rotation Draft Engine for JuniorLeague
+Pick order, round salaries and Monte Carlo pick values for the rotation draft
+"""
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence
+import numpy as np
+from config.league_settings import ROTATION_DRAFT, ROTATION_SALARIES
+
+# Drafts per worker task; fixed so results don't depend on the worker count
+CHUNK_DRAFTS = 250
+
+# Spread of owners' opinions of a player, as a fraction of projected value
+DEFAULT_NOISE = 0.25
+
+
+class Pick(NamedTuple):
+    """One slot in the rotation draft"""
+    overall: int  # 1-based
+    round: int
+    pick: int  # Pick within the round, 1-based
+    team_id: int
+    salary: int
+
+
+def parse_draft_order(order: str = ROTATION_DRAFT['order']) -> List[int]:
+    """Finishing places in pick order: "5th, 6th, ..., 1st" -> [5, 6, ..., 1]"""
+    return [int(place) for place in re.findall(r'(\d+)(?:st|nd|rd|th)', order)]
+
+
+def round_salary(round_number: int) -> Optional[int]:
+    """Contract salary for a rotation pick in `round_number`"""
+    return ROTATION_SALARIES.get(round_number)
+
+
+def pick_order(standings: Sequence[int], rounds: int = ROTATION_DRAFT['total_rounds'],
+               order: str = ROTATION_DRAFT['order']) -> List[Pick]:
+    """
+    Every pick of the draft
+    
+    Args:
+        standings: team_ids in last season's finishing order, champion first
+        rounds: Number of rounds
+    
+    Returns:
+        Picks in draft order; each round follows the same order of places
+    """
+    places = parse_draft_order(order)
+    if len(places) != len(standings):
+        raise ValueError(f"Draft order has {len(places)} places but {len(standings)} teams were given")
+    round_teams = [standings[place - 1] for place in places]
+    
+    picks = []
+    for round_number in range(1, rounds + 1):
+        for pick_number, team_id in enumerate(round_teams, 1):
+            picks.append(Pick(len(picks) + 1, round_number, pick_number, team_id, round_salary(round_number)))
+    return picks
+
+
+def _simulate_chunk(args) -> Dict[str, np.ndarray]:
+    """Run a chunk of drafts with its own seed (worker entry point)"""
+    values, noise, pick_teams, drafts, seed = args
+    rng = np.random.default_rng(seed)
+    num_teams = int(pick_teams.max()) + 1
+    num_picks = len(pick_teams)
+    n = len(values)
+    
+    value_sum = np.zeros(num_picks)
+    value_sq_sum = np.zeros(num_picks)
+    perceived = np.empty((num_teams, n))
+    taken = np.zeros(n, dtype=bool)
+    cursor = np.zeros(num_teams, dtype=np.int64)
+    
+    for _ in range(drafts):
+        # Each owner's board: projected value plus their own opinion
+        rng.standard_normal(out=perceived)
+        perceived *= noise
+        perceived += values
+        boards = np.argsort(-perceived, axis=1)
+        taken.fill(False)
+        cursor.fill(0)
+        
+        for pick, team in enumerate(pick_teams):
+            board = boards[team]
+            position = cursor[team]
+            while position < n and taken[board[position]]:
+                position += 1
+            if position == n:
+                break  # Pool exhausted
+            player = board[position]
+            taken[player] = True
+            cursor[team] = position + 1
+            value_sum[pick] += values[player]
+            value_sq_sum[pick] += values[player] ** 2
+    
+    return {'value_sum': value_sum, 'value_sq_sum': value_sq_sum}
+
+
+class RotationDraftSimulator:
+    """
+    Monte Carlo rotation drafts over precomputed player arrays
+    
+    Owners draft the best available player on their own board, which is
+    each player's projected value plus owner-specific noise. A pick's
+    surplus is the projected value of the player taken minus the round
+    salary.
+    """
+    
+    def __init__(self, noise: float = DEFAULT_NOISE):
+        self.noise = noise
+    
+    def run(
+        self,
+        picks: List[Pick],
+        player_ids: Sequence[int],
+        values: Sequence[float],
+        drafts: int = 10000,
+        seed: int = 0,
+        workers: Optional[int] = None
+    ) -> Dict:
+        """
+        Simulate `drafts` drafts across a process pool
+        
+        Results are reproducible for a given seed and draft count, whatever
+        the number of workers.
+        
+        Returns:
+            Dictionary with expected value and surplus per pick and
+            expected surplus per team
+        """
+        values = np.asarray(values, dtype=float)
+        noise = np.maximum(np.abs(values) * self.noise, 1.0)
+        team_ids = sorted({pick.team_id for pick in picks})
+        team_index = {team_id: i for i, team_id in enumerate(team_ids)}
+        pick_teams = np.array([team_index[pick.team_id] for pick in picks], dtype=np.int64)
+        
+        chunks = [CHUNK_DRAFTS] * (drafts // CHUNK_DRAFTS)
+        if drafts % CHUNK_DRAFTS:
+            chunks.append(drafts % CHUNK_DRAFTS)
+        seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+        tasks = [(values, noise, pick_teams, chunk, chunk_seed) for chunk, chunk_seed in zip(chunks, seeds)]
+        
+        if workers == 1:
+            results = list(map(_simulate_chunk, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_simulate_chunk, tasks))
+        
+        value_sum = sum(r['value_sum'] for r in results)
+        value_sq_sum = sum(r['value_sq_sum'] for r in results)
+        expected = value_sum / drafts
+        spread = np.sqrt(np.maximum(value_sq_sum / drafts - expected ** 2, 0.0))
+        salaries = np.array([pick.salary or 0 for pick in picks], dtype=float)
+        surplus = expected - salaries
+        
+        team_surplus = {team_id: 0.0 for team_id in team_ids}
+        for pick, pick_surplus in zip(picks, surplus):
+            team_surplus[pick.team_id] += float(pick_surplus)
+        
+        return {
+            'drafts': drafts,
+            'pool_size': len(player_ids),
+            'picks': [
+                dict(pick._asdict(),
+                     expected_value=round(float(expected[i]), 2),
+                     value_std=round(float(spread[i]), 2),
+                     expected_surplus=round(float(surplus[i]), 2))
+                for i, pick in enumerate(picks)
+            ],
+            'team_surplus': {team_id: round(total, 2) for team_id, total in team_surplus.items()},
+        }
@@ -0,0 +1,249 @@
+"""
+Valuation Calculator for JuniorLeague
+Converts projected stats into auction dollar values for the whole player pool
+"""
+import re
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from config.league_settings import (
+    AUCTION_RULES, BUDGET, HITTING_CATEGORIES, NUM_TEAMS, PITCHING_CATEGORIES, POSITIONS, ROSTER_SIZE
+)
+
+# Rate stats and the playing-time column that weights them
+RATE_STATS = {'OBP': 'PA', 'ERA': 'IP', 'WHIP': 'IP'}
+# Rate stats where lower is better
+LOWER_IS_BETTER = {'ERA', 'WHIP'}
+# Innings are per 9 for ERA, per inning for WHIP
+RATE_SCALE = {'OBP': 1.0, 'ERA': 1.0 / 9, 'WHIP': 1.0}
+
+# ProjectedStats columns feeding each category
+PROJECTION_COLUMNS = {
+    'OBP': 'projected_obp',
+    'R': 'projected_runs',
+    'HR': 'projected_home_runs',
+    'RBI': 'projected_rbis',
+    'SB': 'projected_stolen_bases',
+    'PA': 'projected_plate_appearances',
+    'ERA': 'projected_era',
+    'W': 'projected_wins',
+    'WHIP': 'projected_whip',
+    'K': 'projected_strikeouts',
+    'IP': 'projected_innings',
+}
+
+PITCHER_POSITIONS = {'P', 'SP', 'RP'}
+# Flex slots and the positions that can fill them (None = any hitter)
+FLEX_SLOTS = {'MIF': {'2B', 'SS'}, 'CO': {'1B', '3B'}, 'DH': None}
+
+
+def parse_positions(position: Optional[str]) -> List[str]:
+    """Split position strings like "2B/SS" or "Biggio (2B,OF)" into codes"""
+    if not position:
+        return []
+    codes = re.findall(r'[A-Z0-9]+', position.upper())
+    return [code for code in codes if code in POSITIONS or code in PITCHER_POSITIONS]
+
+
+def projections_frame(rows) -> pd.DataFrame:
+    """
+    Build the valuation input from (ProjectedStats, position) query rows
+    
+    SHOLDS is saves plus half a point per hold, as scored by the league.
+    """
+    records = []
+    for projection, position in rows:
+        record = {'player_id': projection.player_id, 'position': position}
+        for category, column in PROJECTION_COLUMNS.items():
+            record[category] = getattr(projection, column)
+        record['SHOLDS'] = (projection.projected_saves or 0) + 0.5 * (projection.projected_holds or 0)
+        records.append(record)
+    return pd.DataFrame(records, columns=['player_id', 'position', *PROJECTION_COLUMNS, 'SHOLDS'])
+
+
+class ValuationCalculator:
+    """
+    Category-based dollar values using z-scores over the rostered pool
+    
+    Counting stats are z-scored directly. Rate stats are converted to
+    marginal contributions first, (player rate - pool rate) x playing
+    time, so a .400 OBP in 100 PA counts for less than .380 in 650 PA.
+    Values above positional replacement level are then priced against
+    the league's total auction dollars.
+    """
+    
+    def __init__(
+        self,
+        num_teams: int = NUM_TEAMS,
+        budget: int = BUDGET,
+        positions: Dict[str, int] = None,
+        hitting_categories: List[str] = None,
+        pitching_categories: List[str] = None,
+        min_bid: int = AUCTION_RULES['minimum_bid'],
+        hitter_share: Optional[float] = None,
+        iterations: int = 3
+    ):
+        """
+        Args:
+            hitter_share: Fraction of auction dollars spent on hitters;
+                defaults to the hitters' share of roster slots
+            iterations: Passes used to settle the reference pool
+        """
+        self.num_teams = num_teams
+        self.budget = budget
+        self.positions = dict(positions or POSITIONS)
+        self.hitting_categories = list(hitting_categories or HITTING_CATEGORIES)
+        self.pitching_categories = list(pitching_categories or PITCHING_CATEGORIES)
+        self.min_bid = min_bid
+        self.iterations = iterations
+        
+        self.pitcher_slots = self.positions.get('P', 0)
+        self.hitter_slots = sum(n for pos, n in self.positions.items() if pos != 'P')
+        roster_size = self.hitter_slots + self.pitcher_slots or ROSTER_SIZE
+        self.hitter_share = hitter_share if hitter_share is not None else self.hitter_slots / roster_size
+    
+    def value_players(self, players: pd.DataFrame) -> pd.DataFrame:
+        """
+        Value every player in one pass
+        
+        Args:
+            players: One row per player with `player_id`, `position` and
+                the category columns (OBP, R, HR, RBI, SB, ERA, W, WHIP, K,
+                SHOLDS) plus PA for hitters and IP for pitchers
+        
+        Returns:
+            DataFrame indexed like `players` with a z-score column per
+            category, `total`, `replacement`, `par`, `slot` and `value` ($,
+            at least the minimum bid for drafted players and 0 otherwise)
+        """
+        players = players.copy()
+        eligible = players['position'].map(parse_positions)
+        is_pitcher = eligible.map(lambda codes: bool(codes) and set(codes) <= PITCHER_POSITIONS)
+        
+        hitters = self._value_group(
+            players[~is_pitcher], eligible[~is_pitcher], self.hitting_categories,
+            self.num_teams * self.hitter_slots, pitchers=False
+        )
+        pitchers = self._value_group(
+            players[is_pitcher], eligible[is_pitcher], self.pitching_categories,
+            self.num_teams * self.pitcher_slots, pitchers=True
+        )
+        
+        # Spendable dollars: everything above the $1-per-slot minimum
+        league_dollars = self.num_teams * self.budget
+        surplus = league_dollars - self.num_teams * (self.hitter_slots + self.pitcher_slots) * self.min_bid
+        self._price(hitters, surplus * self.hitter_share)
+        self._price(pitchers, surplus * (1 - self.hitter_share))
+        
+        return pd.concat([hitters, pitchers]).reindex(players.index)
+    
+    def _value_group(
+        self,
+        frame: pd.DataFrame,
+        eligible: pd.Series,
+        categories: List[str],
+        rostered: int,
+        pitchers: bool
+    ) -> pd.DataFrame:
+        result = pd.DataFrame(index=frame.index)
+        if frame.empty:
+            for col in (*categories, 'total', 'replacement', 'par', 'value'):
+                result[col] = pd.Series(dtype=float)
+            result['slot'] = pd.Series(dtype=object)
+            result['drafted'] = pd.Series(dtype=bool)
+            return result
+        
+        stats = {cat: frame[cat].to_numpy(dtype=float) if cat in frame else np.zeros(len(frame))
+                 for cat in categories}
+        stats = {cat: np.nan_to_num(values) for cat, values in stats.items()}
+        playing_time = {
+            col: np.nan_to_num(frame[col].to_numpy(dtype=float)) if col in frame else np.ones(len(frame))
+            for col in set(RATE_STATS.values())
+        }
+        
+        # Start from playing time, then re-rank on value until the pool settles
+        weight = playing_time['IP' if pitchers else 'PA']
+        pool = np.argsort(-weight, kind='stable')[:rostered]
+        z = np.zeros((len(categories), len(frame)))
+        for _ in range(max(1, self.iterations)):
+            for i, cat in enumerate(categories):
+                contribution = stats[cat]
+                if cat in RATE_STATS:
+                    time_played = playing_time[RATE_STATS[cat]] * RATE_SCALE[cat]
+                    pool_time = time_played[pool].sum()
+                    pool_rate = (stats[cat][pool] * time_played[pool]).sum() / pool_time if pool_time else 0.0
+                    contribution = (stats[cat] - pool_rate) * time_played
+                    if cat in LOWER_IS_BETTER:
+                        contribution = -contribution
+                mean = contribution[pool].mean()
+                std = contribution[pool].std()
+                z[i] = (contribution - mean) / std if std > 0 else 0.0
+            total = z.sum(axis=0)
+            pool = np.argsort(-total, kind='stable')[:rostered]
+        
+        for i, cat in enumerate(categories):
+            result[cat] = z[i]
+        result['total'] = total
+        
+        slots, replacement = self._assign_slots(total, eligible.tolist(), pitchers)
+        result['slot'] = slots
+        result['drafted'] = result['slot'].notna()
+        result['replacement'] = replacement
+        result['par'] = total - replacement
+        return result
+    
+    def _slot_capacity(self, pitchers: bool) -> Dict[str, int]:
+        if pitchers:
+            return {'P': self.num_teams * self.pitcher_slots}
+        return {pos: self.num_teams * n for pos, n in self.positions.items() if pos != 'P'}
+    
+    def _assign_slots(self, total: np.ndarray, eligible: List[List[str]], pitchers: bool):
+        """
+        Draft players greedily by value into position slots
+        
+        Dedicated slots fill before flex slots (MIF, CO, DH). Replacement
+        level for each position is the best undrafted player there, and
+        each player is measured against their most favourable position.
+        """
+        capacity = self._slot_capacity(pitchers)
+        order = np.argsort(-total, kind='stable')
+        slots = [None] * len(total)
+        
+        for idx in order:
+            codes = ['P'] if pitchers else [c for c in eligible[idx] if c not in PITCHER_POSITIONS]
+            candidates = [c for c in codes if capacity.get(c, 0) > 0]
+            if not candidates:
+                candidates = [
+                    flex for flex, allowed in FLEX_SLOTS.items()
+                    if capacity.get(flex, 0) > 0 and (allowed is None or allowed & set(codes))
+                ]
+            if candidates:
+                slots[idx] = candidates[0]
+                capacity[candidates[0]] -= 1
+        
+        # Best undrafted value at each position
+        best_undrafted = {}
+        for idx in order:
+            if slots[idx] is not None:
+                continue
+            codes = ['P'] if pitchers else (eligible[idx] or ['DH'])
+            for code in codes:
+                best_undrafted.setdefault(code, total[idx])
+        fallback = min(best_undrafted.values()) if best_undrafted else 0.0
+        
+        replacement = np.empty(len(total))
+        for idx in range(len(total)):
+            codes = ['P'] if pitchers else (eligible[idx] or ['DH'])
+            replacement[idx] = min(best_undrafted.get(code, fallback) for code in codes)
+        return slots, replacement
+    
+    def _price(self, group: pd.DataFrame, dollars: float):
+        if group.empty:
+            group['value'] = pd.Series(dtype=float)
+            return
+        par = group['par'].to_numpy()
+        drafted = group['drafted'].to_numpy()
+        positive = par[drafted & (par > 0)].sum()
+        dollars_per_point = dollars / positive if positive > 0 else 0.0
+        # Drafted players cost at least the minimum bid; undrafted ones are worth nothing
+        group['value'] = np.where(drafted, np.maximum(par, 0) * dollars_per_point + self.min_bid, 0.0)
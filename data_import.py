@@ -3,122 +3,17 @@ Data import utility for JuniorLeague historical auction data
 
 Handles the wide-format CSV files with team columns
 """
-import csv
-import re
+import time
 from typing import List, Dict, Tuple
-from models import db, Team, Player, Contract, HistoricalAuction
+from sqlalchemy import insert
+from models import db, Team, Player
+from player_index import PlayerNameIndex
+from league_csv import WideFormatCsv, AuctionRecord, extract_year_from_filename
+from import_manifest import apply_season_diff, file_digest, is_unchanged, record_import
 from app import app
 
-
-def extract_year_from_filename(filename: str) -> int:
-    """Extract year from filename like JuniorLeague2025.csv"""
-    match = re.search(r'(\d{4})', filename)
-    if match:
-        return int(match.group(1))
-    return None
-
-
-def parse_last_name(player_str: str) -> str:
-    """Extract last name from various formats"""
-    if not player_str or player_str.strip() == '':
-        return None
-    
-    # Handle "LastName, First" format
-    if ',' in player_str:
-        last, first = player_str.split(',', 1)
-        return last.strip()
-    
-    # Handle "FirstName LastName"
-    parts = player_str.strip().split()
-    if len(parts) > 1:
-        # Check if first part looks like a common first name
-        # Otherwise assume it's a last name (some cultures)
-        return parts[-1]  # Take the last part as surname
-    
-    return player_str.strip()
-
-
-def parse_wide_format_csv(filepath: str, year: int) -> List[Dict]:
-    """
-    Parse the wide-format JuniorLeague CSV
-    
-    Expected format:
-    - Row 0: Team names alternating with empty columns
-    - Row 1: Column headers (Position, Player, $, Player, $, ...)
-    - Row 2+: Data rows
-    - Last row: Totals (skip)
-    """
-    results = []
-    
-    with open(filepath, 'r', encoding='utf-8-sig') as f:
-        reader = csv.reader(f)
-        
-        # Read header rows
-        team_row = next(reader)
-        header_row = next(reader)
-        
-        # Extract team names from row 0
-        # Format: ,Team1,,Team2,,Team3,...
-        team_names = []
-        for i, cell in enumerate(team_row):
-            if cell and cell.strip() and cell.strip() not in ['Position', 'Player', '$']:
-                team_names.append(cell.strip())
-        
-        print(f"Extracted teams: {team_names}")
-        num_teams = len(team_names)
-        
-        # Process data rows
-        for row_idx, row in enumerate(reader):
-            # Skip empty rows and totals
-            if not row or row[0] == '':
-                continue
-            
-            # Skip totals row
-            if 'SPENT' in row[0]:
-                break
-            
-            position = row[0]
-            
-            # Process each team's data
-            # Format: Position, Player, $, Player, $, ...
-            # So skip index 0 (position), then process Player,$ pairs
-            team_col_idx = 1  # Start after position column
-            
-            for team_idx in range(num_teams):
-                if team_col_idx + 1 >= len(row):
-                    break
-                
-                player_name = row[team_col_idx]
-                salary_str = row[team_col_idx + 1]
-                team_col_idx += 2  # Move to next team pair
-                
-                # Skip if no player
-                if not player_name or player_name.strip() == '':
-                    continue
-                
-                try:
-                    salary = int(salary_str.strip())
-                except (ValueError, AttributeError):
-                    continue
-                
-                last_name = parse_last_name(player_name)
-                
-                if last_name:
-                    results.append({
-                        'year': year,
-                        'position': position,
-                        'player': player_name,
-                        'last_name': last_name,
-                        'salary': salary,
-                        'team_idx': team_idx,
-                    })
-        
-        # Store team names for reference
-        results.append({
-            'team_names': team_names,
-        })
-    
-    return results
+# Rows buffered before each bulk INSERT in bulk mode
+BULK_BATCH_SIZE = 500
 
 
 def get_or_create_team(team_name: str) -> Team:
@@ -132,14 +27,29 @@ def get_or_create_team(team_name: str) -> Team:
     return team
 
 
-def find_or_suggest_player(last_name: str, position: str, year: int) -> Tuple[Player, List[Player]]:
+def find_or_suggest_player(
+    last_name: str,
+    position: str,
+    year: int,
+    index: PlayerNameIndex = None,
+    player_str: str = None
+) -> Tuple[Player, List[Player]]:
     """
     Find existing player or return suggestions for disambiguation
     
+    Args:
+        index: Player id index for this import run; without one the
+            players table is scanned
+        player_str: Full CSV cell, used to rank suggestions by initial
+    
     Returns: (best_match or None, list of suggestions)
     """
-    # Simple exact match on last name
-    exact_matches = Player.query.filter(Player.name.ilike(f'%{last_name}%')).all()
+    if index is not None:
+        exact_matches = [db.session.get(Player, player_id)
+                         for player_id in index.candidates(last_name, player_str)]
+    else:
+        # Simple exact match on last name
+        exact_matches = Player.query.filter(Player.name.ilike(f'%{last_name}%')).all()
     
     if len(exact_matches) == 1:
         return exact_matches[0], []
@@ -151,58 +61,44 @@ def find_or_suggest_player(last_name: str, position: str, year: int) -> Tuple[Pl
     return None, []
 
 
-def import_csv_file(filepath: str, confirm_matches: bool = True):
+def import_csv_file(filepath: str, confirm_matches: bool = True, bulk: bool = False):
     """
     Import a single JuniorLeague CSV file
     
     Args:
         filepath: Path to CSV file
         confirm_matches: If True, will prompt for confirmation on ambiguous matches
+        bulk: If True, use the single-transaction bulk importer instead
     """
+    if bulk:
+        return bulk_import_csv_files([filepath])
+    
     year = extract_year_from_filename(filepath)
     if not year:
         print(f"Could not extract year from filename: {filepath}")
         return
     
+    content_hash = file_digest(filepath)
+    if is_unchanged(content_hash):
+        print(f"Skipping {filepath}: unchanged since last import")
+        return
+    
     print(f"\n{'='*60}")
     print(f"Importing {filepath} (Year: {year})")
     print(f"{'='*60}\n")
     
-    # Parse the CSV
-    data = parse_wide_format_csv(filepath, year)
+    # Parse the CSV, grouping records by team
+    team_players = {}
+    with WideFormatCsv(filepath, year) as sheet:
+        print(f"Found teams: {sheet.team_names}")
+        for record in sheet.records():
+            team_players.setdefault(record.team, []).append(record)
     
-    if not data:
+    if not team_players:
         print("No data found in file")
         return
     
-    # Extract team names from last item
-    team_names_raw = data[-1].get('team_names', [])
-    team_names = []
-    
-    # Fix team names - they may have extra columns
-    for name in team_names_raw[:10]:  # Should be 10 teams
-        if name and name.strip():
-            team_names.append(name.strip())
-    
-    print(f"Found teams: {team_names}")
-    print(f"Total records to import: {len(data) - 1}\n")  # -1 for team_names dict
-    
-    # Group by team
-    team_players = {}
-    for item in data[:-1]:  # Exclude team_names dict
-        if not isinstance(item, dict) or 'team_idx' not in item:
-            continue
-            
-        team_idx = item['team_idx']
-        if team_idx >= len(team_names):
-            continue
-            
-        team_name = team_names[team_idx]
-        
-        if team_name not in team_players:
-            team_players[team_name] = []
-        
-        team_players[team_name].append(item)
+    print(f"Total records to import: {sum(len(p) for p in team_players.values())}\n")
     
     # Import data
     import_stats = {
@@ -210,8 +106,15 @@ def import_csv_file(filepath: str, confirm_matches: bool = True):
         'matched_players': 0,
         'created_contracts': 0,
         'created_auctions': 0,
+        'updated_auctions': 0,
+        'removed_auctions': 0,
         'ambiguous': [],
     }
+    season_rows = []
+    unresolved_team_ids = set()
+    
+    # Loaded once; new players are added as they are created
+    player_index = PlayerNameIndex.load()
     
     for team_name, players in team_players.items():
         print(f"\nProcessing team: {team_name}")
@@ -220,13 +123,15 @@ def import_csv_file(filepath: str, confirm_matches: bool = True):
         team = get_or_create_team(team_name)
         
         for item in players:
-            last_name = item['last_name']
-            position = item['position']
-            salary = item['salary']
-            player_full = item['player']
+            last_name = item.last_name
+            position = item.position
+            salary = item.salary
+            player_full = item.player
             
             # Try to find or create player
-            player, suggestions = find_or_suggest_player(last_name, position, year)
+            player, suggestions = find_or_suggest_player(
+                last_name, position, year, index=player_index, player_str=player_full
+            )
             
             if player:
                 # Found exact match
@@ -244,37 +149,48 @@ def import_csv_file(filepath: str, confirm_matches: bool = True):
                     'suggestions': suggestions,
                 })
                 print(f"  ⚠ Ambiguous: {last_name} - {len(suggestions)} matches found - SKIPPING")
+                unresolved_team_ids.add(team.id)
                 continue  # Skip this record for now
             else:
                 # Create new player
                 player = Player(name=player_full, mlb_team='UNK')
                 db.session.add(player)
                 db.session.commit()
+                player_index.add(player.id, player.name)
                 import_stats['created_players'] += 1
                 print(f"  + Created: {player_full} ({last_name})")
             
-            # Create historical auction record
+            # Queue historical auction record
             if player:  # Double-check we have a valid player
-                auction = HistoricalAuction(
-                    player_id=player.id,
-                    team_id=team.id,
-                    year=year,
-                    salary=salary,
-                    contract_type='auction',  # Placeholder
-                )
-                db.session.add(auction)
-                import_stats['created_auctions'] += 1
+                season_rows.append((player.id, team.id, salary, position))
+    
+    # Write only the cells that differ from what the season already has
+    diff = apply_season_diff(year, season_rows, 'auction', unresolved_team_ids)
+    import_stats['created_auctions'] = diff['inserted']
+    import_stats['updated_auctions'] = diff['updated']
+    import_stats['removed_auctions'] = diff['removed']
+    if import_stats['ambiguous']:
+        # Left out of the manifest so the next run retries the skipped rows
+        print(f"Not recording {filepath} as imported: {len(import_stats['ambiguous'])} ambiguous row(s)")
+    else:
+        record_import(filepath, content_hash, year, len(season_rows))
     
     # Commit all changes
     db.session.commit()
     
-    # Print summary
+    print_import_summary(import_stats)
+
+
+def print_import_summary(import_stats: Dict):
+    """Print the summary and ambiguous-match report for an import run"""
     print(f"\n{'='*60}")
     print(f"Import Summary")
     print(f"{'='*60}")
     print(f"Created {import_stats['created_players']} new players")
     print(f"Matched {import_stats['matched_players']} existing players")
     print(f"Created {import_stats['created_auctions']} historical auction records")
+    print(f"Updated {import_stats['updated_auctions']} and removed "
+          f"{import_stats['removed_auctions']} historical auction records")
     print(f"Ambiguous matches: {len(import_stats['ambiguous'])}")
     
     if import_stats['ambiguous']:
@@ -287,6 +203,230 @@ def import_csv_file(filepath: str, confirm_matches: bool = True):
                 print(f"    {i}. {sug.name} (ID: {sug.id})")
 
 
+class _PlayerRef:
+    """A known or pending player; `id` is None until the player is inserted"""
+    __slots__ = ('id', 'name')
+    
+    def __init__(self, player_id, name):
+        self.id = player_id
+        self.name = name
+
+
+class BulkImporter:
+    """
+    Resolves teams and players in memory and writes rows in batches
+    
+    Everything runs inside the caller's transaction: nothing is committed
+    until `bulk_import_csv_files` has processed every file.
+    """
+    
+    def __init__(self, batch_size: int = BULK_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.teams = {name: team_id for team_id, name in db.session.query(Team.id, Team.name)}
+        self.players = PlayerNameIndex.from_rows(
+            (_PlayerRef(player_id, name), name)
+            for player_id, name in db.session.query(Player.id, Player.name)
+        )
+        self.pending_players = []
+        self.stats = {
+            'created_players': 0,
+            'matched_players': 0,
+            'created_contracts': 0,
+            'created_auctions': 0,
+            'updated_auctions': 0,
+            'removed_auctions': 0,
+            'ambiguous': [],
+        }
+    
+    def get_team_id(self, team_name: str) -> int:
+        """Get or create a team id without committing"""
+        team_id = self.teams.get(team_name)
+        if team_id is None:
+            team_id = db.session.execute(
+                insert(Team).returning(Team.id),
+                [{'name': team_name, 'owner': 'TBD'}]
+            ).scalar_one()
+            self.teams[team_name] = team_id
+        return team_id
+    
+    def add_file(self, records: List[AuctionRecord], year: int):
+        """Resolve the records of one parsed file and write the season diff"""
+        # Walk records team by team, in the same order as import_csv_file
+        team_players = {}
+        for item in records:
+            team_players.setdefault(item.team, []).append(item)
+        
+        resolved = []
+        unresolved_team_ids = set()
+        for team_name, items in team_players.items():
+            team_id = self.get_team_id(team_name)
+            if not self._resolve_team_records(items, team_name, team_id, year, resolved):
+                unresolved_team_ids.add(team_id)
+        
+        self.flush()
+        diff = apply_season_diff(
+            year,
+            ((ref.id, team_id, salary, position) for ref, team_id, salary, position in resolved),
+            'auction',  # Placeholder
+            unresolved_team_ids,
+            self.batch_size,
+        )
+        self.stats['created_auctions'] += diff['inserted']
+        self.stats['updated_auctions'] += diff['updated']
+        self.stats['removed_auctions'] += diff['removed']
+        return diff
+    
+    def _resolve_team_records(self, records: List[AuctionRecord], team_name: str,
+                              team_id: int, year: int, resolved: List) -> bool:
+        """Append (player ref, team_id, salary, position) per record; False if any were ambiguous"""
+        all_resolved = True
+        for item in records:
+            matches = self.players.candidates(item.last_name, item.player)
+            if len(matches) == 1:
+                ref = matches[0]
+                self.stats['matched_players'] += 1
+            elif matches:
+                self.stats['ambiguous'].append({
+                    'year': year,
+                    'team': team_name,
+                    'last_name': item.last_name,
+                    'full_name': item.player,
+                    'position': item.position,
+                    'salary': item.salary,
+                    'suggestions': matches,
+                })
+                all_resolved = False
+                continue
+            else:
+                ref = _PlayerRef(None, item.player)
+                self.players.add(ref, ref.name)
+                self.pending_players.append(ref)
+                self.stats['created_players'] += 1
+            
+            resolved.append((ref, team_id, item.salary, item.position))
+        return all_resolved
+    
+    def flush(self):
+        """Bulk insert buffered players in batches, assigning their ids"""
+        for start in range(0, len(self.pending_players), self.batch_size):
+            batch = self.pending_players[start:start + self.batch_size]
+            ids = db.session.scalars(
+                insert(Player).returning(Player.id, sort_by_parameter_order=True),
+                [{'name': ref.name, 'mlb_team': 'UNK'} for ref in batch]
+            ).all()
+            for ref, player_id in zip(batch, ids):
+                ref.id = player_id
+        self.pending_players = []
+
+
+def parse_season_file(filepath: str) -> Dict:
+    """
+    Parse one season CSV into a picklable dict for the bulk importer
+    
+    Safe to run in a worker process: it does not touch the database.
+    
+    Returns:
+        Dictionary with filepath, content_hash, year, team_names and records
+    """
+    year = extract_year_from_filename(filepath)
+    if not year:
+        raise ValueError(f"Could not extract year from filename: {filepath}")
+    
+    with WideFormatCsv(filepath, year) as sheet:
+        return {
+            'filepath': filepath,
+            'content_hash': file_digest(filepath),
+            'year': year,
+            'team_names': sheet.team_names,
+            'records': list(sheet.records()),
+        }
+
+
+def bulk_import_parsed(parsed_files, batch_size: int = BULK_BATCH_SIZE) -> Dict:
+    """
+    Write already-parsed season files in a single transaction
+    
+    Args:
+        parsed_files: Iterable of `parse_season_file` results, written in
+            the order given
+        batch_size: Rows buffered per bulk INSERT
+    
+    Returns:
+        Import stats dictionary, including rows per second
+    """
+    started = time.perf_counter()
+    importer = BulkImporter(batch_size)
+    rows = 0
+    completed = []
+    
+    try:
+        for parsed in parsed_files:
+            print(f"Importing {parsed['filepath']} (Year: {parsed['year']}): "
+                  f"{len(parsed['records'])} records")
+            ambiguous = len(importer.stats['ambiguous'])
+            importer.add_file(parsed['records'], parsed['year'])
+            if len(importer.stats['ambiguous']) == ambiguous:
+                completed.append(parsed)
+            else:
+                # Left out of the manifest so the next run retries the skipped rows
+                print(f"Not recording {parsed['filepath']} as imported: "
+                      f"{len(importer.stats['ambiguous']) - ambiguous} ambiguous row(s)")
+            rows += len(parsed['records'])
+        
+        importer.flush()
+        for parsed in completed:
+            record_import(parsed['filepath'], parsed['content_hash'],
+                          parsed['year'], len(parsed['records']))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    
+    elapsed = time.perf_counter() - started
+    stats = importer.stats
+    stats['rows'] = rows
+    stats['seconds'] = elapsed
+    stats['rows_per_second'] = rows / elapsed if elapsed > 0 else 0.0
+    
+    print_import_summary(stats)
+    print(f"\nBulk import: {rows} rows in {elapsed:.2f}s ({stats['rows_per_second']:.0f} rows/s)")
+    return stats
+
+
+def changed_files(filepaths: List[str]) -> List[str]:
+    """Drop files whose contents match the import manifest"""
+    changed = []
+    for filepath in filepaths:
+        if is_unchanged(file_digest(filepath)):
+            print(f"Skipping {filepath}: unchanged since last import")
+        else:
+            changed.append(filepath)
+    return changed
+
+
+def bulk_import_csv_files(filepaths: List[str], batch_size: int = BULK_BATCH_SIZE) -> Dict:
+    """
+    Import JuniorLeague CSV files in a single transaction
+    
+    Matching behaves like `import_csv_file`, but teams and players are
+    resolved in memory and rows are written with batched bulk inserts,
+    so a multi-season backfill costs one commit instead of one per new
+    team and player.
+    
+    Returns:
+        Import stats dictionary, including rows per second
+    """
+    def parsed_files():
+        for filepath in changed_files(filepaths):
+            # Parse fully before writing so a bad file doesn't leave partial rows
+            try:
+                yield parse_season_file(filepath)
+            except Exception as e:
+                print(f"\n⚠ Error parsing {filepath}: {e}\n")
+    
+    return bulk_import_parsed(parsed_files(), batch_size)
+
+
 if __name__ == '__main__':
     # Example usage
     with app.app_context():
@@ -0,0 +1,202 @@
+"""
+SQLite database profile, schema migration and query-plan check
+
+The profile sets per-connection pragmas (WAL journaling, synchronous,
+cache and mmap sizes, busy timeout) and the pool options passed to the
+engine. WAL lets readers keep reading while the auction writes, and the
+busy timeout makes writers wait for the lock rather than fail with
+"database is locked".
+
+Usage: python db_profile.py [migrate|check]
+"""
+import sys
+from typing import Dict, List
+from sqlalchemy import event, inspect, text
+from sqlalchemy.exc import OperationalError
+
+# Named profiles; SQLITE_PROFILE in the app config picks one
+PROFILES = {
+    'production': {
+        'pragmas': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',  # Safe with WAL; fsync at checkpoints only
+            'cache_size': -64000,  # KiB (negative), i.e. 64 MB
+            'mmap_size': 256 * 1024 * 1024,
+            'temp_store': 'MEMORY',
+            'busy_timeout': 5000,  # ms
+        },
+        'pool_size': 10,
+        'max_overflow': 10,
+        'pool_timeout': 10,
+    },
+    # SQLite defaults (rollback journal), e.g. for a database on a network share
+    'default': {
+        'pragmas': {'busy_timeout': 5000},
+        'pool_size': 5,
+        'max_overflow': 10,
+        'pool_timeout': 30,
+    },
+}
+
+# Queries the app and importers run constantly, with the index each must use
+HOT_QUERIES = [
+    ('player history', 'SELECT salary FROM historical_auctions WHERE player_id = 1',
+     'ix_historical_auctions_player_year'),
+    ('latest player position', 'SELECT position FROM historical_auctions WHERE player_id = 1 ORDER BY year DESC',
+     'ix_historical_auctions_player_year'),
+    ('team season', 'SELECT salary FROM historical_auctions WHERE team_id = 1 AND year = 2024',
+     'ix_historical_auctions_team_year'),
+    ('season diff', 'SELECT player_id, team_id, salary FROM historical_auctions WHERE year = 2024',
+     'ix_historical_auctions_year'),
+    ('player projection', 'SELECT projected_value FROM projected_stats WHERE player_id = 1',
+     'ix_projected_stats_player_year'),
+    ('season projections', 'SELECT player_id, projected_value FROM projected_stats WHERE year = 2024',
+     'ix_projected_stats_year'),
+    ('season contracts by team', 'SELECT salary FROM contracts WHERE year = 2024 AND team_id = 1',
+     'ix_contracts_year_team'),
+    ('player contracts', 'SELECT salary FROM contracts WHERE player_id = 1', 'ix_contracts_player_id'),
+    ('bid history', 'SELECT bid_amount FROM auction_bids WHERE player_id = 1', 'ix_auction_bids_player_id'),
+    ('player by name', "SELECT id FROM players WHERE name = 'Judge'", 'ix_players_name'),
+]
+
+
+def engine_options(profile: str) -> Dict:
+    """SQLALCHEMY_ENGINE_OPTIONS for a profile"""
+    settings = PROFILES[profile]
+    return {
+        'pool_size': settings['pool_size'],
+        'max_overflow': settings['max_overflow'],
+        'pool_timeout': settings['pool_timeout'],
+        'connect_args': {
+            'timeout': settings['pragmas'].get('busy_timeout', 5000) / 1000,
+            'check_same_thread': False,
+        },
+    }
+
+
+def install(engine, profile: str):
+    """Apply the profile's pragmas to every new connection of `engine`"""
+    if engine.dialect.name != 'sqlite':
+        return
+    pragmas = PROFILES[profile]['pragmas']
+    
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+
+def migrate(db) -> List[str]:
+    """
+    Bring an existing database up to the models (needs an app context)
+    
+    Creates missing tables, adds missing nullable columns, and creates
+    missing indexes and the current_bids trigger. Safe to run repeatedly.
+    
+    Planner statistics are cleared rather than gathered: ANALYZE on a
+    young database (one season, a few hundred rows) steers SQLite to
+    scans, while without statistics it assumes the indexes are selective.
+    
+    Returns:
+        Descriptions of the changes made
+    """
+    from models import OUTBID_TRIGGER
+    
+    engine = db.engine
+    existing = set(inspect(engine).get_table_names())
+    db.create_all()
+    changes = [f"created table {name}" for name in db.metadata.tables if name not in existing]
+    
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in db.metadata.sorted_tables:
+            if table.name not in existing:
+                continue  # create_all built it complete
+            columns = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                changes.append(f"added column {table.name}.{column.name}")
+            
+            indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in indexes:
+                    index.create(connection, checkfirst=True)
+                    changes.append(f"created index {index.name}")
+        
+        if engine.dialect.name == 'sqlite':
+            connection.execute(text(OUTBID_TRIGGER))
+            if inspect(connection).has_table('sqlite_stat1'):
+                if connection.execute(text('SELECT COUNT(*) FROM sqlite_stat1')).scalar():
+                    connection.execute(text('DELETE FROM sqlite_stat1'))
+                    changes.append("cleared planner statistics")
+    return changes
+
+
+def check_query_plans(engine) -> List[Dict]:
+    """
+    EXPLAIN QUERY PLAN for each hot query, on `engine`'s own database
+    
+    The plans are the ones this database would run now, with its current
+    indexes and planner statistics.
+    
+    Returns:
+        One dictionary per query with its plan and whether the expected
+        index was used
+    """
+    results = []
+    with engine.connect() as connection:
+        for name, sql, index in HOT_QUERIES:
+            try:
+                plan = [row[-1] for row in connection.execute(text(f'EXPLAIN QUERY PLAN {sql}'))]
+            except OperationalError as e:
+                plan = [f"error: {e.orig}"]  # Schema predates the query's columns
+            results.append({
+                'query': name,
+                'index': index,
+                'plan': plan,
+                'ok': any(index in step for step in plan),
+            })
+    return results
+
+
+def main():
+    from app import app
+    from models import db
+    
+    command = sys.argv[1] if len(sys.argv) > 1 else 'check'
+    with app.app_context():
+        if command == 'migrate':
+            changes = migrate(db)
+            print("\n".join(changes) if changes else "Schema is up to date")
+            return
+        
+        pragmas = {
+            name: db.session.execute(text(f'PRAGMA {name}')).scalar()
+            for name in PROFILES[app.config['SQLITE_PROFILE']]['pragmas']
+        }
+        print(f"\n{'='*80}")
+        print(f"DATABASE PROFILE: {app.config['SQLITE_PROFILE']}")
+        print(f"{'='*80}\n")
+        for name, value in pragmas.items():
+            print(f"  {name:<14} {value}")
+        
+        print(f"\n{'Query':<28} {'Index':<38} Plan")
+        print("-" * 80)
+        results = check_query_plans(db.engine)
+        for result in results:
+            status = '✅' if result['ok'] else '❌'
+            print(f"{status} {result['query']:<26} {result['index']:<38} {' / '.join(result['plan'])}")
+        
+        if not all(result['ok'] for result in results):
+            print("\n⚠️  Some queries would not use their index on this database; "
+                  "run: python db_profile.py migrate (creates missing indexes, clears planner statistics)")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,24 +1,86 @@
 """
 Import all historical JuniorLeague data files
+
+Season CSVs are parsed concurrently in a process pool and handed, in
+season order, to a single writer that runs the bulk importer. Files whose
+contents match the import manifest are skipped before parsing.
+
+Usage: python import_all.py [dir_or_glob ...] [--workers N]
 """
-from data_import import import_csv_file
+import argparse
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from data_import import bulk_import_parsed, changed_files, extract_year_from_filename, parse_season_file
+from models import db
 from app import app
+from db_profile import migrate
 
-if __name__ == '__main__':
-    with app.app_context():
-        files = [
-            'data/imports/uploads/JuniorLeague2021.csv',
-            'data/imports/uploads/JuniorLeague2024.csv',
-            'data/imports/uploads/JuniorLeague2025.csv',
-        ]
-        
-        for filepath in files:
+DEFAULT_SOURCES = ['data/imports/uploads']
+
+
+def collect_files(sources):
+    """
+    Expand directories and glob patterns into season CSV paths
+    
+    Returns files sorted by (year, path) so inserts are deterministic.
+    """
+    files = set()
+    for source in sources:
+        if os.path.isdir(source):
+            files.update(glob.glob(os.path.join(source, '*.csv')))
+        else:
+            files.update(glob.glob(source))
+    
+    season_files = []
+    for filepath in files:
+        year = extract_year_from_filename(os.path.basename(filepath))
+        if year:
+            season_files.append((year, filepath))
+        else:
+            print(f"⚠ Skipping {filepath}: no season year in filename")
+    return [filepath for year, filepath in sorted(season_files)]
+
+
+def parse_in_pool(files, workers=None):
+    """Parse files in a process pool, yielding results in file order"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(parse_season_file, filepath) for filepath in files]
+        for filepath, future in zip(files, futures):
             try:
-                import_csv_file(filepath, confirm_matches=False)
+                yield future.result()
             except Exception as e:
-                print(f"\n⚠ Error importing {filepath}: {e}\n")
+                print(f"\n⚠ Error parsing {filepath}: {e}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import JuniorLeague season CSVs')
+    parser.add_argument('sources', nargs='*', default=DEFAULT_SOURCES,
+                        help='Directories or glob patterns of season CSVs')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Parser processes (default: CPU count)')
+    args = parser.parse_args()
+    
+    files = collect_files(args.sources)
+    if not files:
+        print("No season CSV files found")
+        return
+    
+    with app.app_context():
+        migrate(db)  # Adds new tables, columns and indexes to older databases
+        files = changed_files(files)
+        
+        # One writer, one transaction for the whole backfill
+        try:
+            if files:
+                bulk_import_parsed(parse_in_pool(files, args.workers))
+        except Exception as e:
+            print(f"\n⚠ Error importing: {e}\n")
         
         print("\n" + "="*60)
         print("All imports complete!")
         print("="*60)
 
+
+if __name__ == '__main__':
+    main()
@@ -2,84 +2,17 @@
 Historical Auction Data Import Script
 Parses Junior League CSV format and imports into database
 """
-import csv
 import sys
 from pathlib import Path
-from models import db, Player, Team, Contract, HistoricalAuction
+from sqlalchemy import insert
+from models import db, Player, Team
+from league_csv import WideFormatCsv
+from import_manifest import apply_season_diff, file_digest, is_unchanged, record_import
 from app import app
-import re
+from db_profile import migrate
 
-
-def parse_junior_league_csv(filepath):
-    """
-    Parse Junior League CSV format:
-    - Position column on left
-    - Player, Salary pairs for each team
-    - Team names in header
-    - Empty cells where team didn't draft that position
-    """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        rows = list(reader)
-    
-    if len(rows) < 3:
-        return []
-    
-    # Extract year from filename
-    filename = Path(filepath).stem
-    year_match = re.search(r'20\d{2}', filename)
-    year = int(year_match.group()) if year_match else None
-    
-    # First row has team names alternating with empty columns
-    # Second row is header: Position, Player, $, Player, $, etc.
-    team_row = rows[0]
-    header_row = rows[1]
-    
-    # Extract team names (every other column starting from index 1)
-    teams = []
-    for i in range(1, len(team_row), 2):
-        team_name = team_row[i].strip()
-        if team_name:
-            teams.append({
-                'index': i,
-                'name': team_name,
-                'player_col': i,  # Team name is at i, player is at same col (i+1), salary at i+2
-                'salary_col': i + 1
-            })
-    
-    
-    # Extract data rows (skip header rows and "SPENT:" row)
-    data_rows = []
-    for row in rows[2:]:
-        if not row or row[0].strip().upper() == 'SPENT:':
-            break
-        position = row[0].strip()
-        if not position:
-            continue
-        
-        # Extract players for each team
-        for team_info in teams:
-            player_col = team_info['player_col']
-            salary_col = team_info['salary_col']
-            
-            if player_col < len(row) and salary_col < len(row):
-                player_name = row[player_col].strip()
-                salary_str = row[salary_col].strip()
-                
-                if player_name and salary_str:
-                    try:
-                        salary = int(salary_str)
-                        data_rows.append({
-                            'year': year,
-                            'team': team_info['name'],
-                            'position': position,
-                            'player': player_name,
-                            'salary': salary
-                        })
-                    except ValueError:
-                        pass
-    
-    return data_rows
+# Names per IN (...) lookup, well under SQLite's bound-parameter limit
+BATCH_SIZE = 500
 
 
 def normalize_player_name(name):
@@ -93,74 +26,85 @@ def import_historical_data(filepath):
     """Import historical data from CSV"""
     print(f"\n📥 Importing: {filepath}")
     
-    # Parse CSV
-    data = parse_junior_league_csv(filepath)
-    print(f"   Found {len(data)} player entries")
-    
-    if not data:
-        print("   ⚠️  No data found")
+    content_hash = file_digest(filepath)
+    if is_unchanged(content_hash):
+        print("   ⏭  Unchanged since last import, skipping")
         return
     
-    # Get or create teams
-    team_map = {}
-    for entry in data:
-        team_name = entry['team']
-        if team_name not in team_map:
-            team = Team.query.filter_by(name=team_name).first()
-            if not team:
-                team = Team(name=team_name, owner="TBD")  # Will need to update manually
-                db.session.add(team)
-                db.session.flush()
-                print(f"   ✨ Created team: {team_name}")
-            team_map[team_name] = team
+    with WideFormatCsv(filepath) as sheet:
+        if not sheet.teams or sheet.year is None:
+            print("   ⚠️  No data found")
+            return
+        year = sheet.year
+        team_names = sheet.team_names
+        entries = list(sheet.records())
     
-    # Import players and contracts
-    imported_count = 0
-    skipped_count = 0
+    print(f"   Found {len(entries)} player entries")
     
-    for entry in data:
-        player_name = normalize_player_name(entry['player'])
-        team = team_map[entry['team']]
-        
-        # Try to find existing player
-        player = Player.query.filter_by(name=player_name).first()
-        
-        if not player:
-            # Create new player
-            player = Player(
-                name=player_name,
-                position=entry['position'],
-                mlb_team=None  # Not in CSV
-            )
-            db.session.add(player)
-            db.session.flush()
-            print(f"   ✨ Created player: {player_name}")
-        
-        # Check if we already have this historical auction entry
-        existing = HistoricalAuction.query.filter_by(
-            player_id=player.id,
-            team_id=team.id,
-            year=entry['year']
-        ).first()
-        
-        if existing:
-            # Update existing
-            existing.salary = entry['salary']
-            skipped_count += 1
-        else:
-            # Create new historical entry
-            hist_entry = HistoricalAuction(
-                player_id=player.id,
-                team_id=team.id,
-                year=entry['year'],
-                salary=entry['salary'],
-                contract_type='C'  # Default, can refine later
-            )
-            db.session.add(hist_entry)
-            imported_count += 1
+    team_map = get_or_create_teams(team_names)
+    player_map = get_or_create_players(entries)
+    
+    # One query for the season's existing rows, then bulk writes of the diff
+    diff = apply_season_diff(
+        year,
+        (
+            (player_map[normalize_player_name(entry.player)], team_map[entry.team], entry.salary,
+             entry.position)
+            for entry in entries
+        ),
+        'C',  # Default, can refine later
+    )
     
+    record_import(filepath, content_hash, year, len(entries))
     db.session.commit()
-    print(f"   ✅ Imported: {imported_count}, Skipped: {skipped_count}")
+    print(f"   ✅ Imported: {diff['inserted']}, Skipped: {diff['updated'] + diff['unchanged']}, "
+          f"Removed: {diff['removed']}")
+
+
+def get_or_create_teams(team_names):
+    """Map team names to ids, creating missing teams, in one lookup query"""
+    team_map = {
+        name: team_id
+        for team_id, name in db.session.query(Team.id, Team.name).filter(Team.name.in_(team_names))
+    }
+    for team_name in team_names:
+        if team_name not in team_map:
+            team = Team(name=team_name, owner="TBD")  # Will need to update manually
+            db.session.add(team)
+            db.session.flush()
+            team_map[team_name] = team.id
+            print(f"   ✨ Created team: {team_name}")
+    return team_map
+
+
+def get_or_create_players(entries):
+    """
+    Map normalized player names to ids for a season's entries
+    
+    Existing players are loaded in one query; new players are created
+    with a single bulk insert.
+    """
+    positions = {}
+    for entry in entries:
+        positions.setdefault(normalize_player_name(entry.player), entry.position)
+    
+    player_map = {}
+    names = list(positions)
+    for start in range(0, len(names), BATCH_SIZE):
+        batch = names[start:start + BATCH_SIZE]
+        for player_id, name in db.session.query(Player.id, Player.name).filter(Player.name.in_(batch)):
+            player_map.setdefault(name, player_id)
+    
+    new_names = [name for name in names if name not in player_map]
+    if new_names:
+        ids = db.session.scalars(
+            insert(Player).returning(Player.id, sort_by_parameter_order=True),
+            [{'name': name, 'position': positions[name], 'mlb_team': None} for name in new_names]
+        ).all()
+        for name, player_id in zip(new_names, ids):
+            player_map[name] = player_id
+            print(f"   ✨ Created player: {name}")
+    return player_map
 
 
 def main():
@@ -171,7 +115,7 @@ def main():
         sys.exit(1)
     
     with app.app_context():
-        db.create_all()
+        migrate(db)
         
         for filepath in sys.argv[1:]:
             if Path(filepath).exists():
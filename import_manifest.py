@@ -0,0 +1,148 @@
+"""
+Import manifest and season diffing for incremental re-imports
+
+Each imported file is recorded with its content hash, season and row
+count. Unchanged files are skipped outright; a changed file is diffed
+against the season's existing HistoricalAuction rows so only inserted,
+changed and removed cells are written.
+"""
+import hashlib
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import delete, insert, update
+from models import db, HistoricalAuction, ImportManifest
+
+
+def file_digest(filepath: str) -> str:
+    """SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def manifest_key(filepath: str) -> str:
+    """Normalized path stored in the manifest"""
+    return os.path.normpath(filepath)
+
+
+def is_unchanged(content_hash: str) -> bool:
+    """
+    True if this content is what was last imported for its season
+    
+    Matching is by hash rather than path, so a season sheet that lives in
+    both data/imports and data/imports/uploads is only imported once.
+    """
+    entry = ImportManifest.query.filter_by(content_hash=content_hash).first()
+    if entry is None:
+        return False
+    latest = ImportManifest.query.filter_by(season=entry.season).order_by(
+        ImportManifest.imported_at.desc(), ImportManifest.id.desc()
+    ).first()
+    return latest.content_hash == content_hash
+
+
+def record_import(filepath: str, content_hash: str, season: int, row_count: int):
+    """Add or refresh a file's manifest entry (committed by the caller)"""
+    key = manifest_key(filepath)
+    entry = ImportManifest.query.filter_by(filename=key).first()
+    if entry is None:
+        entry = ImportManifest(filename=key)
+        db.session.add(entry)
+    entry.content_hash = content_hash
+    entry.season = season
+    entry.row_count = row_count
+    entry.imported_at = datetime.utcnow()
+
+
+def apply_season_diff(
+    year: int,
+    rows: Iterable[Tuple[int, int, int, Optional[str]]],
+    contract_type: str,
+    keep_team_ids: Optional[Set[int]] = None,
+    batch_size: int = 500,
+) -> Dict[str, int]:
+    """
+    Make a season's HistoricalAuction rows match the parsed file
+    
+    Existing rows for the season and contract type are loaded in one
+    query and matched to the parsed cells by (player_id, team_id); only
+    the differences are written, so re-importing the same file is a no-op.
+    Rows of other contract types (written by another importer or the
+    API) are never matched or removed.
+    
+    Args:
+        year: Season being imported
+        rows: (player_id, team_id, salary, position) for every resolved cell
+        contract_type: contract_type of the rows this importer owns; the
+            diff is limited to them and inserted rows get it
+        keep_team_ids: Teams whose unmatched rows must not be deleted,
+            e.g. because some of their cells could not be resolved
+        batch_size: Rows per bulk INSERT
+    
+    Returns:
+        Counts of inserted, updated, removed and unchanged rows
+    """
+    existing = defaultdict(list)
+    query = db.session.query(
+        HistoricalAuction.id,
+        HistoricalAuction.player_id,
+        HistoricalAuction.team_id,
+        HistoricalAuction.salary,
+        HistoricalAuction.position,
+    ).filter(
+        HistoricalAuction.year == year, HistoricalAuction.contract_type == contract_type
+    ).order_by(HistoricalAuction.id)
+    for row_id, player_id, team_id, salary, position in query:
+        existing[(player_id, team_id)].append((row_id, salary, position))
+    
+    inserts: List[Dict] = []
+    updates: List[Dict] = []
+    unchanged = 0
+    for player_id, team_id, salary, position in rows:
+        candidates = existing.get((player_id, team_id))
+        if not candidates:
+            inserts.append({
+                'player_id': player_id,
+                'team_id': team_id,
+                'year': year,
+                'salary': salary,
+                'contract_type': contract_type,
+                'position': position,
+            })
+            continue
+        
+        # Prefer a row with the same salary so duplicates pair up stably
+        match = next((c for c in candidates if c[1] == salary), candidates[0])
+        candidates.remove(match)
+        if match[1:] == (salary, position):
+            unchanged += 1
+        else:
+            updates.append({'id': match[0], 'salary': salary, 'position': position})
+    
+    keep_team_ids = keep_team_ids or set()
+    removed = [
+        row_id
+        for (player_id, team_id), candidates in existing.items()
+        if team_id not in keep_team_ids
+        for row_id, *_ in candidates
+    ]
+    
+    for start in range(0, len(inserts), batch_size):
+        db.session.execute(insert(HistoricalAuction), inserts[start:start + batch_size])
+    if updates:
+        db.session.execute(update(HistoricalAuction), updates)
+    for start in range(0, len(removed), batch_size):
+        db.session.execute(
+            delete(HistoricalAuction).where(HistoricalAuction.id.in_(removed[start:start + batch_size]))
+        )
+    
+    return {
+        'inserted': len(inserts),
+        'updated': len(updates),
+        'removed': len(removed),
+        'unchanged': unchanged,
+    }
@@ -0,0 +1,187 @@
+"""
+Streaming parser for the wide-format JuniorLeague auction CSVs
+
+Expected format:
+- Row 0: Team names, each above its Player column (",J-Squad,,Creat,,...")
+- Row 1: Column headers (Position, Player, $, Player, $, ...)
+- Row 2+: Data rows, one Player/$ pair per team
+- "SPENT:" row: Totals (parsing stops here)
+
+Shared by data_import.py, import_data.py and upload endpoints. Records are
+yielded one at a time, so memory use does not grow with the file.
+"""
+import csv
+import io
+import os
+import re
+from typing import Iterator, List, NamedTuple, Optional
+from player_index import NAME_SUFFIXES
+
+
+class TeamColumn(NamedTuple):
+    """A team's position in the header row"""
+    index: int  # Team order, left to right
+    name: str
+    player_col: int
+    salary_col: int
+
+
+class AuctionRecord(NamedTuple):
+    """One Player/$ cell pair from a season sheet"""
+    year: Optional[int]
+    team: str
+    team_idx: int
+    position: str
+    player: str
+    last_name: str
+    salary: int
+
+
+def extract_year_from_filename(filename: str) -> Optional[int]:
+    """Extract year from filename like JuniorLeague2025.csv"""
+    match = re.search(r'(\d{4})', filename or '')
+    if match:
+        return int(match.group(1))
+    return None
+
+
+def parse_last_name(player_str: str) -> Optional[str]:
+    """Extract last name from various formats"""
+    if not player_str or player_str.strip() == '':
+        return None
+    
+    # Handle "LastName, First" format
+    if ',' in player_str:
+        last, first = player_str.split(',', 1)
+        return last.strip()
+    
+    # Handle "FirstName LastName", ignoring suffixes like "Guerrero Jr"
+    parts = player_str.strip().split()
+    while len(parts) > 1 and parts[-1].lower().rstrip('.') in NAME_SUFFIXES:
+        parts.pop()
+    if len(parts) > 1:
+        # Check if first part looks like a common first name
+        # Otherwise assume it's a last name (some cultures)
+        return parts[-1]  # Take the last part as surname
+    
+    return parts[0] if parts else player_str.strip()
+
+
+def _source_name(source) -> Optional[str]:
+    """Best-effort filename for paths, open files and upload streams"""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    return getattr(source, 'filename', None) or getattr(source, 'name', None)
+
+
+def _open_text(source):
+    """
+    Return (text_stream, ownership) for a path, file-like object or upload
+    
+    ownership is 'opened' for files opened here, 'wrapped' for binary
+    streams decoded here, and None for text streams passed in.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, 'r', encoding='utf-8-sig', newline=''), 'opened'
+    
+    # Werkzeug FileStorage and similar upload wrappers
+    stream = getattr(source, 'stream', source)
+    if isinstance(stream, io.TextIOBase) or 'b' not in getattr(stream, 'mode', 'b'):
+        return stream, None
+    
+    # Binary stream: decode incrementally without buffering the upload
+    return io.TextIOWrapper(stream, encoding='utf-8-sig', newline=''), 'wrapped'
+
+
+class WideFormatCsv:
+    """
+    One season sheet, read lazily
+    
+    The two header rows are read on construction and exposed as `teams`;
+    `records()` then streams the data rows.
+    
+    Usage:
+        with WideFormatCsv('data/imports/JuniorLeague2025.csv') as sheet:
+            print(sheet.team_names)
+            for record in sheet.records():
+                ...
+    """
+    
+    def __init__(self, source, year: Optional[int] = None):
+        self.source_name = _source_name(source)
+        self.year = year if year is not None else extract_year_from_filename(
+            os.path.basename(self.source_name or '')
+        )
+        self._stream, self._ownership = _open_text(source)
+        self._reader = csv.reader(self._stream)
+        self.teams: List[TeamColumn] = self._read_header()
+    
+    def _read_header(self) -> List[TeamColumn]:
+        team_row = next(self._reader, [])
+        next(self._reader, None)  # Position, Player, $, ... header
+        
+        if team_row and team_row[0].startswith('\ufeff'):
+            # BOM left in place by text streams opened without utf-8-sig
+            team_row[0] = team_row[0][1:]
+        
+        # Each team name sits above its Player column; $ is the next column
+        teams = []
+        for col, cell in enumerate(team_row):
+            name = cell.strip()
+            if col > 0 and name and name not in ('Position', 'Player', '$'):
+                teams.append(TeamColumn(len(teams), name, col, col + 1))
+        return teams
+    
+    @property
+    def team_names(self) -> List[str]:
+        return [team.name for team in self.teams]
+    
+    def records(self) -> Iterator[AuctionRecord]:
+        """Yield one AuctionRecord per filled Player/$ pair"""
+        for row in self._reader:
+            # Skip empty rows
+            if not row or not row[0].strip():
+                continue
+            
+            # Stop at totals row
+            if row[0].strip().upper().startswith('SPENT'):
+                break
+            
+            position = row[0].strip()
+            for team in self.teams:
+                if team.salary_col >= len(row):
+                    break
+                
+                player_name = row[team.player_col].strip()
+                if not player_name:
+                    continue
+                
+                try:
+                    salary = int(row[team.salary_col].strip())
+                except ValueError:
+                    continue
+                
+                last_name = parse_last_name(player_name)
+                if last_name:
+                    yield AuctionRecord(
+                        year=self.year,
+                        team=team.name,
+                        team_idx=team.index,
+                        position=position,
+                        player=player_name,
+                        last_name=last_name,
+                        salary=salary,
+                    )
+    
+    def close(self):
+        if self._ownership == 'opened':
+            self._stream.close()
+        elif self._ownership == 'wrapped':
+            # Leave the caller's binary stream open
+            self._stream.detach()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
@@ -3,6 +3,7 @@ Database models for JuniorLeague fantasy baseball app
 """
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DDL, event
 
 db = SQLAlchemy()
 
@@ -29,7 +30,7 @@ class Player(db.Model):
     __tablename__ = 'players'
     
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
+    name = db.Column(db.String(100), nullable=False, index=True)
     fangraphs_id = db.Column(db.Integer, unique=True, nullable=True)  # Fangraphs player ID
     position = db.Column(db.String(50))  # e.g., "OF", "SP", "C"
     mlb_team = db.Column(db.String(10))  # MLB team abbreviation
@@ -49,6 +50,10 @@ class Player(db.Model):
 class Contract(db.Model):
     """Represents a contract for a player"""
     __tablename__ = 'contracts'
+    __table_args__ = (
+        db.Index('ix_contracts_year_team', 'year', 'team_id'),
+        db.Index('ix_contracts_player_id', 'player_id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     player_id = db.Column(db.Integer, db.ForeignKey('players.id'), nullable=False)
@@ -62,6 +67,7 @@ class Contract(db.Model):
     
     # Additional metadata
     rotation_round = db.Column(db.Integer, nullable=True)  # For rotation round contracts
+    reserve = db.Column(db.Boolean, default=False)  # Frozen on the reserve roster
     notes = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
@@ -72,6 +78,11 @@ class Contract(db.Model):
 class HistoricalAuction(db.Model):
     """Historical auction data for statistical analysis"""
     __tablename__ = 'historical_auctions'
+    __table_args__ = (
+        db.Index('ix_historical_auctions_player_year', 'player_id', 'year'),
+        db.Index('ix_historical_auctions_team_year', 'team_id', 'year'),
+        db.Index('ix_historical_auctions_year', 'year'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     player_id = db.Column(db.Integer, db.ForeignKey('players.id'), nullable=False)
@@ -81,6 +92,7 @@ class HistoricalAuction(db.Model):
     year = db.Column(db.Integer, nullable=False)
     salary = db.Column(db.Integer, nullable=False)
     contract_type = db.Column(db.String(50), nullable=False)
+    position = db.Column(db.String(20))  # Roster slot from the season sheet, e.g. "C", "MI", "P"
     
     # Player stats for that season
     batting_avg = db.Column(db.Float)
@@ -101,6 +113,10 @@ class HistoricalAuction(db.Model):
 class ProjectedStats(db.Model):
     """Projected statistics for players"""
     __tablename__ = 'projected_stats'
+    __table_args__ = (
+        db.Index('ix_projected_stats_player_year', 'player_id', 'year'),
+        db.Index('ix_projected_stats_year', 'year'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     player_id = db.Column(db.Integer, db.ForeignKey('players.id'), nullable=False)
@@ -116,6 +132,14 @@ class ProjectedStats(db.Model):
     projected_strikeouts = db.Column(db.Integer)
     projected_saves = db.Column(db.Integer)
     
+    # League scoring categories (OBP, R, WHIP, SHOLDS) and playing time
+    projected_obp = db.Column(db.Float)
+    projected_runs = db.Column(db.Integer)
+    projected_whip = db.Column(db.Float)
+    projected_holds = db.Column(db.Integer)
+    projected_plate_appearances = db.Column(db.Integer)
+    projected_innings = db.Column(db.Float)
+    
     # Dollar value calculation
     projected_value = db.Column(db.Float)
     source = db.Column(db.String(100))  # 'fangraphs', 'steamer', etc.
@@ -127,19 +151,64 @@ class ProjectedStats(db.Model):
 
 
 class AuctionBid(db.Model):
-    """Live auction tracking"""
+    """
+    Live auction bid history
+    
+    Outbid bids are appended here by the current_bids trigger; the
+    standing high bid for each player lives in CurrentBid. Every row is
+    a bid that was accepted and later topped; rejected bids are not
+    logged anywhere.
+    """
     __tablename__ = 'auction_bids'
     
     id = db.Column(db.Integer, primary_key=True)
-    player_id = db.Column(db.Integer, db.ForeignKey('players.id'), nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey('players.id'), nullable=False, index=True)
     team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False)
     
     bid_amount = db.Column(db.Integer, nullable=False)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
     
-    # Bid status
-    is_winning = db.Column(db.Boolean, default=True)
-    
     def __repr__(self):
         return f'<AuctionBid ${self.bid_amount}>'
 
+
+class CurrentBid(db.Model):
+    """Standing high bid, one row per player"""
+    __tablename__ = 'current_bids'
+    
+    player_id = db.Column(db.Integer, db.ForeignKey('players.id'), primary_key=True)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False)
+    bid_amount = db.Column(db.Integer, nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1)  # Bumped on every accepted bid
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<CurrentBid {self.player_id} ${self.bid_amount}>'
+
+
+# Moves the bid being replaced into auction_bids in the same statement
+OUTBID_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS current_bids_outbid
+BEFORE UPDATE OF team_id, bid_amount ON current_bids
+BEGIN
+    INSERT INTO auction_bids (player_id, team_id, bid_amount, timestamp)
+    VALUES (OLD.player_id, OLD.team_id, OLD.bid_amount, OLD.timestamp);
+END
+"""
+event.listen(CurrentBid.__table__, 'after_create', DDL(OUTBID_TRIGGER).execute_if(dialect='sqlite'))
+
+
+class ImportManifest(db.Model):
+    """Content hash of each imported season file, used to skip unchanged re-imports"""
+    __tablename__ = 'import_manifest'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    filename = db.Column(db.String(255), nullable=False, unique=True)
+    content_hash = db.Column(db.String(64), nullable=False)  # SHA-256 hex digest
+    season = db.Column(db.Integer, nullable=False)
+    row_count = db.Column(db.Integer, nullable=False)
+    imported_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<ImportManifest {self.filename} {self.season}>'
+
@@ -0,0 +1,112 @@
+"""
+In-memory player name index for the CSV importers
+
+Replaces the per-row `Player.name.ilike('%last_name%')` scan with
+dictionary lookups on normalized name keys. The index is loaded once per
+import run and updated as players are created mid-import.
+"""
+import unicodedata
+from typing import Dict, List, Optional
+
+# Name suffixes ignored when picking a surname ("Guerrero Jr")
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv'}
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents and periods, and collapse whitespace"""
+    if not name:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return ' '.join(stripped.replace('.', ' ').lower().split())
+
+
+def name_tokens(name: str) -> List[str]:
+    """Normalized words of a name, without suffixes or comma punctuation"""
+    words = normalize_name(name).replace(',', ' ').split()
+    return [w for w in words if w not in NAME_SUFFIXES]
+
+
+def initial_key(name: str) -> Optional[str]:
+    """"last, f" key for names that carry a first name or initial ("Diaz, Y")"""
+    normalized = normalize_name(name)
+    if ',' in normalized:
+        last, first = normalized.split(',', 1)
+        first_tokens = name_tokens(first)
+        last_key = ' '.join(name_tokens(last))
+    else:
+        tokens = name_tokens(normalized)
+        if len(tokens) < 2:
+            return None
+        first_tokens, last_key = tokens[:1], tokens[-1]
+    if not first_tokens or not last_key:
+        return None
+    return f"{last_key}, {first_tokens[0][0]}"
+
+
+class PlayerNameIndex:
+    """
+    Maps normalized name keys to candidate players
+    
+    Every word of a player's name is indexed, so a surname lookup returns
+    the same candidates as the old substring scan whenever the surname is
+    a whole word of the stored name. "Last, F" keys are kept separately
+    and used to rank ambiguous candidates.
+    
+    Values are whatever the caller adds: player ids for the ORM importer,
+    lightweight refs for the bulk importer.
+    """
+    
+    def __init__(self):
+        self._by_token: Dict[str, List] = {}
+        self._by_initial: Dict[str, List] = {}
+    
+    @classmethod
+    def from_rows(cls, rows) -> 'PlayerNameIndex':
+        """Build an index from (value, name) pairs"""
+        index = cls()
+        for value, name in rows:
+            index.add(value, name)
+        return index
+    
+    @classmethod
+    def load(cls) -> 'PlayerNameIndex':
+        """Build an index of player ids from the players table in one query"""
+        from models import db, Player
+        return cls.from_rows(db.session.query(Player.id, Player.name))
+    
+    def add(self, value, name: str):
+        """Index a player, e.g. one created mid-import"""
+        for token in set(name_tokens(name)):
+            self._by_token.setdefault(token, []).append(value)
+        key = initial_key(name)
+        if key:
+            self._by_initial.setdefault(key, []).append(value)
+    
+    def candidates(self, last_name: str, player_str: Optional[str] = None) -> List:
+        """
+        Candidate players for a surname
+        
+        Args:
+            last_name: Surname parsed from the CSV cell
+            player_str: Full CSV cell; when it carries an initial, players
+                matching that initial are listed first
+        
+        Returns:
+            List of indexed values (empty if no match)
+        """
+        tokens = name_tokens(last_name)
+        if not tokens:
+            return []
+        
+        # Multi-word surnames ("De La Cruz") must match every word
+        matches = self._by_token.get(tokens[0], [])
+        for token in tokens[1:]:
+            others = set(self._by_token.get(token, []))
+            matches = [m for m in matches if m in others]
+        
+        if len(matches) > 1 and player_str:
+            preferred = set(self._by_initial.get(initial_key(player_str), []))
+            if preferred:
+                matches = sorted(matches, key=lambda m: m not in preferred)
+        return list(matches)
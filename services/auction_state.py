@@ -0,0 +1,151 @@
+"""
+In-memory auction state for live bid validation
+
+Each team's committed dollars and filled roster slots are loaded once
+and then updated as bids and contracts are recorded, so validating a
+bid is a few dictionary lookups with no database access.
+"""
+import threading
+from typing import Dict, Optional, Tuple
+from config.league_settings import AUCTION_RULES, BUDGET, ROSTER_SIZE
+
+
+class AuctionState:
+    """
+    Per-team budget and slot tracking
+    
+    Max legal bid = remaining dollars - minimum bid x (open slots - 1):
+    a team must keep enough to fill every other open slot at the minimum.
+    """
+    
+    def __init__(
+        self,
+        season: int,
+        budget: int = BUDGET,
+        roster_size: int = ROSTER_SIZE,
+        min_bid: int = AUCTION_RULES['minimum_bid'],
+        min_increment: int = AUCTION_RULES['minimum_increment']
+    ):
+        self.season = season
+        self.budget = budget
+        self.roster_size = roster_size
+        self.min_bid = min_bid
+        self.min_increment = min_increment
+        self._committed: Dict[int, int] = {}
+        self._filled: Dict[int, int] = {}
+        # player_id -> (team_id, amount, takes an active slot, from a contract)
+        self._owners: Dict[int, Tuple[int, int, bool, bool]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+    
+    def load(self):
+        """Initialise from season contracts and winning bids (needs an app context)"""
+        from models import db, Contract, CurrentBid, Team
+        
+        with self._lock:
+            self._committed = {team_id: 0 for (team_id,) in db.session.query(Team.id)}
+            self._filled = dict.fromkeys(self._committed, 0)
+            self._owners = {}
+            for player_id, team_id, amount in db.session.query(
+                CurrentBid.player_id, CurrentBid.team_id, CurrentBid.bid_amount
+            ):
+                self._assign(player_id, team_id, amount, True, False)
+            for player_id, team_id, salary, reserve in db.session.query(
+                Contract.player_id, Contract.team_id, Contract.salary, Contract.reserve
+            ).filter(Contract.year == self.season).order_by(Contract.id):
+                self._assign(player_id, team_id, salary, not reserve, True)
+            self._loaded = True
+    
+    def ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+    
+    def _assign(self, player_id: int, team_id: int, amount: int, active: bool, contract: bool):
+        previous = self._owners.get(player_id)
+        if previous is not None:
+            old_team, old_amount, old_active, _ = previous
+            self._committed[old_team] -= old_amount
+            self._filled[old_team] -= int(old_active)
+        self._committed[team_id] = self._committed.get(team_id, 0) + amount
+        self._filled[team_id] = self._filled.get(team_id, 0) + int(active)
+        self._owners[player_id] = (team_id, amount, active, contract)
+    
+    def add_team(self, team_id: int):
+        self.ensure_loaded()
+        with self._lock:
+            self._committed.setdefault(team_id, 0)
+            self._filled.setdefault(team_id, 0)
+    
+    def record_bid(self, player_id: int, team_id: int, amount: int):
+        """A winning bid; replaces the player's previous winning bid"""
+        self.ensure_loaded()
+        with self._lock:
+            self._assign(player_id, team_id, amount, True, False)
+    
+    def record_contract(self, player_id: int, team_id: int, salary: int, reserve: bool, year: int):
+        if year != self.season:
+            return
+        self.ensure_loaded()
+        with self._lock:
+            self._assign(player_id, team_id, salary, not reserve, True)
+    
+    def _team_state(self, team_id: int, player_id: Optional[int] = None) -> Tuple[int, int, int]:
+        """(remaining dollars, open slots, max bid), counting any bid the team holds on `player_id` as returned"""
+        remaining = self.budget - self._committed[team_id]
+        open_slots = self.roster_size - self._filled[team_id]
+        held = self._owners.get(player_id)
+        if held is not None and held[0] == team_id and not held[3]:
+            remaining += held[1]
+            open_slots += int(held[2])
+        max_bid = remaining - self.min_bid * (open_slots - 1) if open_slots > 0 else 0
+        return remaining, open_slots, max_bid
+    
+    def team_summary(self, team_id: int) -> Optional[Dict]:
+        self.ensure_loaded()
+        with self._lock:
+            if team_id not in self._committed:
+                return None
+            remaining, open_slots, max_bid = self._team_state(team_id)
+            return {
+                'team_id': team_id,
+                'committed': self._committed[team_id],
+                'remaining': remaining,
+                'open_slots': open_slots,
+                'max_bid': max_bid,
+            }
+    
+    def summaries(self):
+        self.ensure_loaded()
+        return [self.team_summary(team_id) for team_id in sorted(self._committed)]
+    
+    def validate_bid(self, player_id: int, team_id: int, amount: int) -> Dict:
+        """
+        Check a bid against the team's budget and slots and the current high bid
+        
+        Returns:
+            Dictionary with valid, reasons and the team's max_bid
+        """
+        self.ensure_loaded()
+        with self._lock:
+            validation = {'valid': True, 'reasons': [], 'max_bid': None}
+            if team_id not in self._committed:
+                validation['valid'] = False
+                validation['reasons'].append(f"Unknown team: {team_id}")
+                return validation
+            
+            remaining, open_slots, max_bid = self._team_state(team_id, player_id)
+            validation['max_bid'] = max_bid
+            owner = self._owners.get(player_id)
+            checks = [
+                (owner is not None and owner[3], "Player is already under contract"),
+                (open_slots <= 0, "No open roster slots"),
+                (amount < self.min_bid, f"Bid below minimum: ${amount} < ${self.min_bid}"),
+                (owner is not None and not owner[3] and amount < owner[1] + self.min_increment,
+                 f"Bid must be at least ${(owner[1] if owner else 0) + self.min_increment}"),
+                (open_slots > 0 and amount > max_bid, f"Bid exceeds max bid: ${amount} > ${max_bid}"),
+            ]
+            for failed, reason in checks:
+                if failed:
+                    validation['valid'] = False
+                    validation['reasons'].append(reason)
+            return validation
@@ -0,0 +1,144 @@
+"""
+Per-player bid recommendation cache
+
+Recommendations only change when a player's HistoricalAuction or
+ProjectedStats rows change, so results are kept in a size-bounded LRU and
+dropped when the ORM writes those rows. Writes from other processes (the
+CLI importers) are caught by the shared per-table version files.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+from sqlalchemy import event, inspect
+
+# Models whose rows feed AuctionCalculator.calculate_bid, and their tables
+WATCHED_MODELS = ('HistoricalAuction', 'ProjectedStats')
+WATCHED_TABLES = ('historical_auctions', 'projected_stats')
+
+# Session.info key for player ids written in the current transaction
+_PENDING_KEY = 'bid_cache_pending'
+
+
+class RecommendationCache:
+    """Thread-safe LRU of recommendation dicts keyed by player_id"""
+    
+    def __init__(self, maxsize: int = 1024, versions=None):
+        """
+        Args:
+            versions: TableVersions shared with the importers; when given,
+                the cache is cleared whenever a watched table's version
+                changes, whichever process wrote it
+        """
+        self.maxsize = maxsize
+        self.versions = versions
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._table_versions: Optional[Tuple[str, ...]] = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def _sync_versions(self) -> bool:
+        """Clear if a watched table changed since the last check (lock held); True if it did"""
+        if self.versions is None:
+            return False
+        current = tuple(self.versions.version(table) for table in WATCHED_TABLES)
+        changed = self._table_versions is not None and current != self._table_versions
+        if changed:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+        self._table_versions = current
+        return changed
+    
+    def get(self, player_id: int) -> Optional[Dict]:
+        with self._lock:
+            self._sync_versions()
+            entry = self._entries.get(player_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(player_id)
+            self.hits += 1
+            return entry
+    
+    def put(self, player_id: int, recommendation: Dict):
+        with self._lock:
+            if self._sync_versions():
+                return  # Computed from rows that may predate the write
+            self._entries[player_id] = recommendation
+            self._entries.move_to_end(player_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, player_ids: Iterable[int]):
+        """Drop cached results for these players"""
+        with self._lock:
+            for player_id in player_ids:
+                if self._entries.pop(player_id, None) is not None:
+                    self.invalidations += 1
+    
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'invalidations': self.invalidations,
+            }
+    
+    def watch(self, session):
+        """
+        Invalidate on writes made through `session` (e.g. db.session)
+        
+        Player ids touched by ORM flushes and bulk INSERTs are collected
+        per transaction and invalidated after commit. Bulk UPDATE/DELETE
+        statements don't carry player ids, so they clear the whole cache.
+        """
+        event.listen(session, 'after_flush', self._after_flush)
+        event.listen(session, 'do_orm_execute', self._do_orm_execute)
+        event.listen(session, 'after_commit', self._after_commit)
+        event.listen(session, 'after_rollback', self._after_rollback)
+    
+    def _after_flush(self, session, flush_context):
+        pending = session.info.setdefault(_PENDING_KEY, set())
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            if type(obj).__name__ not in WATCHED_MODELS:
+                continue
+            history = inspect(obj).attrs.player_id.history
+            pending.update(pid for pid in (*history.added, *history.unchanged, *history.deleted)
+                           if pid is not None)
+    
+    def _do_orm_execute(self, orm_execute_state):
+        if orm_execute_state.is_select:
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is None or mapper.class_.__name__ not in WATCHED_MODELS:
+            return
+        
+        pending = orm_execute_state.session.info.setdefault(_PENDING_KEY, set())
+        params = orm_execute_state.parameters
+        rows = params if isinstance(params, list) else [params or {}]
+        if orm_execute_state.is_insert and all('player_id' in row for row in rows):
+            pending.update(row['player_id'] for row in rows)
+        else:
+            pending.add(None)  # Unknown players: clear everything
+    
+    def _after_commit(self, session):
+        pending = session.info.pop(_PENDING_KEY, None)
+        if not pending:
+            return
+        if None in pending:
+            self.clear()
+        else:
+            self.invalidate(pending)
+    
+    def _after_rollback(self, session):
+        session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,161 @@
+"""
+Live auction inflation tracker
+
+Keeps league-wide running totals of dollars left to spend and projected
+value left in the unsold pool. Totals are loaded once, then updated in
+O(1) as bids and contracts are recorded.
+"""
+import logging
+import threading
+from typing import Dict, Optional
+from config.league_settings import AUCTION_RULES, BUDGET, NUM_TEAMS, ROSTER_SIZE
+
+logger = logging.getLogger('juniorleague.inflation')
+
+# Running sums drift by float rounding; less value than this is an empty pool
+MIN_VALUE_REMAINING = 1e-6
+
+
+class InflationTracker:
+    """
+    Inflation = surplus dollars remaining / surplus value remaining
+    
+    Dollars remaining is every team's budget minus keeper Contracts and
+    current high bids (CurrentBid) for the season. Each player counts once:
+    a contract replaces the winning bid it came from. Both sides are
+    measured above the minimum bid: surplus dollars set aside the minimum
+    for every open active roster slot, and surplus value is what unsold
+    draftable players (valued above the minimum) are worth beyond it.
+    """
+    
+    def __init__(
+        self,
+        season: int,
+        num_teams: int = NUM_TEAMS,
+        budget: int = BUDGET,
+        roster_size: int = ROSTER_SIZE,
+        min_bid: int = AUCTION_RULES['minimum_bid']
+    ):
+        self.season = season
+        self.total_budget = num_teams * budget
+        self.total_slots = num_teams * roster_size
+        self.min_bid = min_bid
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._values: Dict[int, float] = {}
+        self._committed: Dict[int, int] = {}  # player_id -> dollars committed
+        self._reserve = set()  # Committed players off the active roster
+        self.dollars_remaining = float(self.total_budget)
+        self.value_remaining = 0.0
+        self._warned = False
+    
+    def _surplus(self, value: float) -> float:
+        """Value above the minimum bid; 0 for players not worth drafting"""
+        return max(value - self.min_bid, 0.0)
+    
+    @property
+    def open_slots(self) -> int:
+        return self.total_slots - (len(self._committed) - len(self._reserve))
+    
+    def load(self):
+        """Initialise totals with one scan of each table (needs an app context)"""
+        from models import db, Contract, CurrentBid, ProjectedStats
+        
+        with self._lock:
+            projected = db.session.query(ProjectedStats.player_id, ProjectedStats.projected_value)
+            season_projected = projected.filter(ProjectedStats.year == self.season).all()
+            values = {}
+            for player_id, value in season_projected or projected.order_by(ProjectedStats.id).all():
+                values.setdefault(player_id, float(value or 0))
+            
+            committed, reserve = {}, set()
+            for player_id, amount in db.session.query(CurrentBid.player_id, CurrentBid.bid_amount):
+                committed[player_id] = amount
+            for player_id, salary, on_reserve in db.session.query(
+                Contract.player_id, Contract.salary, Contract.reserve
+            ).filter(Contract.year == self.season):
+                committed[player_id] = salary
+                if on_reserve:
+                    reserve.add(player_id)
+                else:
+                    reserve.discard(player_id)
+            
+            self._values = values
+            self._committed = committed
+            self._reserve = reserve
+            self.dollars_remaining = float(self.total_budget - sum(committed.values()))
+            self.value_remaining = sum(self._surplus(v) for pid, v in values.items() if pid not in committed)
+            self._loaded = True
+    
+    def ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+    
+    def _commit(self, player_id: int, amount: int, reserve: bool = False):
+        previous = self._committed.get(player_id)
+        if previous is None:
+            self.value_remaining -= self._surplus(self._values.get(player_id, 0.0))
+        else:
+            self.dollars_remaining += previous
+        self._committed[player_id] = amount
+        self.dollars_remaining -= amount
+        if reserve:
+            self._reserve.add(player_id)
+        else:
+            self._reserve.discard(player_id)
+    
+    def record_bid(self, player_id: int, amount: int):
+        """A new winning bid replaces the player's previous one"""
+        self.ensure_loaded()
+        with self._lock:
+            self._commit(player_id, amount)
+    
+    def record_contract(self, player_id: int, salary: int, year: int, reserve: bool = False):
+        """Keeper or auction contract; only the tracked season counts"""
+        if year != self.season:
+            return
+        self.ensure_loaded()
+        with self._lock:
+            self._commit(player_id, salary, reserve)
+    
+    def set_value(self, player_id: int, value: Optional[float]):
+        """Update a player's projected value, e.g. after a revaluation"""
+        self.ensure_loaded()
+        with self._lock:
+            value = float(value or 0)
+            if player_id not in self._committed:
+                self.value_remaining += self._surplus(value) - self._surplus(self._values.get(player_id, 0.0))
+            self._values[player_id] = value
+    
+    @property
+    def surplus_dollars(self) -> float:
+        """Dollars remaining beyond the minimum bid for every open slot"""
+        return self.dollars_remaining - self.min_bid * max(self.open_slots, 0)
+    
+    @property
+    def inflation(self) -> float:
+        """1.0 (no adjustment) when no draftable value is left to price against"""
+        self.ensure_loaded()
+        if self.value_remaining < MIN_VALUE_REMAINING:
+            if not self._warned:
+                self._warned = True
+                logger.warning(
+                    "No draftable projected value left for season %s (value remaining %.2f); "
+                    "inflation falls back to 1.0 - run POST /api/valuations", self.season, self.value_remaining
+                )
+            return 1.0
+        self._warned = False
+        return self.surplus_dollars / self.value_remaining
+    
+    def snapshot(self) -> Dict:
+        factor = self.inflation
+        return {
+            'season': self.season,
+            'dollars_remaining': self.dollars_remaining,
+            'surplus_dollars': self.surplus_dollars,
+            'value_remaining': round(self.value_remaining, 2),
+            'players_committed': len(self._committed),
+            'open_slots': self.open_slots,
+            'inflation': round(factor, 4),
+            'fallback': self.value_remaining < MIN_VALUE_REMAINING,
+        }
@@ -0,0 +1,97 @@
+"""
+Per-team lineup solvers kept current during the auction
+
+Rosters are loaded once (season contracts plus winning bids) and then
+updated incrementally as bids and contracts are recorded, so every
+team's open slots can be checked after each nomination. Reserve
+contracts are off the active roster and fill no slot.
+"""
+import threading
+from typing import Dict, List, Optional
+from calculators.lineup_solver import LineupSolver
+
+
+class LineupRegistry:
+    """LineupSolver per team, keyed by team_id"""
+    
+    def __init__(self, season: int, positions: Dict[str, int] = None):
+        self.season = season
+        self.positions = positions
+        self._solvers: Dict[int, LineupSolver] = {}
+        self._owner: Dict[int, int] = {}  # player_id -> team_id
+        self._loaded = False
+        self._lock = threading.Lock()
+    
+    def load(self):
+        """Build every team's lineup from the database (needs an app context)"""
+        from models import db, Contract, CurrentBid, Player, Team
+        
+        with self._lock:
+            self._solvers = {team_id: LineupSolver(self.positions) for (team_id,) in db.session.query(Team.id)}
+            self._owner = {}
+            rosters = {}
+            winning = db.session.query(
+                CurrentBid.player_id, CurrentBid.team_id, Player.position, db.false()
+            ).join(Player, Player.id == CurrentBid.player_id)
+            contracted = db.session.query(
+                Contract.player_id, Contract.team_id, Player.position, Contract.reserve
+            ).join(Player, Player.id == Contract.player_id).filter(
+                Contract.year == self.season
+            ).order_by(Contract.id)
+            # Contracts are applied last, so they win over the bids they came from
+            for player_id, team_id, position, reserve in [*winning, *contracted]:
+                rosters[player_id] = (team_id, position, reserve)
+            for player_id, (team_id, position, reserve) in rosters.items():
+                if not reserve:
+                    self._add(player_id, team_id, position)
+            self._loaded = True
+    
+    def ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+    
+    def _add(self, player_id: int, team_id: int, position: Optional[str]):
+        previous = self._owner.get(player_id)
+        if previous is not None and previous != team_id:
+            self._remove(player_id)
+        solver = self._solvers.get(team_id)
+        if solver is None:
+            solver = self._solvers[team_id] = LineupSolver(self.positions)
+        solver.add(player_id, position)
+        self._owner[player_id] = team_id
+    
+    def _remove(self, player_id: int):
+        team_id = self._owner.pop(player_id, None)
+        if team_id is not None:
+            self._solvers[team_id].remove(player_id)
+    
+    def record(self, player_id: int, team_id: int, position: Optional[str]):
+        """A player now belongs to `team_id` (winning bid or contract)"""
+        self.ensure_loaded()
+        with self._lock:
+            self._add(player_id, team_id, position)
+    
+    def record_contract(self, player_id: int, team_id: int, position: Optional[str], year: int,
+                        reserve: bool = False):
+        """A season contract; a reserve contract takes the player off any active lineup"""
+        if year != self.season:
+            return
+        if not reserve:
+            self.record(player_id, team_id, position)
+            return
+        self.ensure_loaded()
+        with self._lock:
+            self._remove(player_id)
+    
+    def solver(self, team_id: int) -> Optional[LineupSolver]:
+        self.ensure_loaded()
+        return self._solvers.get(team_id)
+    
+    def summaries(self) -> List[Dict]:
+        """Open slots and buyable positions for every team"""
+        self.ensure_loaded()
+        with self._lock:
+            return [
+                dict(solver.summary(), team_id=team_id)
+                for team_id, solver in sorted(self._solvers.items())
+            ]
@@ -0,0 +1,153 @@
+"""
+In-memory publisher for the live auction feed
+
+Bid and contract changes are published once, after the database commit,
+and fanned out to every connected browser as server-sent events. The
+feed keeps the current high bids and a short replay buffer in memory, so
+any number of clients adds no database reads per bid; late joiners
+fetch a snapshot and then apply deltas with a higher sequence number.
+"""
+import json
+import queue
+import threading
+from collections import deque
+from typing import Dict, Iterator, List, Optional
+
+# Events kept for clients reconnecting with Last-Event-ID
+REPLAY_SIZE = 500
+
+# Undelivered events per client before a slow client is dropped
+CLIENT_QUEUE_SIZE = 100
+
+
+class LiveFeed:
+    """Sequence-numbered deltas with per-client queues"""
+    
+    def __init__(self, replay_size: int = REPLAY_SIZE, queue_size: int = CLIENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.seq = 0
+        self._bids: Dict[int, Dict] = {}  # player_id -> current high bid
+        self._history = deque(maxlen=replay_size)
+        self._clients: List[queue.Queue] = []
+        self._loaded = False
+        self._lock = threading.Lock()
+    
+    def load(self):
+        """Current high bids from the database, once (needs an app context)"""
+        from models import db, CurrentBid, Player
+        
+        with self._lock:
+            self._bids = {}
+            for player_id, name, team_id, amount, version in db.session.query(
+                CurrentBid.player_id, Player.name, CurrentBid.team_id, CurrentBid.bid_amount, CurrentBid.version
+            ).join(Player, Player.id == CurrentBid.player_id):
+                self._bids[player_id] = {
+                    'player_id': player_id, 'player': name, 'team_id': team_id, 'amount': amount, 'version': version
+                }
+            self._loaded = True
+    
+    def ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+    
+    def publish(self, kind: str, player_id: int, player: Optional[str], team_id: int, amount: int,
+                team: Optional[Dict] = None, version: Optional[int] = None) -> Dict:
+        """
+        Broadcast one change to every client
+        
+        Args:
+            kind: 'bid' or 'contract'
+            player: Player name, so clients need no lookup
+            team: The team's budget summary after the change
+            version: CurrentBid version, for clients bidding against it
+        
+        Returns:
+            The event as sent
+        """
+        self.ensure_loaded()
+        with self._lock:
+            self.seq += 1
+            event = {
+                'seq': self.seq, 'type': kind, 'player_id': player_id, 'player': player,
+                'team_id': team_id, 'amount': amount, 'team': team, 'version': version,
+            }
+            if kind == 'bid':
+                self._bids[player_id] = {
+                    'player_id': player_id, 'player': player, 'team_id': team_id, 'amount': amount, 'version': version
+                }
+            else:
+                # Under contract: no longer on the auction board
+                self._bids.pop(player_id, None)
+            self._history.append(event)
+            for client in list(self._clients):
+                try:
+                    client.put_nowait(event)
+                except queue.Full:
+                    # Too far behind; the client gets a reset and refetches the snapshot
+                    self._clients.remove(client)
+                    self._reset(client)
+        return event
+    
+    @staticmethod
+    def _reset(client: queue.Queue):
+        while True:
+            try:
+                client.get_nowait()
+            except queue.Empty:
+                break
+        client.put_nowait(None)
+    
+    def snapshot(self) -> Dict:
+        """Sequence number and current high bids for late joiners"""
+        self.ensure_loaded()
+        with self._lock:
+            return {'seq': self.seq, 'bids': sorted(self._bids.values(), key=lambda b: -b['amount'])}
+    
+    def subscribe(self, last_seq: Optional[int] = None) -> queue.Queue:
+        """
+        Register a client queue
+        
+        Args:
+            last_seq: Last event the client saw; missed events are replayed
+                when still buffered, otherwise the client is told to reset
+        """
+        client = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            if last_seq is not None and last_seq != self.seq:
+                missed = [event for event in self._history if event['seq'] > last_seq]
+                # A last_seq ahead of ours means the server restarted
+                if last_seq < self.seq and len(missed) == self.seq - last_seq and len(missed) < self.queue_size:
+                    for event in missed:
+                        client.put_nowait(event)
+                else:
+                    client.put_nowait(None)
+            self._clients.append(client)
+        return client
+    
+    def unsubscribe(self, client: queue.Queue):
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+    
+    def stream(self, last_seq: Optional[int] = None, keepalive: float = 15.0) -> Iterator[str]:
+        """
+        Server-sent event lines for one client
+        
+        A `reset` event means the client missed deltas and should refetch
+        the snapshot; the stream then ends and the browser reconnects.
+        """
+        client = self.subscribe(last_seq)
+        try:
+            yield 'retry: 2000\n\n'
+            while True:
+                try:
+                    event = client.get(timeout=keepalive)
+                except queue.Empty:
+                    yield ': keepalive\n\n'
+                    continue
+                if event is None:
+                    yield 'event: reset\ndata: {}\n\n'
+                    return
+                yield f"id: {event['seq']}\nevent: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+        finally:
+            self.unsubscribe(client)
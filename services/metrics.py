@@ -0,0 +1,163 @@
+"""
+Request and SQL instrumentation with a Prometheus text exposition
+
+Per-route latency histograms, SQL statement counts and time per request
+(from SQLAlchemy cursor events) and a slow-query log. Recording is a
+few counter updates under a lock, cheap enough to leave on; the app only
+installs the hooks when METRICS_ENABLED is set.
+"""
+import bisect
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+from sqlalchemy import event
+
+logger = logging.getLogger('juniorleague.sql')
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 1000)
+
+PREFIX = 'juniorleague'
+
+
+class Histogram:
+    """Cumulative-bucket histogram, as Prometheus expects"""
+    
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def lines(self, name: str, labels: str) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, '+Inf'), self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_sum{{{labels}}} {self.sum:.6f}')
+        lines.append(f'{name}_count{{{labels}}} {self.count}')
+        return lines
+
+
+def _label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics:
+    """Collects per-route request and SQL statistics for one Flask app"""
+    
+    def __init__(self, slow_query_ms: float = 100.0):
+        self.slow_query_seconds = slow_query_ms / 1000
+        self.started = time.time()
+        self._latency: Dict[Tuple[str, str], Histogram] = {}
+        self._statements: Dict[str, Histogram] = {}
+        self._requests: Dict[Tuple[str, str, int], int] = defaultdict(int)
+        self._db_seconds: Dict[str, float] = defaultdict(float)
+        self._db_statements: Dict[str, int] = defaultdict(int)
+        self.slow_queries = 0
+        self._lock = threading.Lock()
+    
+    def install(self, app, engine):
+        """Hook request timing into `app` and statement timing into `engine`"""
+        from flask import g, has_request_context, request
+        
+        @app.before_request
+        def start_timer():
+            g.metrics_started = time.perf_counter()
+            g.sql_statements = 0
+            g.sql_seconds = 0.0
+        
+        @app.after_request
+        def record_request(response):
+            started = g.pop('metrics_started', None)
+            if started is not None:
+                route = request.url_rule.rule if request.url_rule else 'unmatched'
+                self.record_request(
+                    request.method, route, response.status_code, time.perf_counter() - started,
+                    g.pop('sql_statements', 0), g.pop('sql_seconds', 0.0)
+                )
+            return response
+        
+        # The start time rides on the statement's execution context, so a
+        # statement that raises (no after_cursor_execute) leaves nothing behind
+        @event.listens_for(engine, 'before_cursor_execute')
+        def start_statement(conn, cursor, statement, parameters, context, executemany):
+            if context is not None:
+                context._metrics_started = time.perf_counter()
+        
+        @event.listens_for(engine, 'after_cursor_execute')
+        def record_statement(conn, cursor, statement, parameters, context, executemany):
+            started = getattr(context, '_metrics_started', None)
+            if started is None:
+                return
+            elapsed = time.perf_counter() - started
+            if has_request_context() and 'metrics_started' in g:
+                g.sql_statements += 1
+                g.sql_seconds += elapsed
+            if elapsed >= self.slow_query_seconds:
+                with self._lock:
+                    self.slow_queries += 1
+                logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, ' '.join(statement.split())[:500])
+    
+    def record_request(self, method: str, route: str, status: int, seconds: float,
+                       statements: int, db_seconds: float):
+        with self._lock:
+            self._requests[(method, route, status)] += 1
+            latency = self._latency.get((method, route))
+            if latency is None:
+                latency = self._latency[(method, route)] = Histogram(LATENCY_BUCKETS)
+            latency.observe(seconds)
+            counts = self._statements.get(route)
+            if counts is None:
+                counts = self._statements[route] = Histogram(STATEMENT_BUCKETS)
+            counts.observe(statements)
+            self._db_statements[route] += statements
+            self._db_seconds[route] += db_seconds
+    
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        name = f'{PREFIX}_http_requests_total'
+        lines = [f'# HELP {name} Requests by method, route and status', f'# TYPE {name} counter']
+        with self._lock:
+            for (method, route, status), count in sorted(self._requests.items()):
+                lines.append(f'{name}{{method="{method}",route="{_label(route)}",status="{status}"}} {count}')
+            
+            name = f'{PREFIX}_http_request_duration_seconds'
+            lines += [f'# HELP {name} Request latency by route', f'# TYPE {name} histogram']
+            for (method, route), histogram in sorted(self._latency.items()):
+                lines += histogram.lines(name, f'method="{method}",route="{_label(route)}"')
+            
+            name = f'{PREFIX}_db_statements_per_request'
+            lines += [f'# HELP {name} SQL statements issued per request', f'# TYPE {name} histogram']
+            for route, histogram in sorted(self._statements.items()):
+                lines += histogram.lines(name, f'route="{_label(route)}"')
+            
+            name = f'{PREFIX}_db_statements_total'
+            lines += [f'# HELP {name} SQL statements issued by route', f'# TYPE {name} counter']
+            for route, count in sorted(self._db_statements.items()):
+                lines.append(f'{name}{{route="{_label(route)}"}} {count}')
+            
+            name = f'{PREFIX}_db_seconds_total'
+            lines += [f'# HELP {name} Time spent executing SQL by route', f'# TYPE {name} counter']
+            for route, seconds in sorted(self._db_seconds.items()):
+                lines.append(f'{name}{{route="{_label(route)}"}} {seconds:.6f}')
+            
+            name = f'{PREFIX}_db_slow_queries_total'
+            lines += [
+                f'# HELP {name} Statements slower than {self.slow_query_seconds * 1000:g} ms',
+                f'# TYPE {name} counter',
+                f'{name} {self.slow_queries}',
+            ]
+        
+        name = f'{PREFIX}_start_time_seconds'
+        lines += [f'# HELP {name} Process start time', f'# TYPE {name} gauge', f'{name} {self.started:.0f}']
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,206 @@
+"""
+In-process typeahead search over player names
+
+Names are normalized with the importers' `normalize_name` (accents,
+periods and case stripped), split into words and kept in a sorted word
+list, so each keystroke is a few binary searches and set intersections
+instead of a table scan. Word order does not matter, which covers
+"Last, First" input. Queries with no prefix match fall back to trigram
+similarity to catch mid-word fragments and small typos.
+"""
+import bisect
+import threading
+import time
+from collections import Counter
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from calculators.lineup_solver import POSITION_ALIASES, eligible_slots
+from player_index import name_tokens, normalize_name
+
+# Minimum trigram similarity (shared / union) for a fallback match
+TRIGRAM_THRESHOLD = 0.3
+
+MAX_PER_PAGE = 100
+
+
+def trigrams(text: str) -> Set[str]:
+    """Three-letter fragments of a normalized name, padded at word edges"""
+    padded = f"  {' '.join(name_tokens(text))} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerSearch:
+    """
+    Prefix and trigram index of players, keyed by player_id
+    
+    Every query word must be a prefix of some word of the name; results
+    with more fully-typed words rank first, then by name. An empty query
+    lists every player (at the position, if one is given).
+    """
+    
+    def __init__(self, check_interval: float = 30.0):
+        """
+        Args:
+            check_interval: Seconds between checks for players added by
+                other processes (e.g. CLI imports)
+        """
+        self.check_interval = check_interval
+        self._players: Dict[int, Tuple[str, Optional[str], Optional[str]]] = {}
+        self._sort_keys: Dict[int, str] = {}
+        self._tokens: Dict[int, FrozenSet[str]] = {}
+        self._slots: Dict[int, FrozenSet[str]] = {}
+        self._words: List[str] = []  # Sorted, unique
+        self._postings: Dict[str, Set[int]] = {}
+        self._trigrams: Dict[str, Set[int]] = {}
+        self._trigram_counts: Dict[int, int] = {}
+        self._fingerprint = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+    
+    def _current_fingerprint(self):
+        from sqlalchemy import func
+        from models import db, Player
+        return db.session.query(func.count(Player.id), func.max(Player.id)).one()
+    
+    def load(self):
+        """Index every player in one query (needs an app context)"""
+        from models import db, Player
+        
+        with self._lock:
+            self._players, self._sort_keys, self._tokens, self._slots = {}, {}, {}, {}
+            self._words, self._postings, self._trigrams, self._trigram_counts = [], {}, {}, {}
+            for player_id, name, position, mlb_team in db.session.query(
+                Player.id, Player.name, Player.position, Player.mlb_team
+            ):
+                self._add(player_id, name, position, mlb_team)
+            self._fingerprint = self._current_fingerprint()
+            self._checked_at = time.monotonic()
+    
+    def ensure_loaded(self):
+        """Load on first use and reload when the players table has changed elsewhere"""
+        if self._fingerprint is None:
+            self.load()
+        elif time.monotonic() - self._checked_at >= self.check_interval:
+            self._checked_at = time.monotonic()
+            if self._current_fingerprint() != self._fingerprint:
+                self.load()
+    
+    def _add(self, player_id: int, name: str, position: Optional[str], mlb_team: Optional[str]):
+        if player_id in self._players:
+            self._remove(player_id)
+        tokens = frozenset(name_tokens(name))
+        self._players[player_id] = (name, position, mlb_team)
+        self._sort_keys[player_id] = normalize_name(name)
+        self._tokens[player_id] = tokens
+        self._slots[player_id] = frozenset(eligible_slots(position))
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = set()
+                bisect.insort(self._words, token)
+            posting.add(player_id)
+        grams = trigrams(name)
+        self._trigram_counts[player_id] = len(grams)
+        for gram in grams:
+            self._trigrams.setdefault(gram, set()).add(player_id)
+    
+    def _remove(self, player_id: int):
+        name = self._players.pop(player_id)[0]
+        for token in self._tokens.pop(player_id):
+            posting = self._postings[token]
+            posting.discard(player_id)
+            if not posting:
+                del self._postings[token]
+                del self._words[bisect.bisect_left(self._words, token)]
+        for gram in trigrams(name):
+            self._trigrams[gram].discard(player_id)
+        del self._sort_keys[player_id], self._slots[player_id], self._trigram_counts[player_id]
+    
+    def add(self, player_id: int, name: str, position: Optional[str] = None, mlb_team: Optional[str] = None):
+        """Index a new or renamed player"""
+        self.ensure_loaded()
+        with self._lock:
+            self._add(player_id, name, position, mlb_team)
+            self._fingerprint = (len(self._players), max(self._fingerprint[1] or 0, player_id))
+    
+    def get(self, player_id: int) -> Optional[Dict]:
+        """Indexed name/position/team of one player, or None"""
+        self.ensure_loaded()
+        player = self._players.get(player_id)
+        if player is None:
+            return None
+        name, position, mlb_team = player
+        return {'id': player_id, 'name': name, 'position': position, 'team': mlb_team}
+    
+    def _prefix_matches(self, prefix: str) -> Set[int]:
+        matches = set()
+        start = bisect.bisect_left(self._words, prefix)
+        for word in self._words[start:]:
+            if not word.startswith(prefix):
+                break
+            matches |= self._postings[word]
+        return matches
+    
+    def _trigram_matches(self, query: str) -> Dict[int, float]:
+        grams = trigrams(query)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._trigrams.get(gram, ()))
+        similarity = {}
+        for player_id, count in shared.items():
+            score = count / (len(grams) + self._trigram_counts[player_id] - count)
+            if score >= TRIGRAM_THRESHOLD:
+                similarity[player_id] = score
+        return similarity
+    
+    def search(self, query: str, position: Optional[str] = None, page: int = 1, per_page: int = 20) -> Dict:
+        """
+        Players matching a typed name
+        
+        Args:
+            query: Partial name in any word order ("judge", "Judge, Aa")
+            position: Only players who can fill this slot (SS, MIF, OF, P, ...)
+            page: 1-based page number
+            per_page: Results per page, at most MAX_PER_PAGE
+        
+        Returns:
+            Dictionary with the page of results and the total match count
+        """
+        self.ensure_loaded()
+        page = max(page, 1)
+        per_page = min(max(per_page, 1), MAX_PER_PAGE)
+        slot = POSITION_ALIASES.get(position.upper(), position.upper()) if position else None
+        words = name_tokens(query)
+        
+        with self._lock:
+            if words:
+                # Rarest word first keeps the intersection small
+                matches = set.intersection(*sorted((self._prefix_matches(word) for word in words), key=len))
+            else:
+                matches = set(self._players)
+            if slot:
+                matches = {m for m in matches if slot in self._slots[m]}
+            
+            if matches or not words:
+                ranked = sorted(
+                    (-sum(word in self._tokens[m] for word in words), self._sort_keys[m], m) for m in matches
+                )
+            else:
+                ranked = sorted(
+                    (-score, self._sort_keys[m], m) for m, score in self._trigram_matches(query).items()
+                    if not slot or slot in self._slots[m]
+                )
+            
+            start = (page - 1) * per_page
+            results = []
+            for _, _, player_id in ranked[start:start + per_page]:
+                name, player_position, mlb_team = self._players[player_id]
+                results.append({'id': player_id, 'name': name, 'position': player_position, 'team': mlb_team})
+        
+        return {
+            'query': query,
+            'position': position,
+            'page': page,
+            'per_page': per_page,
+            'total': len(ranked),
+            'results': results,
+        }
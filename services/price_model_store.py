@@ -0,0 +1,95 @@
+"""
+Persistent, self-refreshing PriceModel
+
+The model is saved as an .npz artifact alongside a fingerprint of the
+imported data. It is rebuilt only when that fingerprint changes, i.e.
+after imports or other HistoricalAuction writes.
+"""
+import hashlib
+import os
+import threading
+import time
+from typing import Callable, Optional
+from sqlalchemy import func
+from calculators.price_model import PriceModel
+
+
+class PriceModelStore:
+    """Loads, rebuilds and caches the PriceModel for the app"""
+    
+    def __init__(
+        self,
+        path: str,
+        half_life: Optional[float] = None,
+        check_interval: float = 30.0,
+        on_rebuild: Optional[Callable[[], None]] = None
+    ):
+        """
+        Args:
+            path: Location of the .npz artifact
+            half_life: Recency weighting passed to PriceModel.build
+            check_interval: Seconds between fingerprint checks
+            on_rebuild: Called after the model changes, e.g. to clear caches
+        """
+        self.path = path
+        self.half_life = half_life
+        self.check_interval = check_interval
+        self.on_rebuild = on_rebuild
+        self._model: Optional[PriceModel] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+    
+    def fingerprint(self) -> str:
+        """Hash of the import manifest, HistoricalAuction extent and build options"""
+        from models import db, HistoricalAuction, ImportManifest
+        
+        digest = hashlib.sha256()
+        for filename, content_hash in db.session.query(
+            ImportManifest.filename, ImportManifest.content_hash
+        ).order_by(ImportManifest.filename):
+            digest.update(f'{filename}:{content_hash}\n'.encode())
+        count, max_id, total = db.session.query(
+            func.count(HistoricalAuction.id), func.max(HistoricalAuction.id), func.sum(HistoricalAuction.salary)
+        ).one()
+        digest.update(f'{count}:{max_id}:{total}:{self.half_life}'.encode())
+        return digest.hexdigest()
+    
+    def invalidate(self):
+        """Force a fingerprint check on the next `get`"""
+        self._checked_at = 0.0
+    
+    def get(self) -> PriceModel:
+        """Current model (needs an app context when a check is due)"""
+        if self._model is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return self._model
+        
+        with self._lock:
+            fingerprint = self.fingerprint()
+            self._checked_at = time.monotonic()
+            if self._model is not None and self._model.fingerprint == fingerprint:
+                return self._model
+            
+            model = self._load(fingerprint) or self._build(fingerprint)
+            changed = self._model is not None
+            self._model = model
+        if changed and self.on_rebuild:
+            self.on_rebuild()
+        return model
+    
+    def _load(self, fingerprint: str) -> Optional[PriceModel]:
+        if not os.path.exists(self.path):
+            return None
+        try:
+            model = PriceModel.load(self.path)
+        except (OSError, KeyError, ValueError):
+            return None  # Unreadable or older artifact: rebuild
+        return model if model.fingerprint == fingerprint else None
+    
+    def _build(self, fingerprint: str) -> PriceModel:
+        from models import db, HistoricalAuction
+        
+        rows = db.session.query(HistoricalAuction.year, HistoricalAuction.position, HistoricalAuction.salary)
+        model = PriceModel.build(rows, half_life=self.half_life, fingerprint=fingerprint)
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        model.save(self.path)
+        return model
@@ -0,0 +1,166 @@
+"""
+ETag response cache for whole-table GET endpoints
+
+Each table has a version token stored in its own small file, replaced
+atomically whenever a transaction that wrote the table commits, so the
+web app and the CLI importers share one set of versions. Checking a
+version is an os.stat, so an unchanged poll is answered with 304 Not
+Modified (or the cached body) without touching the database or the
+JSON encoder.
+"""
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+from sqlalchemy import event
+
+# Session.info key for tables written in the current transaction
+_PENDING_KEY = 'table_versions_pending'
+
+
+class TableVersions:
+    """Per-table version tokens in `directory`, bumped after commit"""
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._cached: Dict[str, Tuple[Tuple[int, int], str]] = {}  # table -> ((inode, mtime), token)
+        self._lock = threading.Lock()
+    
+    def _path(self, table: str) -> str:
+        return os.path.join(self.directory, f'{table}.version')
+    
+    def version(self, table: str) -> str:
+        """Current token for a table ('0' until its first recorded write)"""
+        path = self._path(table)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return '0'
+        # Every bump replaces the file, so a new inode means a new token
+        key = (stat.st_ino, stat.st_mtime_ns)
+        cached = self._cached.get(table)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        with open(path) as f:
+            token = f.read().strip()
+        self._cached[table] = (key, token)
+        return token
+    
+    def bump(self, tables: Iterable[str]):
+        """Give each table a new token"""
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            for table in tables:
+                path = self._path(table)
+                temp = f'{path}.{os.getpid()}.{threading.get_ident()}'
+                with open(temp, 'w') as f:
+                    f.write(uuid.uuid4().hex)
+                os.replace(temp, path)
+    
+    def watch(self, session):
+        """
+        Bump tables written through `session` (e.g. db.session)
+        
+        Covers ORM flushes and bulk statements, so POST handlers and the
+        importers bump versions without extra calls.
+        """
+        event.listen(session, 'after_flush', self._after_flush)
+        event.listen(session, 'do_orm_execute', self._do_orm_execute)
+        event.listen(session, 'after_commit', self._after_commit)
+        event.listen(session, 'after_rollback', self._after_rollback)
+    
+    def _after_flush(self, session, flush_context):
+        pending = session.info.setdefault(_PENDING_KEY, set())
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            table = getattr(obj, '__tablename__', None)
+            if table:
+                pending.add(table)
+    
+    def _do_orm_execute(self, orm_execute_state):
+        if orm_execute_state.is_select:
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            orm_execute_state.session.info.setdefault(_PENDING_KEY, set()).add(mapper.local_table.name)
+    
+    def _after_commit(self, session):
+        pending = session.info.pop(_PENDING_KEY, None)
+        if pending:
+            self.bump(pending)
+    
+    def _after_rollback(self, session):
+        session.info.pop(_PENDING_KEY, None)
+
+
+class ResponseCache:
+    """Bounded LRU of serialized bodies keyed by endpoint and table versions"""
+    
+    def __init__(self, versions: TableVersions, maxsize: int = 64):
+        self.versions = versions
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+    
+    def etag(self, key: str, tables: Sequence[str]) -> str:
+        return f"{key}-" + '-'.join(self.versions.version(table)[:12] for table in tables)
+    
+    def get(self, etag: str) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(etag)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(etag)
+            self.hits += 1
+            return body
+    
+    def put(self, etag: str, body: bytes):
+        with self._lock:
+            self._entries[etag] = body
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def respond(self, key: str, tables: Sequence[str], build: Callable[[], bytes]):
+        """
+        Conditional GET response for `key` (needs a request context)
+        
+        Args:
+            key: Endpoint name; also distinguishes query variants
+            tables: Tables the body is built from
+            build: Returns the serialized JSON body; only called on a miss
+        
+        Returns:
+            A Flask response: 304 if the client's ETag is current,
+            otherwise the cached or freshly built body
+        """
+        from flask import Response, request
+        
+        etag = self.etag(key, tables)
+        if etag in request.if_none_match:
+            with self._lock:
+                self.not_modified += 1
+            response = Response(status=304)
+        else:
+            body = self.get(etag)
+            if body is None:
+                body = build()
+                self.put(etag, body)
+            response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'  # Always revalidate
+        return response
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'not_modified': self.not_modified,
+            }
@@ -0,0 +1,97 @@
+"""
+Monte Carlo auction study
+
+Simulates thousands of full auctions with prices drawn from the
+historical distributions and reports how a bidding strategy fares.
+
+Usage: python simulate_auction.py [--runs 10000] [--aggression 1.1] [--seed 0] [--workers N]
+       [--nomination value|weighted|random]
+"""
+import argparse
+import time
+from app import app, auction_calc
+from models import db, Player, HistoricalAuction, ProjectedStats
+from calculators.auction_simulator import (
+    AuctionSimulator, PlayerPool, HITTER, PITCHER, ANY, NOMINATION_ORDERS
+)
+from calculators.valuation_calculator import PITCHER_POSITIONS, parse_positions
+from config.league_settings import NUM_TEAMS, ROSTER_SIZE
+
+
+def slot_type(position):
+    """HITTER, PITCHER, or ANY when the position is unknown"""
+    codes = parse_positions(position)
+    if not codes:
+        return ANY
+    return PITCHER if set(codes) <= PITCHER_POSITIONS else HITTER
+
+
+def load_pool(size):
+    """Build the simulation arrays from the database in three queries"""
+    historical = db.session.query(
+        HistoricalAuction.player_id, Player.name, HistoricalAuction.salary
+    ).join(Player, Player.id == HistoricalAuction.player_id).all()
+    projected = db.session.query(
+        ProjectedStats.player_id, Player.name, ProjectedStats.projected_value
+    ).join(Player, Player.id == ProjectedStats.player_id).order_by(ProjectedStats.id).all()
+    positions = dict(db.session.query(Player.id, Player.position))
+    
+    recommendations = {
+        rec['player_id']: rec['recommended_bid']
+        for rec in auction_calc.calculate_bids(historical, projected)
+    }
+    return PlayerPool.build(
+        [(player_id, salary) for player_id, _, salary in historical],
+        recommendations,
+        {player_id: slot_type(position) for player_id, position in positions.items()},
+        size=size,
+    ), positions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate JuniorLeague auctions')
+    parser.add_argument('--runs', type=int, default=10000)
+    parser.add_argument('--aggression', type=float, default=1.0,
+                        help='Strategy bids recommendation x aggression')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--nomination', choices=NOMINATION_ORDERS, default='value')
+    parser.add_argument('--pool-size', type=int, default=int(NUM_TEAMS * ROSTER_SIZE * 1.5))
+    args = parser.parse_args()
+    
+    with app.app_context():
+        pool, positions = load_pool(args.pool_size)
+        names = dict(db.session.query(Player.id, Player.name))
+    
+    if not len(pool):
+        print("No players with recommendations to simulate")
+        return
+    
+    started = time.perf_counter()
+    results = AuctionSimulator().run(
+        pool, runs=args.runs, aggression=args.aggression, seed=args.seed, workers=args.workers,
+        nomination=args.nomination
+    )
+    elapsed = time.perf_counter() - started
+    
+    print(f"\n{'='*80}")
+    print(f"AUCTION SIMULATION: {args.runs} runs, aggression {args.aggression}, "
+          f"{args.nomination} nomination ({elapsed:.1f}s)")
+    print(f"{'='*80}\n")
+    print(f"{'Player':<30} {'Rec $':>6} {'Exp $':>7} {'Sold %':>7} {'Win %':>7}")
+    print("-" * 80)
+    for player in sorted(results['players'], key=lambda p: -p['recommended_bid'])[:40]:
+        expected = player['expected_price']
+        print(f"{names.get(player['player_id'], '?'):<30} {player['recommended_bid']:>6.0f} "
+              f"{expected if expected is not None else 0:>7.1f} "
+              f"{player['sale_probability'] * 100:>6.1f}% {player['win_probability'] * 100:>6.1f}%")
+    
+    money = results['money_left']
+    print(f"\nMoney left (strategy team): 10th/50th/90th percentile "
+          f"${money['strategy_quantiles']['0.1']:.0f} / ${money['strategy_quantiles']['0.5']:.0f} / "
+          f"${money['strategy_quantiles']['0.9']:.0f}")
+    print(f"Mean money left by team: {money['mean_by_team']}")
+
+
+if __name__ == '__main__':
+    main()
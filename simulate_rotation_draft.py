@@ -0,0 +1,81 @@
+"""
+Monte Carlo rotation draft study
+
+Simulates thousands of rotation drafts over the unrostered player pool
+and reports each pick's expected surplus value over its round salary.
+
+Usage: python simulate_rotation_draft.py --standings "Team A,Team B,..." [--drafts 10000] [--seed 0] [--workers N]
+"""
+import argparse
+import time
+from app import app
+from models import db, Contract, CurrentBid, ProjectedStats, Team
+from calculators.rotation_draft import RotationDraftSimulator, pick_order
+from config.league_settings import NUM_TEAMS, ROTATION_DRAFT
+
+
+def load_pool(season, size):
+    """Projected values of players not under contract or won at auction, in one query"""
+    rostered = db.session.query(Contract.player_id).filter(Contract.year == season).union(
+        db.session.query(CurrentBid.player_id)
+    )
+    rows = db.session.query(
+        ProjectedStats.player_id, db.func.max(ProjectedStats.projected_value)
+    ).filter(
+        ProjectedStats.projected_value.isnot(None), ProjectedStats.player_id.notin_(rostered)
+    ).group_by(ProjectedStats.player_id).order_by(db.func.max(ProjectedStats.projected_value).desc())
+    rows = rows.limit(size).all()
+    return [player_id for player_id, _ in rows], [value for _, value in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate JuniorLeague rotation drafts')
+    parser.add_argument('--standings', default=None,
+                        help='Comma-separated team names in last season\'s finishing order, champion first')
+    parser.add_argument('--drafts', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--noise', type=float, default=0.25,
+                        help='Owner disagreement as a fraction of projected value')
+    parser.add_argument('--pool-size', type=int,
+                        default=int(NUM_TEAMS * ROTATION_DRAFT['total_rounds'] * 1.5))
+    args = parser.parse_args()
+    
+    with app.app_context():
+        teams = {name: team_id for team_id, name in db.session.query(Team.id, Team.name)}
+        if args.standings:
+            standings = [teams[name.strip()] for name in args.standings.split(',')]
+        else:
+            standings = sorted(teams.values())
+            print("⚠️  No --standings given; using team id order")
+        player_ids, values = load_pool(app.config['SEASON'], args.pool_size)
+    
+    if not player_ids:
+        print("No unrostered players with projections to draft")
+        return
+    
+    picks = pick_order(standings)
+    names = {team_id: name for name, team_id in teams.items()}
+    
+    started = time.perf_counter()
+    results = RotationDraftSimulator(noise=args.noise).run(
+        picks, player_ids, values, drafts=args.drafts, seed=args.seed, workers=args.workers
+    )
+    elapsed = time.perf_counter() - started
+    
+    print(f"\n{'='*80}")
+    print(f"ROTATION DRAFT SIMULATION: {args.drafts} drafts, {len(player_ids)} players ({elapsed:.1f}s)")
+    print(f"{'='*80}\n")
+    print(f"{'Pick':>5} {'Rd':>3} {'Team':<20} {'Salary':>7} {'Exp $':>7} {'Surplus':>8}")
+    print("-" * 80)
+    for pick in results['picks']:
+        print(f"{pick['overall']:>5} {pick['round']:>3} {names.get(pick['team_id'], '?'):<20} "
+              f"{pick['salary']:>7} {pick['expected_value']:>7.1f} {pick['expected_surplus']:>8.1f}")
+    
+    print(f"\nExpected surplus by team:")
+    for team_id, surplus in sorted(results['team_surplus'].items(), key=lambda item: -item[1]):
+        print(f"  {names.get(team_id, '?'):<20} ${surplus:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
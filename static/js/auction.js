@@ -31,10 +31,49 @@ function searchPlayer() {
     recommendationDiv.style.display = 'block';
 }
 
+// Player typeahead: the page no longer carries every player, so matches
+// come from /api/players/search as the user types
+let searchTimer = null;
+let searchResults = {};
+
+function updatePlayerOptions() {
+    const input = document.getElementById('live-player-search');
+    const options = document.getElementById('live-player-options');
+    const selected = searchResults[input.value];
+    document.getElementById('live-player-select').value = selected ? selected.id : '';
+    
+    clearTimeout(searchTimer);
+    if (selected || !input.value.trim()) {
+        return;
+    }
+    searchTimer = setTimeout(() => {
+        fetch(`/api/players/search?q=${encodeURIComponent(input.value)}&per_page=15`)
+            .then(response => response.json())
+            .then(data => {
+                searchResults = {};
+                options.innerHTML = '';
+                data.results.forEach(player => {
+                    const label = `${player.name} (${player.position || '?'})`;
+                    searchResults[label] = player;
+                    const option = document.createElement('option');
+                    option.value = label;
+                    options.appendChild(option);
+                });
+            });
+    }, 120);
+}
+
+document.getElementById('live-player-search').addEventListener('input', updatePlayerOptions);
+
 function submitLiveBid() {
     const playerId = document.getElementById('live-player-select').value;
     const bidAmount = document.getElementById('live-bid-amount').value;
     
+    if (!playerId) {
+        alert('Please choose a player from the list');
+        return;
+    }
+    
     if (!bidAmount) {
         alert('Please enter a bid amount');
         return;
@@ -47,3 +86,54 @@ function submitLiveBid() {
     alert(`Bid of $${bidAmount} recorded!`);
 }
 
+
+// Live board: snapshot once, then apply server-sent deltas
+const liveBids = {};
+let liveFeed = null;
+
+function renderLiveBoard() {
+    const rows = Object.values(liveBids).sort((a, b) => b.amount - a.amount);
+    const board = document.getElementById('live-board');
+    // Player names come from other clients, so they are set as text only
+    if (!rows.length) {
+        const empty = document.createElement('p');
+        empty.textContent = 'No bids yet';
+        board.replaceChildren(empty);
+        return;
+    }
+    const list = document.createElement('ul');
+    rows.forEach(bid => {
+        const item = document.createElement('li');
+        item.textContent = `${bid.player}: $${bid.amount} (team ${bid.team_id})`;
+        list.appendChild(item);
+    });
+    board.replaceChildren(list);
+}
+
+function connectLiveFeed() {
+    fetch('/api/live_feed/snapshot')
+        .then(response => response.json())
+        .then(snapshot => {
+            Object.keys(liveBids).forEach(playerId => delete liveBids[playerId]);
+            snapshot.bids.forEach(bid => { liveBids[bid.player_id] = bid; });
+            renderLiveBoard();
+            
+            if (liveFeed) {
+                liveFeed.close();
+            }
+            liveFeed = new EventSource(`/api/live_feed?since=${snapshot.seq}`);
+            liveFeed.addEventListener('bid', event => {
+                const bid = JSON.parse(event.data);
+                liveBids[bid.player_id] = bid;
+                renderLiveBoard();
+            });
+            liveFeed.addEventListener('contract', event => {
+                delete liveBids[JSON.parse(event.data).player_id];
+                renderLiveBoard();
+            });
+            // Missed deltas: start over from a fresh snapshot
+            liveFeed.addEventListener('reset', connectLiveFeed);
+        });
+}
+
+connectLiveFeed();
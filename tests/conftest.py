@@ -0,0 +1,45 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Must be set before app is imported: the engine is bound at import time
+os.environ['JUNIORLEAGUE_INSTANCE'] = tempfile.mkdtemp(prefix='juniorleague-tests-')
+
+import db_profile  # noqa: E402
+from app import app as flask_app, auction_state, inflation_tracker, lineups, player_search, live_feed  # noqa: E402
+from models import db, Team, Player  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    """App context on an empty, freshly migrated database"""
+    with flask_app.app_context():
+        db.drop_all()
+        db_profile.migrate(db)
+        yield flask_app
+        db.session.remove()
+
+
+@pytest.fixture
+def league(app):
+    """Two teams and three players; in-memory services reloaded from them"""
+    teams = [Team(name='Aces', owner='A'), Team(name='Bats', owner='B')]
+    players = [
+        Player(name='Aaron Judge', position='OF'),
+        Player(name='Yandy Diaz', position='1B'),
+        Player(name='Gerrit Cole', position='SP'),
+    ]
+    db.session.add_all(teams + players)
+    db.session.commit()
+    for service in (auction_state, inflation_tracker, lineups, player_search, live_feed):
+        service.load()
+    return {'teams': [t.id for t in teams], 'players': [p.id for p in players]}
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from calculators.auction_simulator import AuctionSimulator, PlayerPool, HITTER, PITCHER
+
+
+def make_pool(size=60, seed=1):
+    rng = np.random.default_rng(seed)
+    recommended = np.sort(rng.gamma(1.5, 12, size))[::-1] + 1
+    slot_types = np.where(np.arange(size) % 3 == 0, PITCHER, HITTER)
+    return PlayerPool(np.arange(size), np.log(recommended), np.full(size, 0.35), recommended, slot_types)
+
+
+def simulator():
+    return AuctionSimulator(num_teams=4, budget=100, positions={'OF': 6, 'P': 3})
+
+
+def test_results_do_not_depend_on_worker_count():
+    pool = make_pool()
+    serial = simulator().run(pool, runs=300, seed=3, workers=1)
+    parallel = simulator().run(pool, runs=300, seed=3, workers=2)
+    assert serial['players'] == parallel['players']
+
+
+def test_value_nomination_prices_stars_higher_than_random():
+    pool = make_pool()
+    by_value = simulator().run(pool, runs=300, workers=1, nomination='value')
+    at_random = simulator().run(pool, runs=300, workers=1, nomination='random')
+    top = slice(0, 5)
+    mean_price = lambda results: np.mean([p['expected_price'] for p in results['players'][top]])
+    assert mean_price(by_value) > mean_price(at_random)
+    assert all(p['sale_probability'] == 1.0 for p in by_value['players'][top])
+
+
+def test_spending_stays_within_budget():
+    results = simulator().run(make_pool(), runs=100, workers=1, nomination='weighted')
+    assert min(results['money_left']['mean_by_team']) >= 0
+
+
+def test_unknown_nomination_order():
+    with pytest.raises(ValueError):
+        simulator().run(make_pool(), runs=10, workers=1, nomination='alphabetical')
@@ -0,0 +1,102 @@
+import pytest
+
+from import_manifest import apply_season_diff, file_digest, is_unchanged, record_import
+from models import db, HistoricalAuction
+
+
+def season_rows(year, contract_type=None):
+    query = HistoricalAuction.query.filter_by(year=year)
+    if contract_type:
+        query = query.filter_by(contract_type=contract_type)
+    return sorted(
+        (row.player_id, row.team_id, row.salary, row.position, row.contract_type)
+        for row in query
+    )
+
+
+@pytest.fixture
+def ids(league):
+    (aces, bats), (judge, diaz, cole) = league['teams'], league['players']
+    return aces, bats, judge, diaz, cole
+
+
+def test_first_import_inserts_every_cell(ids):
+    aces, bats, judge, diaz, cole = ids
+    diff = apply_season_diff(2024, [(judge, aces, 40, 'OF'), (cole, bats, 30, 'SP')], 'auction')
+    db.session.commit()
+    assert diff == {'inserted': 2, 'updated': 0, 'removed': 0, 'unchanged': 0}
+    assert season_rows(2024) == sorted([
+        (judge, aces, 40, 'OF', 'auction'), (cole, bats, 30, 'SP', 'auction')
+    ])
+
+
+def test_reimport_writes_only_the_differences(ids):
+    aces, bats, judge, diaz, cole = ids
+    apply_season_diff(2024, [(judge, aces, 40, 'OF'), (cole, bats, 30, 'SP')], 'auction')
+    db.session.commit()
+
+    assert apply_season_diff(2024, [(judge, aces, 40, 'OF'), (cole, bats, 30, 'SP')], 'auction') == {
+        'inserted': 0, 'updated': 0, 'removed': 0, 'unchanged': 2
+    }
+
+    diff = apply_season_diff(2024, [(judge, aces, 45, 'OF'), (diaz, bats, 12, '1B')], 'auction')
+    db.session.commit()
+    assert diff == {'inserted': 1, 'updated': 1, 'removed': 1, 'unchanged': 0}
+    assert season_rows(2024) == sorted([
+        (judge, aces, 45, 'OF', 'auction'), (diaz, bats, 12, '1B', 'auction')
+    ])
+
+
+def test_kept_teams_lose_no_rows(ids):
+    aces, bats, judge, diaz, cole = ids
+    apply_season_diff(2024, [(judge, aces, 40, 'OF'), (cole, bats, 30, 'SP')], 'auction')
+    db.session.commit()
+
+    # Bats' cells could not be resolved this time, so its rows stay
+    diff = apply_season_diff(2024, [(judge, aces, 40, 'OF')], 'auction', keep_team_ids={bats})
+    db.session.commit()
+    assert diff['removed'] == 0
+    assert len(season_rows(2024)) == 2
+
+
+def test_other_contract_types_are_left_alone(ids):
+    aces, bats, judge, diaz, cole = ids
+    apply_season_diff(2024, [(judge, aces, 40, 'OF')], 'auction')
+    apply_season_diff(2024, [(judge, aces, 40, 'OF'), (cole, bats, 30, 'SP')], 'C')
+    db.session.commit()
+
+    assert apply_season_diff(2024, [(judge, aces, 40, 'OF')], 'auction') == {
+        'inserted': 0, 'updated': 0, 'removed': 0, 'unchanged': 1
+    }
+    db.session.commit()
+    assert len(season_rows(2024, 'C')) == 2
+
+
+def test_other_seasons_are_left_alone(ids):
+    aces, bats, judge, diaz, cole = ids
+    apply_season_diff(2023, [(judge, aces, 25, 'OF')], 'auction')
+    apply_season_diff(2024, [(judge, aces, 40, 'OF')], 'auction')
+    db.session.commit()
+    apply_season_diff(2024, [], 'auction')
+    db.session.commit()
+    assert season_rows(2024) == []
+    assert season_rows(2023) == [(judge, aces, 25, 'OF', 'auction')]
+
+
+def test_manifest_skips_only_the_latest_content(app, tmp_path):
+    sheet = tmp_path / 'JuniorLeague2024.csv'
+    sheet.write_text('v1')
+    first = file_digest(str(sheet))
+    assert not is_unchanged(first)
+
+    record_import(str(sheet), first, 2024, 10)
+    db.session.commit()
+    assert is_unchanged(first)
+
+    sheet.write_text('v2')
+    second = file_digest(str(sheet))
+    assert not is_unchanged(second)
+    record_import(str(sheet), second, 2024, 11)
+    db.session.commit()
+    assert is_unchanged(second)
+    assert not is_unchanged(first)
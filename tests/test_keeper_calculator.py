@@ -0,0 +1,52 @@
+import itertools
+import random
+
+from calculators.keeper_calculator import KeeperCalculator, KeeperCandidate
+
+RULES = {'max_active_keepers': 2, 'max_reserve_keepers': 2, 'max_total_keepers': 3}
+
+
+def candidate(player_id, salary, value, reserve=False):
+    return KeeperCandidate(player_id, f"Player {player_id}", salary, value, reserve)
+
+
+def best_by_brute_force(calc, candidates):
+    best = 0.0
+    for size in range(1, len(candidates) + 1):
+        for keepers in itertools.combinations(candidates, size):
+            if calc.validate(list(keepers))['valid']:
+                best = max(best, sum(k.surplus for k in keepers))
+    return round(best, 1)
+
+
+def test_validate_reports_every_broken_rule():
+    calc = KeeperCalculator(RULES, budget=30)
+    keepers = [candidate(i, 10, 20) for i in range(3)] + [candidate(9, 5, 6, reserve=True)]
+    validation = calc.validate(keepers)
+    assert not validation['valid']
+    assert validation['reasons'] == [
+        "Too many active keepers: 3 > 2",
+        "Too many keepers: 4 > 3",
+        "Frozen salaries exceed budget: $35 > $30",
+    ]
+
+
+def test_optimize_skips_players_without_surplus():
+    calc = KeeperCalculator(RULES, budget=50)
+    result = calc.optimize([candidate(1, 10, 10), candidate(2, 20, 15), candidate(3, 5, 12)])
+    assert [k['player_id'] for k in result['keepers']] == [3]
+    assert result['surplus'] == 7.0
+
+
+def test_optimize_matches_brute_force():
+    rng = random.Random(7)
+    for _ in range(25):
+        calc = KeeperCalculator(RULES, budget=rng.randint(10, 40))
+        candidates = [
+            candidate(i, rng.randint(1, 15), rng.randint(0, 25), reserve=rng.random() < 0.4)
+            for i in range(7)
+        ]
+        result = calc.optimize(candidates)
+        chosen = [KeeperCandidate(**k) for k in result['keepers']]
+        assert calc.validate(chosen)['valid']
+        assert result['surplus'] == best_by_brute_force(calc, candidates)
@@ -0,0 +1,38 @@
+from calculators.lineup_solver import LineupSolver, eligible_slots
+
+POSITIONS = {'2B': 1, 'SS': 1, 'MIF': 1, 'DH': 1, 'P': 2}
+
+
+def test_eligible_slots_most_specific_first():
+    assert eligible_slots('2B/SS', POSITIONS) == ('2B', 'SS', 'MIF', 'DH')
+    assert eligible_slots('SP', POSITIONS) == ('P',)
+    assert eligible_slots(None, POSITIONS) == ('DH',)
+
+
+def test_add_moves_players_to_make_room():
+    solver = LineupSolver({'2B': 1, 'SS': 1})
+    assert solver.add(1, '2B/SS') == '2B'
+    # Only 2B fits, so the 2B/SS player shifts to SS
+    assert solver.add(2, '2B') == '2B'
+    assert solver.lineup()['SS'] == [1]
+
+
+def test_unplaceable_player_is_benched_until_a_slot_frees():
+    solver = LineupSolver(POSITIONS)
+    assert solver.add(1, 'SP') == 'P'
+    assert solver.add(2, 'SP') == 'P'
+    assert solver.add(3, 'RP') is None
+    assert solver.summary()['bench'] == [3]
+    assert not solver.can_add('SP')
+
+    solver.remove(1)
+    assert solver.summary()['bench'] == []
+    assert solver.lineup()['P'] == [2, 3]
+
+
+def test_buyable_positions_follow_reachable_slots():
+    solver = LineupSolver(POSITIONS)
+    for player_id, position in enumerate(['2B', 'SS', 'SS', 'DH']):
+        solver.add(player_id, position)
+    assert solver.open_slots() == {'P': 2}
+    assert solver.buyable_positions() == ['P']
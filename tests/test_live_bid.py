@@ -0,0 +1,99 @@
+from models import db, AuctionBid, CurrentBid
+
+
+def bid(client, player_id, team_id, amount, **extra):
+    return client.post('/api/live_bid', json={
+        'player_id': player_id, 'team_id': team_id, 'bid_amount': amount, **extra
+    })
+
+
+def test_accepted_bid_becomes_current(client, league):
+    (aces, _), (judge, _, _) = league['teams'], league['players']
+    response = bid(client, judge, aces, 10)
+    assert response.status_code == 200
+    assert response.json['version'] == 1
+    current = db.session.get(CurrentBid, judge)
+    assert (current.team_id, current.bid_amount) == (aces, 10)
+
+
+def test_rejects_unknown_team(client, league):
+    judge = league['players'][0]
+    response = bid(client, judge, 999, 10)
+    assert response.status_code == 400
+    assert response.json['reasons'] == ["Unknown team: 999"]
+
+
+def test_rejects_bid_below_minimum(client, league):
+    (aces, _), (judge, _, _) = league['teams'], league['players']
+    response = bid(client, judge, aces, 0)
+    assert response.status_code == 400
+    assert "Bid below minimum: $0 < $1" in response.json['reasons']
+
+
+def test_rejects_bid_over_max_bid(client, league):
+    (aces, _), (judge, _, _) = league['teams'], league['players']
+    # $280 budget, 25 open slots: $1 must be kept for each of the other 24
+    response = bid(client, judge, aces, 257)
+    assert response.status_code == 400
+    assert response.json['max_bid'] == 256
+    assert bid(client, judge, aces, 256).status_code == 200
+
+
+def test_held_bid_counts_as_returned_when_raising(client, league):
+    (aces, _), (judge, _, _) = league['teams'], league['players']
+    assert bid(client, judge, aces, 200).status_code == 200
+    assert bid(client, judge, aces, 256).status_code == 200
+
+
+def test_rejects_bid_below_minimum_increment(client, league):
+    (aces, bats), (judge, _, _) = league['teams'], league['players']
+    assert bid(client, judge, aces, 10).status_code == 200
+    response = bid(client, judge, bats, 10)
+    assert response.status_code == 400
+    assert "Bid must be at least $11" in response.json['reasons']
+    assert bid(client, judge, bats, 11).status_code == 200
+
+
+def test_rejects_player_under_contract(app, client, league):
+    (aces, bats), (judge, _, _) = league['teams'], league['players']
+    response = client.post('/api/contracts', json={
+        'player_id': judge, 'team_id': aces, 'salary': 20,
+        'contract_type': 'auction_keeper', 'year': app.config['SEASON'],
+    })
+    assert response.status_code == 200
+    response = bid(client, judge, bats, 25)
+    assert response.status_code == 400
+    assert "Player is already under contract" in response.json['reasons']
+
+
+def test_stale_version_is_rejected_with_current_bid(client, league):
+    (aces, bats), (judge, _, _) = league['teams'], league['players']
+    assert bid(client, judge, aces, 10).status_code == 200
+    assert bid(client, judge, bats, 12, version=1).status_code == 200
+
+    # Aces raise against the version they last saw, which is now stale
+    response = bid(client, judge, aces, 15, version=1)
+    assert response.status_code == 409
+    assert response.json['current'] == {'team_id': bats, 'bid_amount': 12, 'version': 2}
+
+
+def test_outbid_rows_move_to_history(client, league):
+    (aces, bats), (judge, _, _) = league['teams'], league['players']
+    bid(client, judge, aces, 10)
+    bid(client, judge, bats, 12)
+    bid(client, judge, aces, 15)
+    history = [(row.team_id, row.bid_amount) for row in AuctionBid.query.order_by(AuctionBid.id)]
+    assert history == [(aces, 10), (bats, 12)]
+    # Rejected bids are not logged
+    bid(client, judge, bats, 15)
+    assert AuctionBid.query.count() == 2
+
+
+def test_rejected_bid_leaves_budgets_unchanged(client, league):
+    (aces, _), (judge, diaz, _) = league['teams'], league['players']
+    bid(client, judge, aces, 100)
+    bid(client, diaz, aces, 200)  # Over the $157 max left
+    summary = client.get('/api/live_feed/snapshot').json['teams']
+    aces_summary = next(team for team in summary if team['team_id'] == aces)
+    assert aces_summary['committed'] == 100
+    assert aces_summary['max_bid'] == 157
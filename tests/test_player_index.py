@@ -0,0 +1,57 @@
+from player_index import PlayerNameIndex, initial_key, name_tokens, normalize_name
+
+
+def test_normalize_strips_accents_periods_and_case():
+    assert normalize_name('José  Ramírez') == 'jose ramirez'
+    assert normalize_name('J.P. France') == 'j p france'
+    assert normalize_name(None) == ''
+
+
+def test_name_tokens_drop_suffixes():
+    assert name_tokens('Vladimir Guerrero Jr.') == ['vladimir', 'guerrero']
+    assert name_tokens('Cal Ripken III') == ['cal', 'ripken']
+
+
+def test_initial_key_from_comma_and_plain_names():
+    assert initial_key('Diaz, Y') == 'diaz, y'
+    assert initial_key('Yandy Díaz') == 'diaz, y'
+    assert initial_key('Guerrero Jr., Vladimir') == 'guerrero, v'
+    assert initial_key('Ohtani') is None
+
+
+def test_candidates_match_accented_names():
+    index = PlayerNameIndex.from_rows([(1, 'José Ramírez'), (2, 'Aaron Judge')])
+    assert index.candidates('Ramirez') == [1]
+    assert index.candidates('RAMÍREZ') == [1]
+
+
+def test_candidates_ignore_suffix():
+    index = PlayerNameIndex.from_rows([(1, 'Vladimir Guerrero Jr.')])
+    assert index.candidates('Guerrero') == [1]
+    assert index.candidates('Guerrero Jr') == [1]
+
+
+def test_candidates_rank_last_f_initial_first():
+    index = PlayerNameIndex.from_rows([(1, 'Elvis Diaz'), (2, 'Yandy Diaz'), (3, 'Yainer Diaz')])
+    assert index.candidates('Diaz', 'Diaz, Y')[:2] == [2, 3]
+    assert index.candidates('Diaz', 'Diaz, E')[0] == 1
+    # Without a cell to rank by, insertion order is kept
+    assert index.candidates('Diaz') == [1, 2, 3]
+
+
+def test_candidates_multi_word_surname_must_match_every_word():
+    index = PlayerNameIndex.from_rows([(1, 'Elly De La Cruz'), (2, 'Oneil Cruz')])
+    assert index.candidates('De La Cruz') == [1]
+    assert index.candidates('Cruz') == [1, 2]
+
+
+def test_candidates_unknown_or_empty():
+    index = PlayerNameIndex.from_rows([(1, 'Aaron Judge')])
+    assert index.candidates('Soto') == []
+    assert index.candidates('') == []
+
+
+def test_players_added_mid_import_are_found():
+    index = PlayerNameIndex()
+    index.add(7, 'Luis Arráez')
+    assert index.candidates('Arraez', 'Arraez, L') == [7]